@@ -50,6 +50,12 @@ EXCLUDE_MODULES = [
     # "urllib",
 ]
 
+# Modules & widgets are imported on first use, include packages explicitly
+LAZY_IMPORT_PACKAGES = [
+    "tinypedal.module",
+    "tinypedal.widget",
+]
+
 IMAGE_FILES = [
     "images/CC-BY-SA-4.0.txt",
     "images/icon_compass.png",
@@ -88,6 +94,7 @@ BUILD_DATA_FILES = [
 BUILD_OPTIONS = {
     "dist_dir": f"{DIST_FOLDER}/{APP_NAME}",
     "excludes": EXCLUDE_MODULES,
+    "packages": LAZY_IMPORT_PACKAGES,
     "dll_excludes": ["libcrypto-1_1.dll", "libcrypto-3.dll"],
     "optimize": 2,
     # "bundle_files": 2,
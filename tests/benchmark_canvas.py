@@ -0,0 +1,145 @@
+"""
+Benchmark paint canvas frame time
+
+Compare frame time between raster and OpenGL paint canvas, by drawing
+a cached map pixmap and moving vehicle markers, similar to Track Map widget.
+Each frame is painted synchronously with repaint().
+
+Software OpenGL (Mesa llvmpipe on Linux) can be used for testing
+on headless Linux, for example:
+    LIBGL_ALWAYS_SOFTWARE=1 xvfb-run python tests/benchmark_canvas.py --software
+
+Usage: python tests/benchmark_canvas.py [--frames 300] [--size 400] [--vehicles 40] [--software]
+"""
+
+import argparse
+import math
+import sys
+from statistics import fmean, median
+from time import perf_counter
+
+sys.path.append(".")
+
+
+def create_map_pixmap(size: int):
+    """Create map pixmap"""
+    from PySide2.QtCore import QPointF, Qt
+    from PySide2.QtGui import QPainter, QPainterPath, QPen, QPixmap
+
+    pixmap = QPixmap(size, size)
+    pixmap.fill(Qt.transparent)
+    path = QPainterPath()
+    center = size * 0.5
+    for index in range(2000):
+        rad = index / 2000 * math.tau
+        point = QPointF(
+            center + math.cos(rad) * center * 0.8,
+            center + math.sin(rad * 2) * center * 0.4,
+        )
+        if index == 0:
+            path.moveTo(point)
+        else:
+            path.lineTo(point)
+    path.closeSubpath()
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.Antialiasing, True)
+    painter.setPen(QPen(Qt.white, 6))
+    painter.drawPath(path)
+    painter.end()
+    return pixmap
+
+
+class CanvasTest:
+    """Canvas test overlay"""
+
+    def __init__(self, canvas_class, size: int, vehicles: int):
+        from PySide2.QtCore import Qt
+        from PySide2.QtWidgets import QWidget
+
+        self.window = QWidget()
+        self.window.setWindowFlag(Qt.FramelessWindowHint, True)
+        self.window.setAttribute(Qt.WA_TranslucentBackground, True)
+        self.window.resize(size, size)
+        self.canvas = canvas_class(self.window, self.draw_canvas)
+        self.canvas.resize(size, size)
+        self.pixmap_map = create_map_pixmap(size)
+        self.size = size
+        self.vehicles = vehicles
+        self.frame = 0
+
+    def draw_canvas(self, painter):
+        """Draw"""
+        from PySide2.QtCore import QRectF, Qt
+        from PySide2.QtGui import QPainter
+
+        painter.drawPixmap(0, 0, self.pixmap_map)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.setPen(Qt.black)
+        painter.setBrush(Qt.yellow)
+        center = self.size * 0.5
+        for index in range(self.vehicles):
+            rad = (self.frame * 0.01 + index / self.vehicles) * math.tau
+            pos_x = center + math.cos(rad) * center * 0.8
+            pos_y = center + math.sin(rad * 2) * center * 0.4
+            rect = QRectF(pos_x - 8, pos_y - 8, 16, 16)
+            painter.drawEllipse(rect)
+            painter.drawText(rect, Qt.AlignCenter, f"{index + 1}")
+
+    def run(self, frames: int) -> list:
+        """Run & record frame time (milliseconds)"""
+        from PySide2.QtWidgets import QApplication
+
+        self.window.show()
+        QApplication.processEvents()
+        frame_time = []
+        for _ in range(frames):
+            self.frame += 1
+            start = perf_counter()
+            self.canvas.repaint()
+            QApplication.processEvents()
+            frame_time.append((perf_counter() - start) * 1000)
+        self.window.close()
+        return frame_time
+
+
+def main():
+    """Run benchmark"""
+    parser = argparse.ArgumentParser(description="Paint canvas benchmark")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--size", type=int, default=400)
+    parser.add_argument("--vehicles", type=int, default=40)
+    parser.add_argument("--software", action="store_true", help="use software OpenGL")
+    args = parser.parse_args()
+
+    from PySide2.QtCore import QCoreApplication, Qt
+    from PySide2.QtGui import QOpenGLContext
+    from PySide2.QtWidgets import QApplication
+
+    QCoreApplication.setAttribute(Qt.AA_ShareOpenGLContexts, True)
+    if args.software:
+        QCoreApplication.setAttribute(Qt.AA_UseSoftwareOpenGL, True)
+    root = QApplication(sys.argv)
+
+    from tinypedal.widget._painter import OpenGLPaintCanvas, PaintCanvas
+
+    results = []
+    for name, canvas_class in (("Raster", PaintCanvas), ("OpenGL", OpenGLPaintCanvas)):
+        test = CanvasTest(canvas_class, args.size, args.vehicles)
+        frame_time = test.run(args.frames)[10:]  # skip warm up frames
+        results.append((name, frame_time))
+
+    context = QOpenGLContext.globalShareContext()
+    print(f"Platform: {root.platformName()}")
+    if context is not None and context.isValid():
+        print(f"OpenGL: {context.format().majorVersion()}.{context.format().minorVersion()}")
+    print(f"Frames: {args.frames}, size: {args.size}, vehicles: {args.vehicles}")
+    for name, frame_time in results:
+        print(
+            f"{name:<8} mean {fmean(frame_time):.3f}ms, "
+            f"median {median(frame_time):.3f}ms, "
+            f"max {max(frame_time):.3f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
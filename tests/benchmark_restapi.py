@@ -0,0 +1,149 @@
+"""
+Benchmark RestAPI module requests
+
+Run RestAPI task set against mock REST API server (tests/mock_restapi.py),
+and measure request throughput, response time, client CPU time per request,
+and number of connections opened by server side (reconnect behaviour).
+Mock server is run in separate process, so that CPU time is client only.
+
+Repeat tasks are updated at fixed interval without backoff, to measure
+worst case request rate.
+
+Usage: python tests/benchmark_restapi.py [--sim LMU] [--duration 10] [--interval 0.2]
+    [--pool-size 2] [--latency 0] [--chunked] [--failure-rate 0] [--drop-rate 0] [--no-keep-alive]
+"""
+
+import argparse
+import asyncio
+import socket
+import subprocess
+import sys
+from statistics import fmean, median
+from time import perf_counter, process_time
+
+sys.path.append(".")
+
+
+def find_free_port() -> int:
+    """Find free local port"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("localhost", 0))
+        return sock.getsockname()[1]
+
+
+def start_mock_server(args, port: int) -> subprocess.Popen:
+    """Start mock server process"""
+    command = [
+        sys.executable, "tests/mock_restapi.py",
+        "--sim", args.sim,
+        "--port", str(port),
+        "--latency", str(args.latency),
+        "--failure-rate", str(args.failure_rate),
+        "--drop-rate", str(args.drop_rate),
+    ]
+    if args.chunked:
+        command.append("--chunked")
+    if args.no_keep_alive:
+        command.append("--no-keep-alive")
+    server = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    print(server.stdout.readline().strip())  # wait until server started
+    return server
+
+
+async def run_once(pool, uri_path: str, output_set: tuple, response_time: list) -> bool:
+    """Run update once task"""
+    from tinypedal.async_request import set_header_get
+    from tinypedal.module.module_restapi import get_resource, select_keys
+
+    start = perf_counter()
+    resource_output = await get_resource(
+        set_header_get(uri_path, pool.host), pool, select_keys(output_set))
+    response_time.append((perf_counter() - start) * 1000)
+    if isinstance(resource_output, str):
+        return False
+    for res in output_set:
+        res.update(resource_output)
+    return True
+
+
+async def run_repeat(pool, uri_path: str, output_set: tuple, interval: float,
+    duration: float, response_time: list, counter: dict):
+    """Run update repeat task at fixed interval"""
+    from tinypedal.async_request import ResourceValidator
+    from tinypedal.module.module_restapi import output_resource
+
+    validator = ResourceValidator(uri_path, pool.host)
+    end_time = perf_counter() + duration
+    while perf_counter() < end_time:
+        start = perf_counter()
+        modified = await output_resource(validator, pool, output_set)
+        response_time.append((perf_counter() - start) * 1000)
+        counter["modified" if modified else "unmodified"] += 1
+        await asyncio.sleep(interval)
+
+
+async def run_benchmark(args, port: int):
+    """Run benchmark"""
+    from tinypedal.async_request import HttpConnectionPool, get_response, set_header_get
+    from tinypedal.module._task import select_taskset
+
+    pool = HttpConnectionPool("localhost", port, 1, args.pool_size)
+    response_time = []
+    counter = {"modified": 0, "unmodified": 0}
+    taskset = select_taskset(args.sim)
+
+    cpu_start = process_time()
+    time_start = perf_counter()
+    # Update once tasks
+    once_result = [
+        (uri_path, await run_once(pool, uri_path, output_set, response_time))
+        for uri_path, output_set, *_ in taskset
+    ]
+    # Update repeat tasks
+    await asyncio.gather(*(
+        run_repeat(pool, uri_path, output_set, args.interval, args.duration, response_time, counter)
+        for uri_path, output_set, _, is_repeat, _ in taskset if is_repeat
+    ))
+    time_total = perf_counter() - time_start
+    cpu_total = process_time() - cpu_start
+    await pool.close()
+
+    stats = await get_response(set_header_get("/mock/stats"), "localhost", port, 1)
+    total_request = len(response_time)
+    print(f"Sim: {args.sim}, duration: {args.duration}s, interval: {args.interval}s, "
+          f"pool size: {args.pool_size}")
+    for uri_path, available in once_result:
+        print(f"  {'OK' if available else 'MISSING'}: {uri_path}")
+    print(f"Requests: {total_request}, {total_request / time_total:.1f}/s, "
+          f"modified: {counter['modified']}, unmodified: {counter['unmodified']}")
+    print(f"Response time: mean {fmean(response_time):.3f}ms, "
+          f"median {median(response_time):.3f}ms, max {max(response_time):.3f}ms")
+    print(f"CPU time per request: {cpu_total / total_request * 1000:.3f}ms")
+    print(f"Server stats: {stats.decode()}")
+
+
+def main():
+    """Run benchmark with mock server"""
+    parser = argparse.ArgumentParser(description="RestAPI benchmark")
+    parser.add_argument("--sim", default="LMU", choices=("RF2", "LMU"))
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--interval", type=float, default=0.2)
+    parser.add_argument("--pool-size", type=int, default=2)
+    parser.add_argument("--latency", type=float, default=0)
+    parser.add_argument("--chunked", action="store_true")
+    parser.add_argument("--failure-rate", type=float, default=0)
+    parser.add_argument("--drop-rate", type=float, default=0)
+    parser.add_argument("--no-keep-alive", action="store_true")
+    args = parser.parse_args()
+
+    port = find_free_port()
+    server = start_mock_server(args, port)
+    try:
+        asyncio.run(run_benchmark(args, port))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
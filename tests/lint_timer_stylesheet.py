@@ -0,0 +1,87 @@
+"""
+Lint check for runtime style sheet changes
+
+Flag any setStyleSheet call in widget timerEvent, including methods
+called from timerEvent, as re-applying style sheet triggers style sheet
+parsing and relayout on every update. Use Overlay.set_style_palette instead.
+
+Usage: python tests/lint_timer_stylesheet.py [--error]
+"""
+
+import ast
+import os
+import sys
+
+WIDGET_PATH = os.path.join("tinypedal", "widget")
+
+
+def class_methods(node: ast.ClassDef) -> dict:
+    """Get class method nodes"""
+    return {
+        item.name: item for item in node.body
+        if isinstance(item, ast.FunctionDef)
+    }
+
+
+def self_calls(node: ast.AST):
+    """Get names of methods called via self"""
+    for child in ast.walk(node):
+        if (isinstance(child, ast.Call)
+            and isinstance(child.func, ast.Attribute)
+            and isinstance(child.func.value, ast.Name)
+            and child.func.value.id == "self"):
+            yield child.func.attr
+
+
+def stylesheet_calls(node: ast.AST):
+    """Get setStyleSheet call nodes"""
+    for child in ast.walk(node):
+        if (isinstance(child, ast.Call)
+            and isinstance(child.func, ast.Attribute)
+            and child.func.attr == "setStyleSheet"):
+            yield child
+
+
+def lint_file(filepath: str) -> list:
+    """Lint file, returns list of (line number, method name)"""
+    with open(filepath, "r", encoding="utf-8") as file:
+        tree = ast.parse(file.read(), filepath)
+    output = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.ClassDef):
+            continue
+        methods = class_methods(node)
+        if "timerEvent" not in methods:
+            continue
+        # Collect methods reachable from timerEvent
+        checked = set()
+        pending = ["timerEvent"]
+        while pending:
+            name = pending.pop()
+            if name in checked or name not in methods:
+                continue
+            checked.add(name)
+            pending.extend(self_calls(methods[name]))
+        for name in sorted(checked):
+            for call in stylesheet_calls(methods[name]):
+                output.append((call.lineno, name))
+    return sorted(output)
+
+
+def main():
+    """Lint all widget files"""
+    total = 0
+    for filename in sorted(os.listdir(WIDGET_PATH)):
+        if not filename.endswith(".py"):
+            continue
+        filepath = os.path.join(WIDGET_PATH, filename)
+        for lineno, name in lint_file(filepath):
+            print(f"{filepath}:{lineno}: setStyleSheet in timerEvent ({name})")
+            total += 1
+    print(f"Found {total} setStyleSheet call(s) in timerEvent")
+    if total and "--error" in sys.argv:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
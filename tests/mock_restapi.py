@@ -0,0 +1,191 @@
+"""
+Mock REST API server
+
+Replay recorded JSON fixtures of game REST API (rF2, LMU) for testing
+RestAPI module without running game.
+
+Fixtures are located in tests/restapi_fixtures/<sim>/ folder, file name is
+uri path with "/" replaced by "_", for example:
+    /rest/sessions/weather -> rest_sessions_weather.json
+
+A ".json" fixture is served as static data. A ".jsonl" fixture (one JSON per line)
+is replayed in sequence, next line is served on each request, to simulate live data.
+
+Responses contain ETag header, and respond 304 if request If-None-Match is matched.
+Server statistics can be retrieved from /mock/stats.
+
+Usage: python tests/mock_restapi.py [--sim LMU] [--port 6397] [--latency 0]
+    [--chunked] [--failure-rate 0] [--drop-rate 0] [--no-keep-alive]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+from zlib import crc32
+
+FIXTURE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "restapi_fixtures")
+DEFAULT_PORT = {"RF2": 5397, "LMU": 6397}
+
+
+def uri_to_filename(uri: str) -> str:
+    """Convert uri path to fixture file name (without extension)"""
+    return uri.strip("/").replace("/", "_")
+
+
+def load_fixtures(sim_name: str) -> dict:
+    """Load fixtures, key - fixture name, value - list of response data (bytes)"""
+    fixture_path = os.path.join(FIXTURE_PATH, sim_name.lower())
+    fixtures = {}
+    for filename in sorted(os.listdir(fixture_path)):
+        name, ext = os.path.splitext(filename)
+        with open(os.path.join(fixture_path, filename), "r", encoding="utf-8") as file:
+            if ext == ".json":
+                frames = [json.dumps(json.load(file)).encode()]
+            elif ext == ".jsonl":
+                frames = [line.strip().encode() for line in file if line.strip()]
+            else:
+                continue
+        fixtures[name] = frames
+    return fixtures
+
+
+class MockRestServer:
+    """Mock REST API server
+
+    Args:
+        fixtures: fixtures from load_fixtures().
+        latency: response delay (seconds).
+        chunked: send response with chunked transfer encoding.
+        failure_rate: chance (0 - 1) to respond with status 500.
+        drop_rate: chance (0 - 1) to close connection without response.
+        keep_alive: keep connection alive after response.
+    """
+
+    def __init__(self, fixtures: dict, latency: float = 0, chunked: bool = False,
+        failure_rate: float = 0, drop_rate: float = 0, keep_alive: bool = True):
+        self.fixtures = fixtures
+        self.latency = latency
+        self.chunked = chunked
+        self.failure_rate = failure_rate
+        self.drop_rate = drop_rate
+        self.keep_alive = keep_alive
+        self.frame_index = dict.fromkeys(fixtures, 0)
+        self.stats = {
+            "connections": 0,
+            "requests": 0,
+            "not_modified": 0,
+            "not_found": 0,
+            "failures": 0,
+            "drops": 0,
+            "bytes_sent": 0,
+        }
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Handle connection"""
+        self.stats["connections"] += 1
+        try:
+            while True:
+                header = await reader.readuntil(b"\r\n\r\n")
+                self.stats["requests"] += 1
+                if self.latency > 0:
+                    await asyncio.sleep(self.latency)
+                if random.random() < self.drop_rate:
+                    self.stats["drops"] += 1
+                    break
+                response = self.respond(header)
+                writer.write(response)
+                await writer.drain()
+                self.stats["bytes_sent"] += len(response)
+                if not self.keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    def respond(self, header: bytes) -> bytes:
+        """Create response"""
+        request_line = header.split(b"\r\n", 1)[0].decode()
+        uri = request_line.split(" ")[1] if request_line.count(" ") >= 2 else "/"
+        if uri == "/mock/stats":
+            return self.create_response(200, json.dumps(self.stats).encode())
+        if random.random() < self.failure_rate:
+            self.stats["failures"] += 1
+            return self.create_response(500, b"")
+        key = uri_to_filename(uri)
+        frames = self.fixtures.get(key)
+        if frames is None:
+            self.stats["not_found"] += 1
+            return self.create_response(404, b"")
+        index = self.frame_index[key]
+        self.frame_index[key] = (index + 1) % len(frames)
+        body = frames[index]
+        etag = f'"{crc32(body):08x}"'
+        if f"If-None-Match: {etag}".encode() in header:
+            self.stats["not_modified"] += 1
+            return self.create_response(304, b"", etag)
+        return self.create_response(200, body, etag)
+
+    def create_response(self, status: int, body: bytes, etag: str = "") -> bytes:
+        """Create response header & body"""
+        reason = {200: "OK", 304: "Not Modified", 404: "Not Found"}.get(status, "Internal Server Error")
+        lines = [f"HTTP/1.1 {status} {reason}", "Content-Type: application/json"]
+        if etag:
+            lines.append(f"ETag: {etag}")
+        if not self.keep_alive:
+            lines.append("Connection: close")
+        if status == 304:
+            return ("\r\n".join(lines) + "\r\n\r\n").encode()
+        if not self.chunked:
+            lines.append(f"Content-Length: {len(body)}")
+            return ("\r\n".join(lines) + "\r\n\r\n").encode() + body
+        lines.append("Transfer-Encoding: chunked")
+        chunks = bytearray(("\r\n".join(lines) + "\r\n\r\n").encode())
+        for pos in range(0, len(body), 4096):
+            chunk = body[pos:pos + 4096]
+            chunks.extend(f"{len(chunk):x}\r\n".encode() + chunk + b"\r\n")
+        chunks.extend(b"0\r\n\r\n")
+        return bytes(chunks)
+
+
+def parse_args(args=None):
+    """Parse arguments"""
+    parser = argparse.ArgumentParser(description="Mock REST API server")
+    parser.add_argument("--sim", default="LMU", choices=("RF2", "LMU"))
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=0, help="default to game port")
+    parser.add_argument("--latency", type=float, default=0, help="response delay in seconds")
+    parser.add_argument("--chunked", action="store_true", help="use chunked transfer encoding")
+    parser.add_argument("--failure-rate", type=float, default=0, help="chance to respond 500")
+    parser.add_argument("--drop-rate", type=float, default=0, help="chance to drop connection")
+    parser.add_argument("--no-keep-alive", action="store_true", help="close connection after response")
+    return parser.parse_args(args)
+
+
+async def run_server(args):
+    """Run server until interrupted"""
+    mock = MockRestServer(
+        load_fixtures(args.sim),
+        latency=args.latency,
+        chunked=args.chunked,
+        failure_rate=args.failure_rate,
+        drop_rate=args.drop_rate,
+        keep_alive=not args.no_keep_alive,
+    )
+    port = args.port or DEFAULT_PORT[args.sim]
+    server = await asyncio.start_server(mock.handle, args.host, port)
+    print(f"Mock {args.sim} REST API server: {args.host}:{port}", flush=True)
+    for name in mock.fixtures:
+        print(f"  {name}", flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(run_server(parse_args()))
+    except KeyboardInterrupt:
+        sys.exit(0)
@@ -0,0 +1,59 @@
+"""
+Test overlay compositor
+
+Attach an overlay widget to compositor, show & hide the widget,
+and check whether compositor window visibility follows.
+Can be run on headless system with offscreen platform, for example:
+    QT_QPA_PLATFORM=offscreen python tests/test_compositor.py
+
+Usage: python tests/test_compositor.py
+"""
+
+import sys
+
+sys.path.append(".")
+
+
+def process_events(root):
+    """Process events, including zero-timer mask update"""
+    for _ in range(3):
+        root.processEvents()
+
+
+def main():
+    """Run test"""
+    from PySide2.QtWidgets import QApplication, QWidget
+
+    root = QApplication(sys.argv)
+
+    from tinypedal.setting import cfg
+    from tinypedal.widget._compositor import compositor
+
+    # Use default settings without loading user preset
+    cfg.overlay = cfg.default.setting["overlay"]
+    cfg.compatibility = cfg.default.config["compatibility"]
+
+    overlay = QWidget()
+    overlay.resize(100, 50)
+    compositor.attach(overlay, 50, 50)
+    overlay.setHidden(True)  # same as overlay widget after attaching
+    host = overlay.parentWidget()
+    process_events(root)
+    assert not host.isVisible(), "host should be hidden while no overlay visible"
+
+    overlay.setHidden(False)
+    process_events(root)
+    assert host.isVisible(), "host should be visible after showing overlay"
+    assert overlay.isVisible(), "overlay should be visible"
+    assert host.mask().boundingRect() == overlay.geometry(), "mask should cover overlay"
+
+    overlay.setHidden(True)
+    process_events(root)
+    assert not host.isVisible(), "host should be hidden after hiding overlay"
+
+    compositor.clear()
+    print("Compositor test passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -22,28 +22,65 @@ Asynchronous request
 
 from __future__ import annotations
 
-from asyncio import StreamReader, open_connection, wait_for
+import re
+from asyncio import Condition, IncompleteReadError, StreamReader, StreamWriter, open_connection, wait_for
 from contextlib import asynccontextmanager
+from json import loads
 from time import perf_counter
-from typing import Awaitable
+from typing import Any, Awaitable, Callable
+from zlib import crc32
 
 # Default limit from asyncio.open_connection is 2 ** 16
 # Lower limit to avoid getting incomplete data
 BUFFER_LIMIT = 32768  # 2 ** 15
 
+# JSON scanning
+RE_JSON_STRING = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"')
+RE_JSON_STRING_CHARS = re.compile(rb'[^"\\]*')
+RE_JSON_SKIP = re.compile(rb'[^"{}\[\]]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"{}\[\]]*)*')
+RE_JSON_SCALAR = re.compile(rb"[^,}\]\s]*")
+RE_WHITESPACE = re.compile(rb"\s*")
 
-def set_header_get(uri: str = "/", host: str = "localhost") -> bytes:
-    """Set GET request header"""
+
+def set_header_get(uri: str = "/", host: str = "localhost", extra_header: str = "") -> bytes:
+    """Set GET request header
+
+    Args:
+        uri: request uri path.
+        host: host name.
+        extra_header: extra header lines, each line ends with CRLF.
+    """
     # \r\nAccept: application/json
-    return f"GET {uri} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode()
+    return f"GET {uri} HTTP/1.1\r\nHost: {host}\r\n{extra_header}\r\n".encode()
 
 
-async def parse_response(reader: StreamReader) -> bytes:
-    """Parse response"""
-    # Get headers
-    header_bytes = await reader.readuntil(b"\r\n\r\n")
-    if b"200" not in header_bytes:  # check http status code
+def get_status_code(header_bytes: bytes) -> int:
+    """Get http status code from response header, 0 if invalid"""
+    try:
+        return int(header_bytes[9:12])  # HTTP/1.1 200 OK
+    except ValueError:
+        return 0
+
+
+def get_header_value(header_bytes: bytes, name: bytes) -> bytes:
+    """Get header field value (case-insensitive name) from response header"""
+    pos_beg = header_bytes.lower().find(b"\r\n" + name.lower() + b":")
+    if pos_beg < 0:
         return b""
+    pos_beg += len(name) + 3
+    pos_end = header_bytes.find(b"\r\n", pos_beg)
+    return header_bytes[pos_beg:pos_end].strip()
+
+
+async def stream_body(
+    reader: StreamReader, header_bytes: bytes, callback: Callable[[bytes], Any]) -> bool:
+    """Stream response body to callback piece by piece
+
+    Stop reading if callback returns True.
+
+    Returns:
+        True if full body has been read, connection can be reused.
+    """
     # Get non-chunked data
     if b"chunked" not in header_bytes:
         # Get body length
@@ -56,23 +93,39 @@ async def parse_response(reader: StreamReader) -> bytes:
                 body_length = int(header_bytes[pos_beg:pos_end])
             except (AttributeError, TypeError, IndexError, ValueError):
                 body_length = 0
-        if body_length <= 0:
-            return b""
-        if body_length <= BUFFER_LIMIT:
-            return await reader.read(body_length)
-        # Exceeded buffer limit
-        temp_bytes = bytearray()
         while body_length > 0:
-            temp_bytes.extend(await reader.read(BUFFER_LIMIT))
-            body_length -= BUFFER_LIMIT
-        return bytes(temp_bytes)
+            piece_bytes = await reader.readexactly(min(body_length, BUFFER_LIMIT))
+            body_length -= len(piece_bytes)
+            if callback(piece_bytes) and body_length > 0:
+                return False
+        return True
     # Get chunked data
+    while True:
+        chunk_size = int((await reader.readuntil(b"\r\n")).split(b";")[0], 16)
+        if chunk_size <= 0:  # end chunk
+            await reader.readuntil(b"\r\n")
+            return True
+        chunk_bytes = await reader.readexactly(chunk_size + 2)  # with CRLF
+        if callback(chunk_bytes[:-2]):
+            return False
+
+
+async def read_body(reader: StreamReader, header_bytes: bytes) -> bytes:
+    """Read full response body, so that connection can be reused"""
     temp_bytes = bytearray()
-    while (await reader.readuntil()) != b"0\r\n":  # end chunk
-        temp_bytes[-2:] = await reader.readuntil()  # cut off CRLF
+    await stream_body(reader, header_bytes, temp_bytes.extend)
     return bytes(temp_bytes)
 
 
+async def parse_response(reader: StreamReader) -> bytes:
+    """Parse response"""
+    # Get headers
+    header_bytes = await reader.readuntil(b"\r\n\r\n")
+    if b"200" not in header_bytes:  # check http status code
+        return b""
+    return await read_body(reader, header_bytes)
+
+
 @asynccontextmanager
 async def http_get(request: bytes, host: str, port: int, time_out: float):
     """Async request - HTTP get response"""
@@ -99,6 +152,407 @@ async def get_response(request: bytes, host: str, port: int, time_out: float) ->
         return b""
 
 
+class HttpConnectionPool:
+    """HTTP keep-alive connection pool
+
+    Reuse persistent (HTTP/1.1 keep-alive) connections to a single host & port.
+    Requests are queued over limited number of connections,
+    and failed connection is closed & reconnected on next request.
+
+    Args:
+        host: host name.
+        port: port number.
+        time_out: connection & response timeout (seconds).
+        max_connection: max number of connections.
+    """
+
+    __slots__ = (
+        "host",
+        "port",
+        "time_out",
+        "max_connection",
+        "_idle",
+        "_total",
+        "_condition",
+    )
+
+    def __init__(self, host: str, port: int, time_out: float, max_connection: int = 2):
+        self.host = host
+        self.port = port
+        self.time_out = time_out
+        self.max_connection = max(max_connection, 1)
+        self._idle: list[tuple[StreamReader, StreamWriter]] = []
+        self._total = 0
+        self._condition = Condition()
+
+    async def get(self, request: bytes, callback: Callable[[bytes], Any] | None = None) -> bytes:
+        """Send request & get response data (bytes), raise error if failed
+
+        Args:
+            request: request header.
+            callback: optional callback to receive response body piece by piece,
+                see stream_body(). Returns empty bytes if callback is set.
+        """
+        return (await self.request(request, callback))[1]
+
+    async def request(self, request: bytes,
+        callback: Callable[[bytes], Any] | None = None) -> tuple[bytes, bytes]:
+        """Send request & get response header & data (bytes), raise error if failed
+
+        Response data is empty if status code is not 200.
+        """
+        reader, writer, reused = await self._acquire()
+        try:
+            try:
+                header_bytes = await self._send(reader, writer, request)
+            except (ConnectionError, IncompleteReadError):
+                if not reused:
+                    raise
+                # Idle connection may be closed by server, retry once with new connection
+                await self._release(writer, False)
+                writer = None
+                reader, writer, _ = await self._acquire(False)
+                header_bytes = await self._send(reader, writer, request)
+            raw_bytes, keep_alive = await self._receive(reader, header_bytes, callback)
+        except BaseException:
+            if writer is not None:
+                await self._release(writer, False)
+            raise
+        if keep_alive:
+            await self._release((reader, writer), True)
+        else:
+            await self._release(writer, False)
+        return header_bytes, raw_bytes
+
+    async def close(self):
+        """Close all idle connections"""
+        async with self._condition:
+            while self._idle:
+                await close_writer(self._idle.pop()[1])
+                self._total -= 1
+            self._condition.notify_all()
+
+    async def _send(self, reader: StreamReader, writer: StreamWriter, request: bytes) -> bytes:
+        """Send request & read response header"""
+        writer.write(request)
+        await writer.drain()
+        return await wait_for(reader.readuntil(b"\r\n\r\n"), self.time_out)
+
+    async def _receive(self, reader: StreamReader, header_bytes: bytes,
+        callback: Callable[[bytes], Any] | None) -> tuple[bytes, bool]:
+        """Read response body, return response & keep-alive state"""
+        keep_alive = b"Connection: close" not in header_bytes
+        if get_status_code(header_bytes) != 200:
+            await wait_for(read_body(reader, header_bytes), self.time_out)
+            return b"", keep_alive
+        if callback is None:
+            return await wait_for(read_body(reader, header_bytes), self.time_out), keep_alive
+        completed = await wait_for(stream_body(reader, header_bytes, callback), self.time_out)
+        return b"", keep_alive and completed
+
+    async def _acquire(self, reuse: bool = True) -> tuple[StreamReader, StreamWriter, bool]:
+        """Acquire idle connection, or open new connection if below limit"""
+        async with self._condition:
+            while True:
+                while reuse and self._idle:
+                    reader, writer = self._idle.pop()
+                    if not writer.is_closing() and not reader.at_eof():
+                        return reader, writer, True
+                    await close_writer(writer)
+                    self._total -= 1
+                if self._total < self.max_connection:
+                    self._total += 1
+                    break
+                await self._condition.wait()
+        try:
+            reader, writer = await wait_for(
+                open_connection(self.host, self.port, limit=BUFFER_LIMIT), self.time_out)
+        except BaseException:
+            async with self._condition:
+                self._total -= 1
+                self._condition.notify()
+            raise
+        return reader, writer, False
+
+    async def _release(self, connection, reuse: bool):
+        """Release connection back to pool, or close connection"""
+        if not reuse:
+            await close_writer(connection)
+        async with self._condition:
+            if reuse:
+                self._idle.append(connection)
+            else:
+                self._total -= 1
+            self._condition.notify()
+
+
+class ResourceValidator:
+    """Resource validator
+
+    Check whether resource is modified since last response.
+    Conditional request (ETag, Last-Modified) is used if provided by server,
+    which server responds with status 304 (no data) if not modified.
+    Otherwise compare response data length & CRC32 checksum.
+
+    Args:
+        uri: request uri path.
+        host: host name.
+    """
+
+    __slots__ = (
+        "uri",
+        "host",
+        "request",
+        "_etag",
+        "_last_modified",
+        "_length",
+        "_checksum",
+    )
+
+    def __init__(self, uri: str, host: str):
+        self.uri = uri
+        self.host = host
+        self.request = set_header_get(uri, host)
+        self._etag = b""
+        self._last_modified = b""
+        self._length = -1
+        self._checksum = -1
+
+    def reset(self):
+        """Reset validator, next response is always modified"""
+        self.request = set_header_get(self.uri, self.host)
+        self._etag = b""
+        self._last_modified = b""
+        self._length = -1
+        self._checksum = -1
+
+    def modified(self, header_bytes: bytes, raw_bytes: bytes) -> bool:
+        """Check whether response is modified, and update validator"""
+        if get_status_code(header_bytes) != 200:  # 304 not modified, or error
+            return False
+        # Update conditional request
+        etag = get_header_value(header_bytes, b"ETag")
+        last_modified = get_header_value(header_bytes, b"Last-Modified")
+        if self._etag != etag or self._last_modified != last_modified:
+            self._etag = etag
+            self._last_modified = last_modified
+            extra_header = ""
+            if etag:
+                extra_header += f"If-None-Match: {etag.decode()}\r\n"
+            if last_modified:
+                extra_header += f"If-Modified-Since: {last_modified.decode()}\r\n"
+            self.request = set_header_get(self.uri, self.host, extra_header)
+        # Compare length & checksum
+        length = len(raw_bytes)
+        checksum = crc32(raw_bytes)
+        if self._length == length and self._checksum == checksum:
+            return False
+        self._length = length
+        self._checksum = checksum
+        return True
+
+
+def skip_whitespace(buffer: bytearray, pos: int) -> int:
+    """Skip whitespace, return next position"""
+    return RE_WHITESPACE.match(buffer, pos).end()
+
+
+class JsonKeyScanner:
+    """Incremental JSON key scanner
+
+    Scan top level JSON object piece by piece, decode only values of selected keys,
+    and skip other values without decoding. Scanning stops once all selected keys
+    are found, or end of object is reached.
+
+    Scanning state of incomplete value (position, depth, in string) is kept between
+    pieces, so that each byte is scanned only once, and data of skipped value
+    is discarded as soon as scanned.
+
+    Args:
+        keys: selected top level keys.
+    """
+
+    __slots__ = (
+        "keys",
+        "result",
+        "done",
+        "_buffer",
+        "_pos",
+        "_started",
+        "_expect_next",
+        "_key",
+        "_value_beg",
+        "_value_pos",
+        "_depth",
+        "_in_string",
+        "_is_scalar",
+    )
+
+    def __init__(self, keys: frozenset[str]):
+        self.keys = keys
+        self.result: dict[str, Any] | None = None
+        self.done = False
+        self._buffer = bytearray()
+        self._pos = 0
+        self._started = False
+        self._expect_next = False  # expect "," or "}" after value
+        # Value scanning state
+        self._key = ""
+        self._value_beg = 0
+        self._value_pos = -1  # -1 if not scanning value
+        self._depth = 0
+        self._in_string = False
+        self._is_scalar = False
+
+    def feed(self, data: bytes) -> bool:
+        """Feed data, return True if scanning is done, raise ValueError if invalid"""
+        if self.done:
+            return True
+        buffer = self._buffer
+        buffer.extend(data)
+        pos = self._pos
+        if not self._started:
+            pos = skip_whitespace(buffer, pos)
+            if pos >= len(buffer):
+                self._pos = pos
+                return False
+            if buffer[pos] != 0x7B:  # "{"
+                raise ValueError("not a JSON object")
+            self._started = True
+            self.result = {}
+            pos += 1
+        result = self.result
+        while True:
+            # Continue scanning value
+            if self._value_pos >= 0:
+                value_end = self.__scan_value(buffer)
+                if value_end < 0:
+                    break  # incomplete value
+                if self._key in self.keys:
+                    result[self._key] = loads(buffer[self._value_beg:value_end])
+                    if len(result) >= len(self.keys):
+                        self.done = True
+                        return True
+                self._value_pos = -1
+                self._expect_next = True
+                pos = value_end
+            pos = skip_whitespace(buffer, pos)
+            if pos >= len(buffer):
+                break
+            # Value separator, or end of object
+            if self._expect_next:
+                if buffer[pos] == 0x2C:  # ","
+                    self._expect_next = False
+                    pos += 1
+                    continue
+                if buffer[pos] != 0x7D:  # "}"
+                    raise ValueError("invalid JSON object")
+            if buffer[pos] == 0x7D:  # "}"
+                self._pos = pos + 1
+                self.done = True
+                return True
+            # Scan key & start of value: "key": value
+            key_match = RE_JSON_STRING.match(buffer, pos)
+            if key_match is None:
+                if buffer[pos] != 0x22:  # '"'
+                    raise ValueError("invalid JSON object key")
+                break  # incomplete key
+            value_beg = skip_whitespace(buffer, key_match.end())
+            if value_beg >= len(buffer):
+                break
+            if buffer[value_beg] != 0x3A:  # ":"
+                raise ValueError("invalid JSON object")
+            value_beg = skip_whitespace(buffer, value_beg + 1)
+            if value_beg >= len(buffer):
+                break
+            key_bytes = buffer[pos + 1:key_match.end() - 1]
+            self._key = loads(b'"%s"' % key_bytes) if 0x5C in key_bytes else key_bytes.decode()
+            self.__start_value(buffer[value_beg], value_beg)
+            pos = value_beg
+        # Remove scanned data, keep data of selected value
+        if self._value_pos >= 0:
+            if self._key in self.keys:
+                pos = self._value_beg
+            else:
+                pos = self._value_pos
+            self._value_beg -= pos
+            self._value_pos -= pos
+        del buffer[:pos]
+        self._pos = 0
+        return False
+
+    def __start_value(self, first_char: int, value_beg: int):
+        """Start scanning value"""
+        self._value_beg = value_beg
+        self._value_pos = value_beg + 1
+        self._depth = 0
+        self._in_string = False
+        self._is_scalar = False
+        if first_char == 0x22:  # string
+            self._in_string = True
+        elif first_char in (0x5B, 0x7B):  # array or object
+            self._depth = 1
+        elif first_char in (0x2C, 0x5D, 0x7D):  # ",", "]", "}"
+            raise ValueError("invalid JSON value")
+        else:  # number, true, false, null
+            self._is_scalar = True
+
+    def __scan_value(self, buffer: bytearray) -> int:
+        """Scan value from last position, return end position, or -1 if incomplete"""
+        pos = self._value_pos
+        size = len(buffer)
+        if self._is_scalar:
+            pos = RE_JSON_SCALAR.match(buffer, pos).end()
+            self._value_pos = pos
+            return -1 if pos >= size else pos
+        depth = self._depth
+        in_string = self._in_string
+        skip_match = RE_JSON_SKIP.match
+        string_chars_match = RE_JSON_STRING_CHARS.match
+        while True:
+            if in_string:
+                pos = string_chars_match(buffer, pos).end()
+                if pos >= size:
+                    break
+                if buffer[pos] == 0x5C:  # escape, skip next char
+                    if pos + 1 >= size:
+                        break
+                    pos += 2
+                    continue
+                pos += 1  # end of string
+                in_string = False
+                if depth <= 0:
+                    return pos
+                continue
+            # Skip non-bracket chars & complete strings
+            pos = skip_match(buffer, pos).end()
+            if pos >= size:
+                break
+            token = buffer[pos]
+            pos += 1
+            if token == 0x22:  # '"', incomplete string
+                in_string = True
+            elif token in (0x5B, 0x7B):  # "[", "{"
+                depth += 1
+            else:
+                depth -= 1
+                if depth <= 0:
+                    return pos
+        self._value_pos = pos
+        self._depth = depth
+        self._in_string = in_string
+        return -1
+
+
+async def close_writer(writer: StreamWriter):
+    """Close stream writer"""
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except (ConnectionError, OSError):
+        pass
+
+
 async def _print_result(test_func: Awaitable):
     """Test result"""
     start = perf_counter()
@@ -504,15 +504,22 @@ def rotate_map(coords: Sequence[CoordXY], angle: int):
         yield rotate_coordinate(rot_rad, x, y)
 
 
-def scale_map(coords: Sequence[CoordXY], area_size: int, margin: int = 0, angle: int = 0):
-    """Scale map data"""
+def scale_map(
+    coords: Sequence[CoordXY], area_size: int, margin: int = 0, angle: int = 0,
+    map_range: tuple[float, float, float, float] | None = None):
+    """Scale map data
+
+    map_range: optional precalculated (min x, max x, min y, max y) range, ignored if rotated.
+    """
     # Rotate & separate X & Y coordinates
     if angle != 0:
         x_range, y_range = tuple(zip(*rotate_map(coords, angle)))
+        map_range = None
     else:
         x_range, y_range = tuple(zip(*coords))
     # Map size: x=width, y=height
-    map_range = min(x_range), max(x_range), min(y_range), max(y_range)
+    if map_range is None:
+        map_range = min(x_range), max(x_range), min(y_range), max(y_range)
     map_size = map_range[1] - map_range[0], map_range[3] - map_range[2]
     # Display area / map_size
     map_scale = (area_size - margin * 2) / max(map_size[0], map_size[1])
@@ -526,12 +533,18 @@ def scale_map(coords: Sequence[CoordXY], area_size: int, margin: int = 0, angle:
     return tuple(zip(x_range_scaled, y_range_scaled)), map_range, map_scale, map_offset
 
 
-def scale_elevation(coords: Sequence[CoordXY], area_width: int, area_height: int):
-    """Scale elevation data"""
+def scale_elevation(
+    coords: Sequence[CoordXY], area_width: int, area_height: int,
+    map_range: tuple[float, float, float, float] | None = None):
+    """Scale elevation data
+
+    map_range: optional precalculated (min x, max x, min y, max y) range.
+    """
     # Separate X & Y coordinates
     x_range, y_range = tuple(zip(*coords))
     # Map size: x=width, y=height
-    map_range = min(x_range), max(x_range), min(y_range), max(y_range)
+    if map_range is None:
+        map_range = min(x_range), max(x_range), min(y_range), max(y_range)
     map_size = map_range[1] - map_range[0], map_range[3] - map_range[2]
     # Display area / map_size
     map_scale = area_width / map_size[0], area_height / map_size[1]
@@ -540,6 +553,12 @@ def scale_elevation(coords: Sequence[CoordXY], area_width: int, area_height: int
     return tuple(zip(x_range_scaled, y_range_scaled)), map_range, map_scale
 
 
+def coords_range(coords: Sequence[CoordXY]) -> tuple[float, float, float, float]:
+    """Coordinates range (min x, max x, min y, max y)"""
+    x_range, y_range = tuple(zip(*coords))
+    return min(x_range), max(x_range), min(y_range), max(y_range)
+
+
 def svg_view_box(coords: Sequence[CoordXY], margin: int = 0) -> str:
     """Map bounding box"""
     # Separate X & Y coordinates
@@ -554,13 +573,99 @@ def svg_view_box(coords: Sequence[CoordXY], margin: int = 0) -> str:
     return f"{x1:.4f} {y1:.4f} {x2:.4f} {y2:.4f}"
 
 
-def skip_map_nodes(total: int, limit: int, detail_level: int) -> int:
-    """Skip map nodes"""
-    if detail_level <= 0:
-        skip_node = 0
-    else:
-        skip_node = total // limit + (detail_level - 1)
-    return skip_node
+def simplify_polyline(
+    coords: Sequence[CoordXY], tolerance: float,
+    vertical: bool = False, nodes: Sequence[int] | None = None) -> tuple[int, ...]:
+    """Simplify polyline with Douglas-Peucker algorithm
+
+    Args:
+        coords: polyline coordinates.
+        tolerance: max allowed deviation from simplified polyline.
+        vertical: measure deviation along y axis only (for x-ordered profile data).
+        nodes: optional node indices (subset of coords) to simplify from.
+
+    Returns:
+        Tuple of kept node indices, first & last node always kept.
+    """
+    if nodes is None:
+        nodes = range(len(coords))
+    total_nodes = len(nodes)
+    if total_nodes < 3 or tolerance <= 0:
+        return tuple(nodes)
+    keep = [False] * total_nodes
+    keep[0] = keep[-1] = True
+    stack = [(0, total_nodes - 1)]
+    while stack:
+        first, last = stack.pop()
+        pos_x1, pos_y1 = coords[nodes[first]]
+        pos_x2, pos_y2 = coords[nodes[last]]
+        delta_x = pos_x2 - pos_x1
+        delta_y = pos_y2 - pos_y1
+        if vertical:
+            slope = delta_y / delta_x if delta_x else 0.0
+        else:
+            length = hypot(delta_x, delta_y)
+        max_dist = tolerance
+        max_index = 0
+        for index in range(first + 1, last):
+            pos_x, pos_y = coords[nodes[index]]
+            if vertical:
+                node_dist = abs(pos_y - pos_y1 - (pos_x - pos_x1) * slope)
+            elif length:
+                node_dist = abs(delta_y * (pos_x - pos_x1) - delta_x * (pos_y - pos_y1)) / length
+            else:  # closed loop, first & last node overlapped
+                node_dist = hypot(pos_x - pos_x1, pos_y - pos_y1)
+            if node_dist > max_dist:
+                max_dist = node_dist
+                max_index = index
+        if max_index:
+            keep[max_index] = True
+            stack.append((first, max_index))
+            stack.append((max_index, last))
+    return tuple(node for node, kept in zip(nodes, keep) if kept)
+
+
+def polyline_lod(
+    coords: Sequence[CoordXY], base_tolerance: float = 0.05,
+    levels: int = 12, vertical: bool = False) -> tuple[tuple[float, tuple[int, ...]], ...]:
+    """Create polyline level of detail (LOD) node indices
+
+    Each level doubles tolerance of previous level,
+    and is simplified from previous level nodes to reduce calculation.
+
+    Returns:
+        Tuple of (tolerance, node indices) pairs, ordered from finest to coarsest level.
+    """
+    lod = []
+    nodes = None
+    tolerance = base_tolerance
+    for _ in range(levels):
+        nodes = simplify_polyline(coords, tolerance, vertical, nodes)
+        lod.append((tolerance, nodes))
+        if len(nodes) < 3:
+            break
+        tolerance *= 2
+    return tuple(lod)
+
+
+def select_lod_nodes(
+    lod: Sequence[tuple[float, tuple[int, ...]]], tolerance: float) -> tuple[int, ...] | None:
+    """Select coarsest LOD node indices within tolerance, None for full detail"""
+    nodes = None
+    for level_tolerance, level_nodes in lod:
+        if level_tolerance > tolerance:
+            break
+        nodes = level_nodes
+    return nodes
+
+
+def select_display_lod_nodes(
+    lod: Sequence[tuple[float, tuple[int, ...]]], detail_level: float,
+    map_scale: float) -> tuple[int, ...] | None:
+    """Select LOD node indices for display detail level (pixels) at map scale, None for full detail"""
+    if detail_level <= 0 or map_scale <= 0:
+        return None
+    return select_lod_nodes(lod, detail_level * 0.5 / map_scale)
 
 
 def line_intersect_coords(
@@ -60,18 +60,27 @@ class FileExt:
     TXT = ".txt"
     INI = ".ini"
     BAK = ".bak"
+    TMP = ".tmp"
+    CACHE = ".cache"
     JSON = ".json"
     # Image
     SVG = ".svg"
     PNG = ".png"
     # Specific
     CONSUMPTION = ".consumption"
+    DELTA = ".delta"
     ENERGY = ".energy"
+    ENERGY_DELTA = ".energydelta"
     FUEL = ".fuel"
+    FUEL_DELTA = ".fueldelta"
     SECTOR = ".sector"
     TPPN = ".tppn"
     TPTN = ".tptn"
+    TRACK_MAP = ".tpmap"
     STATS = ".stats"
+    STATS_DB = ".stats.db"
+    COMBO_INDEX = ".tpidx"
+    COMBO_DATA = ".tpdat"
     LOCK = ".lock"
 
 
@@ -111,6 +120,12 @@ class StatsFile:
     DRIVER = "driver"
 
 
+class StoreFile:
+    """Store file name constants"""
+
+    COMBO = "combo"
+
+
 class LogFile:
     """Log file name constants"""
 
@@ -20,16 +20,24 @@
 Loader function
 """
 
+from __future__ import annotations
+
 import logging
 import os
 import signal
 import sys
+from time import perf_counter
 
 from .api_control import api
 from .const_file import FileExt
 from .module_control import mctrl, wctrl
 from .overlay_control import octrl
 from .setting import cfg
+from .userfile.brand_logo import logo_cache
+from .userfile.combo_store import combo_store
+from .userfile.file_writer import fwriter
+from .widget._compositor import compositor
+from .widget._painter import text_cache
 
 logger = logging.getLogger(__name__)
 
@@ -44,26 +52,74 @@ def start():
     """Start api, modules, widgets, etc. Call once per launch."""
     logger.info("STARTING............")
     signal.signal(signal.SIGINT, int_signal_handler)
+    startup_time = [("preset", perf_counter())]
     # 1 load preset
     cfg.set_next_to_load(f"{cfg.preset_list[0]}{FileExt.JSON}")
     cfg.load()
     cfg.save()
+    startup_time.append(("api", perf_counter()))
     # 2 start api
     api.connect()
     api.start()
+    startup_time.append(("modules", perf_counter()))
     # 3 start modules
     mctrl.start()
+    startup_time.append(("widgets", perf_counter()))
     # 4 start widgets
     wctrl.start()
+    startup_time.append(("main window", perf_counter()))
     # 5 start main window
     from .ui.app import AppWindow
     AppWindow()
+    startup_time.append(("", perf_counter()))
     # Finalize loading after main GUI fully loaded
     logger.info("FINALIZING............")
+    log_startup_time(startup_time)
     # 1 Enable overlay control
     octrl.enable()
 
 
+def log_startup_time(startup_time: list[tuple[str, float]], slowest: int = 5):
+    """Log startup time breakdown
+
+    Args:
+        startup_time: list of (stage name, stage start timestamp),
+            last item marks end of final stage.
+        slowest: number of slowest modules to log.
+    """
+    stage_text = ", ".join(
+        f"{name} {(timer_end - timer_start) * 1000:.0f}ms"
+        for (name, timer_start), (_, timer_end) in zip(startup_time, startup_time[1:])
+    )
+    total_time = (startup_time[-1][1] - startup_time[0][1]) * 1000
+    logger.info("STARTUP: %s, total %.0fms", stage_text, total_time)
+    # Module import & start time, import time includes first import of dependencies
+    module_time = []
+    for control in (mctrl, wctrl):
+        import_total = sum(control.import_time.values()) * 1000
+        start_total = sum(control.start_time.values()) * 1000
+        logger.info(
+            "STARTUP: %s import %.0fms, start %.0fms (%s/%s loaded)",
+            control.type_id,
+            import_total,
+            start_total,
+            len(control.import_time),
+            control.number_total,
+        )
+        module_time.extend(
+            (control.import_time.get(name, 0) + control.start_time[name], name,
+             control.import_time.get(name, 0), control.start_time[name])
+            for name in control.start_time
+        )
+    for _, name, import_time, start_time in sorted(module_time, reverse=True)[:slowest]:
+        logger.info(
+            "STARTUP: %s (import %.1fms, start %.1fms)",
+            name,
+            import_time * 1000,
+            start_time * 1000,
+        )
+
+
 def close():
     """Close api, modules, widgets. Call before quit APP."""
     logger.info("CLOSING............")
@@ -71,6 +127,9 @@ def close():
     unload_modules()
     # 2 stop api
     api.stop()
+    # 3 finish pending user file writes
+    fwriter.flush()
+    combo_store.close()
 
 
 def restart():
@@ -97,6 +156,11 @@ def reload(reload_preset: bool = False):
     logger.info("RELOADING............")
     # 1 unload modules
     unload_modules()
+    fwriter.flush()
+    combo_store.close()
+    logo_cache.clear()
+    compositor.clear()
+    text_cache.clear()
     # 2 reload preset file
     if reload_preset:
         cfg.load()
@@ -132,6 +132,11 @@ def init_gui() -> QApplication:
     if cfg.application["enable_high_dpi_scaling"]:
         QCoreApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
         QGuiApplication.setHighDpiScaleFactorRoundingPolicy(Qt.HighDpiScaleFactorRoundingPolicy.PassThrough)
+    # Set OpenGL
+    if cfg.compatibility["rendering_backend"] != "Raster":
+        QCoreApplication.setAttribute(Qt.AA_ShareOpenGLContexts, True)
+        if cfg.compatibility["rendering_backend"] == "Software OpenGL":
+            QCoreApplication.setAttribute(Qt.AA_UseSoftwareOpenGL, True)
     # Set GUI
     QApplication.setStyle("Fusion")
     root = QApplication(sys.argv)
@@ -159,6 +164,8 @@ def unset_environment():
     os.environ.pop("QT_ENABLE_HIGHDPI_SCALING", None)
     os.environ.pop("QT_MEDIA_BACKEND", None)
     os.environ.pop("QT_MULTIMEDIA_PREFERRED_PLUGINS", None)
+    os.environ.pop("QT_OPENGL", None)
+    os.environ.pop("LIBGL_ALWAYS_SOFTWARE", None)
 
 
 def set_environment():
@@ -180,6 +187,11 @@ def set_environment():
             os.environ["QT_QPA_PLATFORM"] = "xcb"
 
     # Common
+    if cfg.compatibility["rendering_backend"] == "Software OpenGL":
+        os.environ["QT_OPENGL"] = "software"  # windows, opengl32sw
+        os.environ["LIBGL_ALWAYS_SOFTWARE"] = "1"  # linux, mesa llvmpipe
+    logger.info("Rendering backend: %s", cfg.compatibility["rendering_backend"])
+
     if cfg.application["enable_high_dpi_scaling"]:
         logger.info("High DPI scaling: ON")
     else:
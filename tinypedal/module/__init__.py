@@ -22,6 +22,8 @@ Data modules
 Add new module to import list below in ascending order,
 file name must match corresponding key name
 in template/setting_module.py dictionary.
+
+Modules are imported on first use by module control.
 """
 
 __all__ = [
@@ -29,6 +31,7 @@ __all__ = [
     "module_energy",
     "module_force",
     "module_fuel",
+    "module_gaps",
     "module_hybrid",
     "module_mapping",
     "module_notes",
@@ -39,5 +42,3 @@ __all__ = [
     "module_vehicles",
     "module_wheels",
 ]
-
-from . import *
@@ -0,0 +1,191 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Multi-reference delta engine
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Sequence
+
+from ..const_common import MAX_SECONDS
+
+
+class DeltaReference:
+    """Multi-reference delta engine
+
+    Reference lap traces (distance, laptime) are resampled onto a shared
+    distance grid, and stored row by row in a single flat array
+    (references x nodes). All references are evaluated with one grid lookup
+    and two strided slices per update, regardless of reference counts.
+    """
+
+    __slots__ = (
+        "_step",
+        "_scale",
+        "_rows",
+        "_nodes",
+        "_data",
+        "_mask",
+        "_source",
+        "_linked",
+        "laptime",
+        "delta",
+    )
+
+    def __init__(self, rows: int, step: float = 5.0, length: float = 0.0):
+        """
+        Args:
+            rows: number of reference laps.
+            step: grid resolution (meters).
+            length: initial grid length (meters), auto extends with longer reference.
+        """
+        self._step = max(step, 1.0)
+        self._scale = 1 / self._step
+        self._rows = rows
+        self._nodes = 2
+        self._data = array("d")
+        self._mask = array("d", [0.0] * rows)
+        self._source: list[Sequence[Sequence[float]] | None] = [None] * rows
+        self._linked: list[tuple[int, float] | None] = [None] * rows
+        self.laptime = [MAX_SECONDS] * rows
+        self.delta = [0.0] * rows
+        self.resize(length)
+
+    def resize(self, length: float):
+        """Resize grid to cover specific length, existing references are resampled"""
+        nodes = int(length * self._scale) + 2
+        if nodes <= self._nodes and self._data:
+            return
+        self._nodes = max(nodes, self._nodes)
+        self._data = array("d", bytes(8 * self._nodes * self._rows))
+        for index, dataset in enumerate(self._source):
+            if dataset is not None:
+                self._resample(index, dataset)
+        self._update_linked()
+
+    def reset(self):
+        """Reset delta output"""
+        self.delta = [0.0] * self._rows
+
+    def clear(self, index: int):
+        """Clear reference"""
+        self._source[index] = None
+        self._linked[index] = None
+        self._mask[index] = 0.0
+        self.laptime[index] = MAX_SECONDS
+        self._update_linked(index)
+
+    def set(self, index: int, dataset: Sequence[Sequence[float]]):
+        """Set reference from delta data set, last row is (end position, laptime)"""
+        if len(dataset) < 2:
+            self.clear(index)
+            return
+        self._source[index] = dataset
+        self._linked[index] = None
+        self.laptime[index] = dataset[-1][1]
+        if int(dataset[-1][0] * self._scale) + 2 > self._nodes:
+            self.resize(dataset[-1][0])
+        else:
+            self._resample(index, dataset)
+            self._update_linked(index)
+
+    def scale(self, index: int, source_index: int, laptime: float):
+        """Set reference by scaling source reference to target laptime
+
+        Used for references that only have lap time available,
+        such as opponent best or last lap time. Scaled reference
+        follows source reference changes until set or cleared.
+        """
+        if self._linked[index] == (source_index, laptime):
+            return
+        self._scale_from(index, source_index, laptime)
+
+    def _scale_from(self, index: int, source_index: int, laptime: float):
+        """Scale source reference row into target row"""
+        source_laptime = self.laptime[source_index]
+        if (not self._mask[source_index] or not 0 < laptime < MAX_SECONDS
+            or not 0 < source_laptime < MAX_SECONDS):
+            self._mask[index] = 0.0
+            self.laptime[index] = MAX_SECONDS
+        else:
+            ratio = laptime / source_laptime
+            nodes = self._nodes
+            offset = source_index * nodes
+            self._data[index * nodes:index * nodes + nodes] = array(
+                "d", [value * ratio for value in self._data[offset:offset + nodes]])
+            self._mask[index] = 1.0
+            self.laptime[index] = laptime
+        self._source[index] = None
+        self._linked[index] = (source_index, laptime)
+
+    def _update_linked(self, source_index: int = -1):
+        """Update scaled references linked to source reference (-1 = all)"""
+        for index, linked in enumerate(self._linked):
+            if linked is not None and (source_index < 0 or linked[0] == source_index):
+                self._scale_from(index, *linked)
+
+    def update(self, position: float, target: float, condition: bool, factor: float):
+        """Update smoothed delta of all references
+
+        Args:
+            position: distance into lap (meters).
+            target: current laptime (seconds).
+            condition: whether to update delta, otherwise settle towards zero.
+            factor: exponential moving average smoothing factor.
+        """
+        if condition and position > 0:
+            node_pos = position * self._scale
+            node = int(node_pos)
+            if node > self._nodes - 2:  # extrapolate with last segment
+                node = self._nodes - 2
+            frac = node_pos - node
+            self.delta = [
+                ema + factor * ((target - lower - (upper - lower) * frac) * mask - ema)
+                for ema, lower, upper, mask in zip(
+                    self.delta,
+                    self._data[node::self._nodes],
+                    self._data[node + 1::self._nodes],
+                    self._mask,
+                )
+            ]
+        else:
+            self.delta = [ema - factor * ema for ema in self.delta]
+
+    def _resample(self, index: int, dataset: Sequence[Sequence[float]]):
+        """Resample reference onto grid with linear interpolation"""
+        data = self._data
+        offset = index * self._nodes
+        step = self._step
+        last = len(dataset) - 1
+        seg = 1
+        pos1, time1 = dataset[0][0], dataset[0][1]
+        pos2, time2 = dataset[1][0], dataset[1][1]
+        for node in range(self._nodes):
+            grid_pos = node * step
+            while seg < last and pos2 < grid_pos:
+                seg += 1
+                pos1, time1 = pos2, time2
+                pos2, time2 = dataset[seg][0], dataset[seg][1]
+            if pos2 != pos1:
+                data[offset + node] = time1 + (grid_pos - pos1) * (time2 - time1) / (pos2 - pos1)
+            else:
+                data[offset + node] = time1
+        self._mask[index] = 1.0
@@ -37,9 +37,11 @@ class HttpSetup(NamedTuple):
     host: str
     port: int
     interval: float
+    max_interval: float
     timeout: float
     retry: int
     retry_delay: float
+    pool_size: int
 
 
 class ResRawOutput(NamedTuple):
@@ -141,19 +143,33 @@ LMU_PITSTOPTIME = (
 #)
 #("LMU", "/rest/sessions/GetGameState", LMU_GAMESTATE, None),
 
+# Define refresh signal, shared memory state that invalidates resource
+SIGNAL_SESSION = "session"  # new session
+SIGNAL_LAP = "lap"  # lap completed
+SIGNAL_PITS = "pits"  # enter or exit pit lane
+SIGNAL_GARAGE = "garage"  # enter or exit garage
+SIGNAL_PIT_REQUEST = "pit_request"  # request pit
+SIGNAL_DAMAGE = "damage"  # damage severity changed
+
+SIGNALS_SESSION = (SIGNAL_SESSION,)
+SIGNALS_GARAGE = (SIGNAL_SESSION, SIGNAL_GARAGE)
+SIGNALS_PITSTOP = (SIGNAL_SESSION, SIGNAL_LAP, SIGNAL_PITS, SIGNAL_GARAGE, SIGNAL_PIT_REQUEST, SIGNAL_DAMAGE)
+
 # Define task set
-# 0 - uri path, 1 - output set, 2 - enabling condition, 3 whether repeat task
+# 0 - uri path, 1 - output set, 2 - enabling condition, 3 whether repeat task,
+# 4 - refresh signals, non-repeat task is updated again on signal events,
+# repeat task is updated immediately on signal events
 TASKSET_RF2 = (
-    ("/rest/sessions/weather", COMMON_WEATHERFORECAST, None, False),
-    ("/rest/sessions/setting/SESSSET_race_timescale", RF2_TIMESCALE, None, False),
-    ("/rest/sessions/setting/SESSSET_private_qual", RF2_PRIVATEQUALIFY, None, False),
+    ("/rest/sessions/weather", COMMON_WEATHERFORECAST, None, False, SIGNALS_SESSION),
+    ("/rest/sessions/setting/SESSSET_race_timescale", RF2_TIMESCALE, None, False, SIGNALS_SESSION),
+    ("/rest/sessions/setting/SESSSET_private_qual", RF2_PRIVATEQUALIFY, None, False, SIGNALS_SESSION),
 )
 TASKSET_LMU = (
-    ("/rest/sessions/weather", COMMON_WEATHERFORECAST, None, False),
-    ("/rest/sessions", LMU_SESSIONSINFO, None, False),
-    ("/rest/garage/getPlayerGarageData", LMU_GARAGESETUP, None, False),
-    ("/rest/garage/UIScreen/RepairAndRefuel", LMU_CURRENTSTINT, None, True),
-    ("/rest/strategy/pitstop-estimate", LMU_PITSTOPTIME, None, True),
+    ("/rest/sessions/weather", COMMON_WEATHERFORECAST, None, False, SIGNALS_SESSION),
+    ("/rest/sessions", LMU_SESSIONSINFO, None, False, SIGNALS_SESSION),
+    ("/rest/garage/getPlayerGarageData", LMU_GARAGESETUP, None, False, SIGNALS_GARAGE),
+    ("/rest/garage/UIScreen/RepairAndRefuel", LMU_CURRENTSTINT, None, True, SIGNALS_PITSTOP),
+    ("/rest/strategy/pitstop-estimate", LMU_PITSTOPTIME, None, True, SIGNALS_PITSTOP),
 )
 
 
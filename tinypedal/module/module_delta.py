@@ -20,6 +20,8 @@
 Delta module
 """
 
+from __future__ import annotations
+
 from functools import partial
 
 from .. import calculation as calc
@@ -35,6 +37,16 @@ from ..module_info import minfo
 from ..userfile.delta_best import load_delta_best_file, save_delta_best_file
 from ..validator import is_same_session, valid_delta_raw, vehicle_position_sync
 from ._base import DataModule, round6
+from ._delta import DeltaReference
+
+# Reference index
+REF_BEST = 0
+REF_LAST = 1
+REF_SESSION = 2
+REF_STINT = 3
+REF_CLASS_BEST = 4  # class best lap trace, or scaled from best reference
+REF_RIVAL = 5  # rival last lap trace, or scaled from best reference
+REF_TOTAL = 6
 
 
 class Realtime(DataModule):
@@ -61,10 +73,8 @@ class Realtime(DataModule):
         laptime_stint_best = MAX_SECONDS
         min_delta_distance = self.mcfg["minimum_delta_distance"]
 
-        calc_ema_delta = partial(
-            calc.exp_mov_avg,
-            calc.ema_factor(min(max(self.mcfg["delta_smoothing_samples"], 1), 100))
-        )
+        delta_ema_factor = calc.ema_factor(min(max(self.mcfg["delta_smoothing_samples"], 1), 100))
+        delta_ref = DeltaReference(REF_TOTAL, min_delta_distance)
         calc_ema_laptime = partial(
             calc.exp_mov_avg,
             calc.ema_factor(min(max(self.mcfg["laptime_pace_samples"], 1), 20))
@@ -102,10 +112,16 @@ class Realtime(DataModule):
                     delta_array_raw = [DELTA_ZERO]  # distance, laptime
                     delta_array_last = DELTA_DEFAULT  # last lap
 
-                    delta_ema_best = 0.0
-                    delta_ema_last = 0.0
-                    delta_ema_session = 0.0
-                    delta_ema_stint = 0.0
+                    delta_ref.resize(api.read.lap.track_length())
+                    delta_ref.set(REF_BEST, delta_array_best)
+                    delta_ref.clear(REF_LAST)
+                    delta_ref.set(REF_SESSION, delta_array_session)
+                    delta_ref.set(REF_STINT, delta_array_stint)
+                    delta_ref.clear(REF_CLASS_BEST)
+                    delta_ref.clear(REF_RIVAL)
+                    delta_ref.reset()
+                    ref_class_key = ref_rival_key = ()  # opponent reference source key
+                    delta_ema = delta_ref.delta
 
                     laptime_curr = 0.0  # current laptime
                     laptime_last = 0.0  # last laptime
@@ -133,6 +149,7 @@ class Realtime(DataModule):
                 if in_pits and laptime_stint_best != MAX_SECONDS and api.read.vehicle.speed() < 0.1:
                     delta_array_stint = DELTA_DEFAULT
                     laptime_stint_best = MAX_SECONDS
+                    delta_ref.clear(REF_STINT)
 
                 # Lap start & finish detection
                 if lap_stime > last_lap_stime:
@@ -140,6 +157,7 @@ class Realtime(DataModule):
                     if valid_delta_raw(delta_array_raw, laptime_last, 1):  # set end value
                         delta_array_raw.append((round6(pos_last + 10), round6(laptime_last)))
                         delta_array_last = tuple(delta_array_raw)
+                        delta_ref.set(REF_LAST, delta_array_last)
                         validating = api.read.timing.elapsed()
                     delta_array_raw[:] = DELTA_DEFAULT
                     pos_last = pos_recorded = pos_curr
@@ -182,6 +200,7 @@ class Realtime(DataModule):
                         if laptime_best > laptime_last:
                             laptime_best = laptime_last
                             output.deltaBestData = delta_array_best = delta_array_last
+                            delta_ref.set(REF_BEST, delta_array_best)
                             save_delta_best_file(
                                 filepath=userpath_delta_best,
                                 filename=combo_id,
@@ -191,10 +210,12 @@ class Realtime(DataModule):
                         if laptime_session_best > laptime_last:
                             laptime_session_best = laptime_last
                             delta_array_session = delta_array_last
+                            delta_ref.set(REF_SESSION, delta_array_session)
                         # Update delta stint best list
                         if laptime_stint_best > laptime_last:
                             laptime_stint_best = laptime_last
                             delta_array_stint = delta_array_last
+                            delta_ref.set(REF_STINT, delta_array_stint)
                         validating = 0
 
                 # Calc distance
@@ -212,55 +233,34 @@ class Realtime(DataModule):
                 # Calc delta
                 if pos_synced_last != pos_synced:
                     pos_synced_last = pos_synced
-                    delay_update = laptime_curr > 0.3
+                    # Opponent references
+                    plr_index = minfo.vehicles.playerIndex
+                    if 0 <= plr_index < minfo.vehicles.totalVehicles:
+                        ref_class_key = update_class_best_reference(
+                            delta_ref, plr_index, ref_class_key)
+                        ref_rival_key = update_rival_reference(
+                            delta_ref, plr_index, ref_rival_key)
                     # Smooth delta
-                    delta_ema_best = calc_ema_delta(
-                        delta_ema_best,
-                        calc.delta_telemetry(
-                            delta_array_best,
-                            pos_synced,
-                            laptime_curr,
-                            delay_update,
-                        ),
-                    )
-                    delta_ema_last = calc_ema_delta(
-                        delta_ema_last,
-                        calc.delta_telemetry(
-                            delta_array_last,
-                            pos_synced,
-                            laptime_curr,
-                            delay_update,
-                        ),
-                    )
-                    delta_ema_session = calc_ema_delta(
-                        delta_ema_session,
-                        calc.delta_telemetry(
-                            delta_array_session,
-                            pos_synced,
-                            laptime_curr,
-                            delay_update,
-                        ),
-                    )
-                    delta_ema_stint = calc_ema_delta(
-                        delta_ema_stint,
-                        calc.delta_telemetry(
-                            delta_array_stint,
-                            pos_synced,
-                            laptime_curr,
-                            delay_update,
-                        ),
+                    delta_ref.update(
+                        pos_synced,
+                        laptime_curr,
+                        laptime_curr > 0.3,  # delay update
+                        delta_ema_factor,
                     )
+                    delta_ema = delta_ref.delta
 
                 # Output delta time data
-                output.deltaBest = delta_ema_best
-                output.deltaLast = delta_ema_last
-                output.deltaSession = delta_ema_session
-                output.deltaStint = delta_ema_stint
+                output.deltaBest = delta_ema[REF_BEST]
+                output.deltaLast = delta_ema[REF_LAST]
+                output.deltaSession = delta_ema[REF_SESSION]
+                output.deltaStint = delta_ema[REF_STINT]
+                output.deltaClassBest = delta_ema[REF_CLASS_BEST]
+                output.deltaRival = delta_ema[REF_RIVAL]
                 output.isValidLap = laptime_valid > 0
                 output.lapTimeCurrent = laptime_curr
                 output.lapTimeLast = laptime_last
                 output.lapTimeBest = laptime_best
-                output.lapTimeEstimated = laptime_best + delta_ema_best
+                output.lapTimeEstimated = laptime_best + delta_ema[REF_BEST]
                 output.lapTimeSession = laptime_session_best
                 output.lapTimeStint = laptime_stint_best
                 output.lapTimePace = laptime_pace
@@ -271,3 +271,64 @@ class Realtime(DataModule):
                     reset = False
                     update_interval = self.idle_interval
                     last_session_id = (combo_id, *session_id)
+
+
+def select_rival_index(plr_index: int) -> int:
+    """Select rival (vehicle ahead in class) index, -1 if not available"""
+    classes = minfo.relative.classes
+    if plr_index < len(classes):
+        rival_index = classes[plr_index][4]
+        if 0 <= rival_index < minfo.vehicles.totalVehicles:
+            return rival_index
+    return -1
+
+
+def update_class_best_reference(delta_ref: DeltaReference, plr_index: int, last_key: tuple | None):
+    """Update class best reference from best lap trace of class best vehicle,
+    or scale from best reference if lap trace not available
+
+    Returns:
+        Reference source key, only update if changed.
+    """
+    veh_data = minfo.vehicles.dataSet
+    lap_trace = minfo.vehicles.lapTrace
+    laptime_class_best = veh_data[plr_index].classBestLapTime
+    key = (laptime_class_best, lap_trace.bestVersion)
+    if key == last_key:
+        return last_key
+    class_name = veh_data[plr_index].vehicleClass
+    for index in range(minfo.vehicles.totalVehicles):
+        if (veh_data[index].vehicleClass == class_name
+            and abs(lap_trace.best_laptime(index) - laptime_class_best) < 0.001):
+            delta_ref.set(REF_CLASS_BEST, lap_trace.best_dataset(index))
+            return key
+    delta_ref.scale(REF_CLASS_BEST, REF_BEST, laptime_class_best)
+    return key
+
+
+def update_rival_reference(delta_ref: DeltaReference, plr_index: int, last_key: tuple | None):
+    """Update rival reference from last lap trace of rival,
+    or scale from best reference if lap trace not available
+
+    Returns:
+        Reference source key, only update if changed.
+    """
+    rival_index = select_rival_index(plr_index)
+    lap_trace = minfo.vehicles.lapTrace
+    if rival_index < 0:
+        key = None
+    else:
+        key = (
+            rival_index,
+            lap_trace.last_lap(rival_index),
+            minfo.vehicles.dataSet[rival_index].lastLapTime,
+        )
+    if key == last_key:
+        return last_key
+    if key is None:
+        delta_ref.clear(REF_RIVAL)
+    elif key[1] >= 0:
+        delta_ref.set(REF_RIVAL, lap_trace.lap_dataset(rival_index, key[1]))
+    else:
+        delta_ref.scale(REF_RIVAL, REF_BEST, key[2])
+    return key
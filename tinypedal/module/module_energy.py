@@ -59,7 +59,8 @@ class Realtime(DataModule):
                         telemetry_func=telemetry_energy,
                         filepath=userpath_energy_delta,
                         filename=combo_id,
-                        extension=FileExt.ENERGY,
+                        extension=FileExt.ENERGY_DELTA,
+                        legacy_extension=FileExt.ENERGY,
                         min_delta_distance=self.mcfg["minimum_delta_distance"],
                     )
                     # Reset module output
@@ -71,7 +71,8 @@ class Realtime(DataModule):
                         telemetry_func=detect_consumption_type(),
                         filepath=userpath_fuel_delta,
                         filename=combo_id,
-                        extension=FileExt.FUEL,
+                        extension=FileExt.FUEL_DELTA,
+                        legacy_extension=FileExt.FUEL,
                         min_delta_distance=self.mcfg["minimum_delta_distance"],
                     )
                     # Reset module output
@@ -164,7 +165,7 @@ def telemetry_battery() -> tuple[float, float]:
 @generator_init
 def calc_consumption(
     output: FuelInfo, telemetry_func: Callable, filepath: str, filename: str, extension: str,
-    min_delta_distance: float):
+    legacy_extension: str, min_delta_distance: float):
     """Calculate consumption data"""
     recording = False
     delayed_save = False
@@ -175,7 +176,8 @@ def calc_consumption(
         filepath=filepath,
         filename=filename,
         extension=extension,
-        defaults=(DELTA_DEFAULT, 0.0, 0.0)
+        defaults=(DELTA_DEFAULT, 0.0, 0.0),
+        legacy_extension=legacy_extension,
     )
     delta_array_raw = [DELTA_ZERO]  # distance, fuel used, laptime
     delta_array_temp = DELTA_DEFAULT  # last lap temp
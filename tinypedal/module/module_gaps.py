@@ -0,0 +1,130 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Gaps module
+"""
+
+from __future__ import annotations
+
+from ..api_control import api
+from ..module_info import minfo
+from ..validator import is_same_session
+from ._base import DataModule
+
+
+class Realtime(DataModule):
+    """Gaps history data"""
+
+    __slots__ = ()
+
+    def __init__(self, config, module_name):
+        super().__init__(config, module_name)
+
+    def update_data(self):
+        """Update module data"""
+        _event_wait = self._event.wait
+        reset = False
+        update_interval = self.active_interval
+
+        output = minfo.gaps
+        output.setup(
+            recent=min(max(self.mcfg["recent_history_samples"], 10), 36000),
+            sector=min(max(self.mcfg["sector_history_samples"], 10), 36000),
+            lap=min(max(self.mcfg["lap_history_samples"], 10), 36000),
+            stint=min(max(self.mcfg["stint_history_samples"], 10), 36000),
+        )
+        last_session_id = ("",-1,-1,-1)
+        # Per vehicle state: last completed laps, sector index, in pits
+        last_laps = [-1] * len(output.dataSet)
+        last_sector = [-1] * len(output.dataSet)
+        last_in_pits = [False] * len(output.dataSet)
+
+        while not _event_wait(update_interval):
+            if self.state.active:
+
+                if not reset:
+                    reset = True
+                    update_interval = self.active_interval
+
+                    combo_id = api.read.check.combo_id()
+                    session_id = api.read.check.session_id()
+
+                    # Clear gap history if not same session
+                    if not is_same_session(combo_id, session_id, last_session_id):
+                        for history in output.dataSet:
+                            history.clear()
+                            history.slotId = -1
+                        output.dataSetVersion += 1
+                        last_session_id = (combo_id, *session_id)
+
+                    last_elapsed = -1.0
+
+                elapsed = api.read.session.elapsed()
+                if elapsed != last_elapsed:
+                    last_elapsed = elapsed
+                    update_gap_history(
+                        output.dataSet, elapsed, last_laps, last_sector, last_in_pits)
+
+            else:
+                if reset:
+                    reset = False
+                    update_interval = self.idle_interval
+
+
+def update_gap_history(
+    data_set: tuple, elapsed: float, last_laps: list, last_sector: list, last_in_pits: list):
+    """Update gap history of all vehicles"""
+    veh_total = min(api.read.vehicle.total_vehicles(), len(data_set))
+    player_gap = api.read.timing.behind_leader(api.read.vehicle.player_index())
+
+    for index in range(veh_total):
+        history = data_set[index]
+        slot_id = api.read.vehicle.slot_id(index)
+        laps_done = api.read.lap.completed_laps(index)
+        sector_index = api.read.lap.sector_index(index)
+        in_pits = api.read.vehicle.in_pits(index)
+
+        # Clear history if vehicle index taken by different vehicle
+        if history.slotId != slot_id:
+            history.slotId = slot_id
+            history.clear()
+            last_laps[index] = laps_done
+            last_sector[index] = sector_index
+            last_in_pits[index] = in_pits
+
+        gap_leader = api.read.timing.behind_leader(index)
+        gap_player = gap_leader - player_gap
+        laps = laps_done + api.read.lap.progress(index)
+
+        history.recent.append(elapsed, laps, gap_leader, gap_player)
+
+        if last_sector[index] != sector_index:
+            last_sector[index] = sector_index
+            history.sector.append(elapsed, laps, gap_leader, gap_player)
+
+        if last_laps[index] != laps_done:
+            last_laps[index] = laps_done
+            history.lap.append(elapsed, laps, gap_leader, gap_player)
+
+        # Record stint sample on pit entry
+        if last_in_pits[index] != in_pits:
+            last_in_pits[index] = in_pits
+            if in_pits:
+                history.stint.append(elapsed, laps, gap_leader, gap_player)
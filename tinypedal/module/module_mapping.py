@@ -20,12 +20,19 @@
 Mapping module
 """
 
+from time import time
+
 from .. import calculation as calc
 from ..api_control import api
 from ..const_file import FileExt
 from ..module_info import minfo
 from ..userfile.track_info import load_track_info, save_track_info
-from ..userfile.track_map import load_track_map_file, save_track_map_file
+from ..userfile.file_writer import fwriter
+from ..userfile.track_map import (
+    create_track_map_data,
+    load_track_map_data,
+    save_track_map_file,
+)
 from ..validator import file_last_modified, generator_init
 from ._base import DataModule, round4
 
@@ -58,9 +65,15 @@ class Realtime(DataModule):
 
                     recorder.load_map(api.read.check.track_id())
                     if recorder.map_exist:
-                        output.coordinates = recorder.output.coords
-                        output.elevations = recorder.output.dists
-                        output.sectors = recorder.output.sectors
+                        map_data = recorder.map_data
+                        output.coordinates = map_data.coords
+                        output.elevations = map_data.dists
+                        output.sectors = map_data.sectors
+                        output.coordinatesRange = map_data.coords_range
+                        output.elevationsRange = map_data.dists_range
+                        output.coordinatesLod = map_data.coords_lod
+                        output.elevationsLod = map_data.dists_lod
+                        # Set last modified after all map data
                         output.lastModified = recorder.last_modified
                     else:
                         recorder.reset()
@@ -193,7 +206,7 @@ class MapRecorder:
         self._filepath = filepath
         self._filename = ""
         # Map data
-        self.output = MapCoords()
+        self.map_data = None
         self._recorder_data = MapCoords()
         self._temp_data = MapCoords()
 
@@ -276,38 +289,36 @@ class MapRecorder:
     def load_map(self, filename: str):
         """Load map data file"""
         self._filename = filename
+        # Check if recorded map not yet saved
+        if self.map_data is not None and fwriter.pending(f"{self._filepath}{filename}{FileExt.SVG}"):
+            self.map_exist = True
+            return
         # Check if same map loaded
         modified = file_last_modified(
             filepath=self._filepath,
             filename=filename,
             extension=FileExt.SVG,
         )
-        is_loaded = self.last_modified == modified > 0
+        is_loaded = self.map_data is not None and self.last_modified == modified > 0
         self.last_modified = modified
         if is_loaded:
             self.map_exist = True
             return
         # Load map file
-        raw_coords, raw_dists, sectors_index = load_track_map_file(
+        self.map_data = load_track_map_data(
             filepath=self._filepath,
             filename=filename,
         )
-        if raw_coords and raw_dists:
-            self.output.coords = raw_coords
-            self.output.dists = raw_dists
-            self.output.sectors = sectors_index
-            self.map_exist = True
-            #logger.info("map exist")
-        else:
-            self.output.clear()
-            self.map_exist = False
-            #logger.info("map not exist")
+        self.map_exist = self.map_data is not None
 
     def save_map(self):
         """Store & convert raw coordinates to svg points data"""
-        self.output.coords = self._temp_data.coords
-        self.output.dists = self._temp_data.dists
-        self.output.sectors = self._temp_data.sectors
+        self.map_data = create_track_map_data(
+            self._temp_data.coords,
+            self._temp_data.dists,
+            self._temp_data.sectors,
+        )
+        self.last_modified = time()  # mark as new map until svg file saved
         # Save to svg file
         save_track_map_file(
             filepath=self._filepath,
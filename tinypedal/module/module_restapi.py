@@ -29,10 +29,25 @@ from itertools import chain
 from typing import Any
 
 from ..api_control import api
-from ..async_request import http_get, set_header_get
+from ..async_request import (
+    HttpConnectionPool,
+    JsonKeyScanner,
+    ResourceValidator,
+    set_header_get,
+)
 from ..const_common import TYPE_JSON
 from ._base import DataModule
-from ._task import HttpSetup, ResRawOutput, select_taskset
+from ._task import (
+    SIGNAL_DAMAGE,
+    SIGNAL_GARAGE,
+    SIGNAL_LAP,
+    SIGNAL_PIT_REQUEST,
+    SIGNAL_PITS,
+    SIGNAL_SESSION,
+    HttpSetup,
+    ResRawOutput,
+    select_taskset,
+)
 
 logger = logging.getLogger(__name__)
 json_decoder = json.JSONDecoder()
@@ -88,33 +103,36 @@ class Realtime(DataModule):
             host=self.mcfg["url_host"],
             port=self.mcfg.get(f"url_port_{sim_name.lower()}", 0),
             interval=self.active_interval,
+            max_interval=min(max(self.mcfg["maximum_update_interval"] / 1000, self.active_interval), 300),
             timeout=min(max(self.mcfg["connection_timeout"], 0.5), 10),
             retry=min(max(int(self.mcfg["connection_retry"]), 0), 10),
             retry_delay=min(max(self.mcfg["connection_retry_delay"], 0), 60),
+            pool_size=min(max(int(self.mcfg["connection_pool_size"]), 1), 4),
         )
         # Run all tasks while on track, this blocks until tasks cancelled
         logger.info("RestAPI: all tasks started")
-        asyncio.run(
-            self.task_init(
-                self.sort_taskset(sim_http, active_task_sim, select_taskset(sim_name)),
-            )
-        )
+        asyncio.run(self.task_init(sim_http, active_task_sim, select_taskset(sim_name)))
         logger.info("RestAPI: all tasks stopped")
         # Reset when finished
         reset_to_default(active_task_sim)
 
-    def sort_taskset(self, http: HttpSetup, active_task: dict, taskset: tuple):
+    def sort_taskset(self, pool: HttpConnectionPool, http: HttpSetup,
+        active_task: dict, taskset: tuple):
         """Sort task set into dictionary, key - uri_path, value - output_set"""
-        for uri_path, output_set, condition, is_repeat in taskset:
+        for uri_path, output_set, condition, is_repeat, signals in taskset:
             if self.mcfg.get(condition, True):
                 active_task[uri_path] = output_set
                 yield asyncio.create_task(
-                    self.fetch(http, uri_path, output_set, is_repeat)
+                    self.fetch(pool, http, uri_path, output_set, is_repeat, signals)
                 )
 
-    async def task_init(self, *task_generator):
+    async def task_init(self, http: HttpSetup, active_task: dict, *taskset: tuple):
         """Run repeatedly updating task"""
-        task_group = tuple(chain(*task_generator))
+        # Shared keep-alive connections for all tasks
+        pool = HttpConnectionPool(http.host, http.port, http.timeout, http.pool_size)
+        task_group = tuple(chain(*(
+            self.sort_taskset(pool, http, active_task, _taskset) for _taskset in taskset
+        )))
         # Task control
         await asyncio.create_task(self.task_control(task_group))
         # Start task
@@ -123,6 +141,7 @@ class Realtime(DataModule):
                 await task
             except (asyncio.CancelledError, BaseException):
                 pass
+        await pool.close()
 
     async def task_control(self, task_group: tuple[asyncio.Task, ...]):
         """Control task running state"""
@@ -135,26 +154,31 @@ class Realtime(DataModule):
         for task in task_group:
             task.cancel()
 
-    async def fetch(self, http: HttpSetup,
-        uri_path: str, output_set: tuple[ResRawOutput, ...], repeat: bool = False):
+    async def fetch(self, pool: HttpConnectionPool, http: HttpSetup,
+        uri_path: str, output_set: tuple[ResRawOutput, ...], repeat: bool = False,
+        signals: tuple[str, ...] = ()):
         """Fetch data and verify"""
-        data_available = await self.update_once(http, uri_path, output_set)
+        data_available = await self.update_once(pool, http, uri_path, output_set)
         if not data_available:
             logger.info("RestAPI: MISSING: %s", uri_path)
-        elif not repeat:
-            logger.info("RestAPI: UPDATE ONCE: %s", uri_path)
-        else:
+        elif repeat:
             logger.info("RestAPI: UPDATE LIVE: %s", uri_path)
-            await self.update_repeat(http, uri_path, output_set)
+            await self.update_repeat(pool, http, uri_path, output_set, signals)
+        elif signals:
+            logger.info("RestAPI: UPDATE ON EVENT: %s", uri_path)
+            await self.update_on_event(pool, http, uri_path, output_set, signals)
+        else:
+            logger.info("RestAPI: UPDATE ONCE: %s", uri_path)
 
-    async def update_once(self, http: HttpSetup,
+    async def update_once(self, pool: HttpConnectionPool, http: HttpSetup,
         uri_path: str, output_set: tuple[ResRawOutput, ...]) -> bool:
         """Update once and verify"""
         request_header = set_header_get(uri_path, http.host)
+        resource_keys = select_keys(output_set)
         data_available = False
         total_retry = retry = http.retry
         while not self.task_cancel and retry >= 0:
-            resource_output = await get_resource(request_header, http)
+            resource_output = await get_resource(request_header, pool, resource_keys)
             # Verify & retry
             if not isinstance(resource_output, TYPE_JSON):
                 logger.info("RestAPI: %s: %s (%s/%s retries left)",
@@ -172,22 +196,64 @@ class Realtime(DataModule):
             break
         return data_available
 
-    async def update_repeat(self, http: HttpSetup,
-        uri_path: str, output_set: tuple[ResRawOutput, ...]):
-        """Update repeat"""
-        request_header = set_header_get(uri_path, http.host)
+    async def update_repeat(self, pool: HttpConnectionPool, http: HttpSetup,
+        uri_path: str, output_set: tuple[ResRawOutput, ...], signals: tuple[str, ...]):
+        """Update repeat, update immediately on signal events"""
+        validator = ResourceValidator(uri_path, http.host)
         interval = min_interval = http.interval
-        last_hash = new_hash = -1
+        last_event = read_signals(signals)
         while not self.task_cancel:  # use task control to cancel & exit loop
-            new_hash = await output_resource(request_header, http, output_set, last_hash)
-            if last_hash != new_hash:
-                last_hash = new_hash
+            if await output_resource(validator, pool, output_set):
                 interval = min_interval
-            elif interval < 5:  # increase update interval while no new data
+            elif interval < http.max_interval:  # increase update interval while no new data
                 interval += interval / 2
-                if interval > 5:
-                    interval = 5
-            await asyncio.sleep(interval)
+                if interval > http.max_interval:
+                    interval = http.max_interval
+            # Wait for next update, reset update interval on signal event
+            elapsed = 0.0
+            while elapsed < interval and not self.task_cancel:
+                await asyncio.sleep(min_interval)
+                elapsed += min_interval
+                new_event = read_signals(signals)
+                if last_event != new_event:
+                    last_event = new_event
+                    interval = min_interval
+                    break
+
+    async def update_on_event(self, pool: HttpConnectionPool, http: HttpSetup,
+        uri_path: str, output_set: tuple[ResRawOutput, ...], signals: tuple[str, ...]):
+        """Update on signal events only"""
+        request_header = set_header_get(uri_path, http.host)
+        resource_keys = select_keys(output_set)
+        last_event = read_signals(signals)
+        while not self.task_cancel:  # use task control to cancel & exit loop
+            await asyncio.sleep(http.interval)
+            new_event = read_signals(signals)
+            if last_event == new_event:
+                continue
+            resource_output = await get_resource(request_header, pool, resource_keys)
+            if not isinstance(resource_output, TYPE_JSON):
+                await asyncio.sleep(http.retry_delay)  # retry on next check
+                continue
+            last_event = new_event
+            for res in output_set:
+                res.update(resource_output)
+
+
+# Signal reader, value changes on event
+SIGNAL_READER = {
+    SIGNAL_SESSION: lambda: api.read.check.session_id()[0],
+    SIGNAL_LAP: lambda: api.read.lap.completed_laps(),
+    SIGNAL_PITS: lambda: api.read.vehicle.in_pits(),
+    SIGNAL_GARAGE: lambda: api.read.vehicle.in_garage(),
+    SIGNAL_PIT_REQUEST: lambda: api.read.vehicle.pit_request(),
+    SIGNAL_DAMAGE: lambda: api.read.vehicle.damage_severity(),
+}
+
+
+def read_signals(signals: tuple[str, ...]) -> tuple:
+    """Read signal values from shared memory"""
+    return tuple(SIGNAL_READER[name]() for name in signals)
 
 
 def reset_to_default(active_task: dict[str, tuple[ResRawOutput, ...]]):
@@ -200,27 +266,53 @@ def reset_to_default(active_task: dict[str, tuple[ResRawOutput, ...]]):
         active_task.clear()
 
 
-async def get_resource(request: bytes, http: HttpSetup) -> Any | str:
-    """Get resource from REST API"""
+def select_keys(output_set: tuple[ResRawOutput, ...]) -> frozenset[str]:
+    """Select top level keys from output set, empty if full resource is required"""
+    if all(res.keys for res in output_set):
+        return frozenset(res.keys[0] for res in output_set)
+    return frozenset()
+
+
+async def get_resource(request: bytes, pool: HttpConnectionPool,
+    keys: frozenset[str] = frozenset()) -> Any | str:
+    """Get resource from REST API
+
+    If keys specified, only decode values of selected top level keys,
+    and stop reading response once all keys found.
+    """
     try:
-        async with http_get(request, http.host, http.port, http.timeout) as raw_bytes:
-            return json_decoder.decode(raw_bytes.decode())
+        if keys:
+            scanner = JsonKeyScanner(keys)
+            await pool.get(request, scanner.feed)
+            if not scanner.done:
+                return "INVALID"
+            return scanner.result
+        raw_bytes = await pool.get(request)
+        return json_decoder.decode(raw_bytes.decode())
     except (AttributeError, TypeError, IndexError, KeyError, ValueError,
             OSError, TimeoutError, BaseException):
         return "INVALID"
 
 
 async def output_resource(
-    request: bytes, http: HttpSetup, output_set: tuple[ResRawOutput, ...], last_hash: int) -> int:
-    """Get resource from REST API and output data, skip unnecessary checking"""
+    validator: ResourceValidator, pool: HttpConnectionPool,
+    output_set: tuple[ResRawOutput, ...]) -> bool:
+    """Get resource from REST API and output data if modified, skip unnecessary checking
+
+    Returns:
+        True if resource is modified.
+    """
     try:
-        async with http_get(request, http.host, http.port, http.timeout) as raw_bytes:
-            new_hash = hash(raw_bytes)
-            if last_hash != new_hash:
-                resource_output = json_decoder.decode(raw_bytes.decode())
-                for res in output_set:
-                    res.update(resource_output)
-            return new_hash
-    except (AttributeError, TypeError, IndexError, KeyError, ValueError,
-            OSError, TimeoutError, BaseException):
-        return last_hash
+        header_bytes, raw_bytes = await pool.request(validator.request)
+    except (OSError, TimeoutError, BaseException):
+        return False
+    if not validator.modified(header_bytes, raw_bytes):
+        return False
+    try:
+        resource_output = json_decoder.decode(raw_bytes.decode())
+        for res in output_set:
+            res.update(resource_output)
+        return True
+    except (AttributeError, TypeError, IndexError, KeyError, ValueError):
+        validator.reset()  # retry decoding on next response
+        return False
@@ -26,6 +26,7 @@ from .. import calculation as calc
 from ..api_control import api
 from ..const_common import MAX_METERS, MAX_SECONDS
 from ..module_info import VehiclesInfo, minfo
+from ..userfile.brand_logo import logo_cache
 from ._base import DataModule
 
 
@@ -46,6 +47,8 @@ class Realtime(DataModule):
         output = minfo.vehicles
         max_lap_diff_ahead = self.mcfg["lap_difference_ahead_threshold"]
         max_lap_diff_behind = self.mcfg["lap_difference_behind_threshold"]
+        trace_distance = max(self.mcfg["lap_trace_sampling_distance"], 1)
+        trace_laps = min(max(int(self.mcfg["lap_trace_recorded_laps"]), 1), 10)
 
         while not _event_wait(update_interval):
             if self.state.active:
@@ -54,6 +57,7 @@ class Realtime(DataModule):
                     reset = True
                     update_interval = self.active_interval
                     output.dataSetVersion = -1
+                    output.lapTrace.setup(0.0, trace_distance, trace_laps)
                     last_veh_total = 0
 
                 veh_total = output.totalVehicles = api.read.vehicle.total_vehicles()
@@ -69,6 +73,7 @@ class Realtime(DataModule):
                     last_veh_total = veh_total
                     if veh_total > 0:
                         update_qualify_position(output)
+                        prewarm_brand_logo(self.cfg, output, veh_total)
 
             else:
                 if reset:
@@ -86,6 +91,9 @@ def update_vehicle_data(
     # General data
     track_length = api.read.lap.track_length()
     in_race = api.read.session.in_race()
+    lap_trace = output.lapTrace
+    if lap_trace.track_length != track_length:
+        lap_trace.setup(track_length, lap_trace.step, lap_trace.laps)
 
     # Local player data
     plr_laps_done = api.read.lap.completed_laps()
@@ -113,6 +121,7 @@ def update_vehicle_data(
 
         # Temp var only
         lap_etime = api.read.timing.elapsed(index)
+        lap_stime = api.read.timing.start(index)
         speed = api.read.vehicle.speed(index)
         laps_done = api.read.lap.completed_laps(index)
         lap_distance = api.read.lap.distance(index)
@@ -144,7 +153,9 @@ def update_vehicle_data(
         data.gapBehindLeaderInClass = calc_time_gap_behind(
             opt_index_leader, index, track_length, laps_done, lap_progress)
         data.pitTimer.update(in_pit, lap_etime, laps_done)
-        data.lapTimeHistory.update(api.read.timing.start(index), lap_etime, laptime_last)
+        data.lapTimeHistory.update(lap_stime, lap_etime, laptime_last)
+        lap_trace.update(
+            index, api.read.vehicle.slot_id(index), laps_done, lap_distance, lap_stime, lap_etime)
 
         # Position & relative data
         opt_pos_x = data.worldPositionX = api.read.vehicle.position_longitudinal(index)
@@ -204,6 +215,15 @@ def update_vehicle_data(
     output.dataSetVersion += 1
 
 
+def prewarm_brand_logo(config, output: VehiclesInfo, veh_total: int):
+    """Load brand logo of all vehicles in background"""
+    brands = config.user.brands
+    logo_cache.prewarm(
+        config.path.brand_logo,
+        {brands.get(data.vehicleName, data.vehicleName) for data in output.dataSet[:veh_total]},
+    )
+
+
 def update_qualify_position(output: VehiclesInfo) -> None:
     """Update qualify position"""
     temp_class = sorted((
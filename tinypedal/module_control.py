@@ -23,9 +23,10 @@ Module and widget control
 from __future__ import annotations
 
 import logging
-from time import sleep
+from importlib import import_module
+from time import perf_counter, sleep
 from types import MappingProxyType
-from typing import Any, KeysView
+from typing import Any
 
 from . import module, widget
 from .const_file import ConfigType
@@ -34,41 +35,41 @@ from .setting import cfg
 logger = logging.getLogger(__name__)
 
 
-def create_module_pack(target: Any) -> dict:
-    """Create module reference pack as dictionary
-
-    Args:
-        target: module.
-
-    Returns:
-        Dictionary, key = module name. value = imported module.
-    """
-    return {name: getattr(target, name) for name in target.__all__}
-
-
 class ModuleControl:
     """Module and widget control
 
+    Modules are imported lazily, only when first started.
+
     Args:
-        target: module.
+        target: module package.
 
     Attributes:
         type_id: module type indentifier, either "module" or "widget".
         active_modules: active module reference dict (read-only).
+        import_time: module import time (seconds) dict, key = module name.
+        start_time: last module start time (seconds) dict, key = module name.
     """
 
     __slots__ = (
         "type_id",
+        "_package",
+        "_names",
         "_imported_modules",
         "_active_modules",
         "active_modules",
+        "import_time",
+        "start_time",
     )
 
     def __init__(self, target: Any, type_id: str):
         self.type_id = type_id
-        self._imported_modules = create_module_pack(target)
+        self._package = target.__name__
+        self._names = tuple(target.__all__)
+        self._imported_modules: dict = {}
         self._active_modules: dict = {}
         self.active_modules: MappingProxyType = MappingProxyType(self._active_modules)
+        self.import_time: dict[str, float] = {}
+        self.start_time: dict[str, float] = {}
 
     def start(self, name: str = ""):
         """Start module, specify name for selected module"""
@@ -101,7 +102,7 @@ class ModuleControl:
 
     def enable_all(self):
         """Enable all modules"""
-        for _name in self._imported_modules.keys():
+        for _name in self._names:
             cfg.user.setting[_name]["enable"] = True
         self.start()
         cfg.save()
@@ -109,7 +110,7 @@ class ModuleControl:
 
     def disable_all(self):
         """Disable all modules"""
-        for _name in self._imported_modules.keys():
+        for _name in self._names:
             cfg.user.setting[_name]["enable"] = False
         self.close()
         cfg.save()
@@ -117,15 +118,28 @@ class ModuleControl:
 
     def __start_enabled(self):
         """Start all enabled module"""
-        for _name in self._imported_modules.keys():
+        for _name in self._names:
             self.__start_selected(_name)
 
     def __start_selected(self, name: str):
         """Start selected module"""
         if cfg.user.setting[name]["enable"] and name not in self._active_modules:
+            _module = self.__import_selected(name)
+            timer_start = perf_counter()
             # Create module instance and add to dict
-            self._active_modules[name] = self._imported_modules[name].Realtime(cfg, name)
+            self._active_modules[name] = _module.Realtime(cfg, name)
             self._active_modules[name].start()
+            self.start_time[name] = perf_counter() - timer_start
+
+    def __import_selected(self, name: str) -> Any:
+        """Import selected module on first use"""
+        _module = self._imported_modules.get(name)
+        if _module is None:
+            timer_start = perf_counter()
+            _module = import_module(f"{self._package}.{name}")
+            self.import_time[name] = perf_counter() - timer_start
+            self._imported_modules[name] = _module
+        return _module
 
     def __close_enabled(self):
         """Close all enabled module"""
@@ -150,12 +164,12 @@ class ModuleControl:
     @property
     def number_total(self) -> int:
         """Number of total modules"""
-        return len(self._imported_modules)
+        return len(self._names)
 
     @property
-    def names(self) -> KeysView[str]:
+    def names(self) -> tuple[str, ...]:
         """List of module names"""
-        return self._imported_modules.keys()
+        return self._names
 
 
 mctrl = ModuleControl(target=module, type_id=ConfigType.MODULE)
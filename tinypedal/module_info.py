@@ -90,6 +90,242 @@ class DeltaLapTime(array):
                 yield MAX_SECONDS
 
 
+class LapTraceStore:
+    """Session-wide lap trace store for all vehicles
+
+    Lap time is recorded at fixed distance nodes for every vehicle,
+    and stored in fixed size flat arrays laid out as (vehicle, lap slot, node).
+    Recent completed laps and lap in progress are kept in a ring buffer of lap slots,
+    plus one slot for best lap.
+    Unrecorded node is marked as -1.
+    """
+
+    __slots__ = (
+        "step",
+        "nodes",
+        "laps",
+        "track_length",
+        "bestVersion",
+        "_scale",
+        "_recent",
+        "_slots",
+        "_data",
+        "_lap_number",
+        "_lap_start",
+        "_laptime",
+        "_slot_id",
+        "_curr_lap",
+        "_last_lap",
+        "_last_node",
+        "_last_pos",
+        "_last_time",
+    )
+
+    def __init__(self):
+        self.bestVersion = 0
+        self.setup(0.0, 20.0, 2)
+
+    def setup(self, track_length: float, step: float, laps: int):
+        """Setup store size, clear all recorded data
+
+        Args:
+            track_length: track length (meters).
+            step: sampling distance between nodes (meters).
+            laps: number of recent completed laps stored per vehicle.
+        """
+        self.step = max(step, 1.0)
+        self._scale = 1 / self.step
+        self.track_length = track_length
+        self.nodes = max(int(track_length * self._scale), 2)
+        self.laps = max(laps, 1)
+        self._recent = self.laps + 1  # recent completed laps + lap in progress
+        self._slots = self._recent + 1  # last slot for best lap
+        total_slots = MAX_VEHICLES * self._slots
+        self._data = array("d", [-1.0]) * (total_slots * self.nodes)
+        self._lap_number = array("l", [-1]) * total_slots
+        self._lap_start = array("d", [0.0]) * total_slots
+        self._laptime = array("d", [0.0]) * total_slots
+        self._slot_id = array("l", [-1]) * MAX_VEHICLES
+        self._curr_lap = array("l", [-1]) * MAX_VEHICLES
+        self._last_lap = array("l", [-1]) * MAX_VEHICLES
+        self._last_node = array("l", [-1]) * MAX_VEHICLES
+        self._last_pos = array("d", [0.0]) * MAX_VEHICLES
+        self._last_time = array("d", [0.0]) * MAX_VEHICLES
+        self.bestVersion += 1
+
+    def update(
+        self, index: int, slot_id: int, laps_done: int,
+        lap_distance: float, lap_start: float, elapsed: float):
+        """Update vehicle lap trace
+
+        Args:
+            index: vehicle index.
+            slot_id: vehicle slot id, trace is reset if changed.
+            laps_done: completed laps.
+            lap_distance: distance into lap (meters).
+            lap_start: current lap start time (seconds).
+            elapsed: session elapsed time (seconds).
+        """
+        if self._slot_id[index] != slot_id:
+            self._reset_vehicle(index, slot_id)
+        laptime = elapsed - lap_start
+        # New lap
+        if self._curr_lap[index] != laps_done:
+            is_synced = self._curr_lap[index] == laps_done - 1
+            if is_synced:
+                self._finish_lap(index, lap_start)
+            row = index * self._slots + laps_done % self._recent
+            offset = row * self.nodes
+            self._data[offset:offset + self.nodes] = array("d", [-1.0]) * self.nodes
+            self._lap_number[row] = laps_done
+            self._lap_start[row] = lap_start
+            self._laptime[row] = 0.0
+            self._curr_lap[index] = laps_done
+            if is_synced:  # record from start line
+                self._last_node[index] = -1
+                self._last_pos[index] = 0.0
+                self._last_time[index] = 0.0
+            else:  # joined mid-lap, lap incomplete
+                self._last_node[index] = self.nodes
+        # Ignore invalid distance, or unsynced distance after crossing start line
+        if lap_distance < 0 or (laptime < 1 and lap_distance > 300):
+            return
+        node = int(lap_distance * self._scale)
+        if node >= self.nodes:
+            node = self.nodes - 1
+        if node > self._last_node[index]:
+            row = index * self._slots + laps_done % self._recent
+            self._record(index, row * self.nodes, node, lap_distance, laptime)
+        self._last_pos[index] = lap_distance
+        self._last_time[index] = laptime
+
+    def _record(self, index: int, offset: int, node: int, position: float, laptime: float):
+        """Record nodes between last sample and current sample with interpolation"""
+        last_pos = self._last_pos[index]
+        last_time = self._last_time[index]
+        pos_diff = position - last_pos
+        step = self.step
+        data = self._data
+        for node_index in range(self._last_node[index] + 1, node + 1):
+            if pos_diff > 0:
+                data[offset + node_index] = (
+                    last_time + (node_index * step - last_pos) * (laptime - last_time) / pos_diff)
+            else:
+                data[offset + node_index] = laptime
+        self._last_node[index] = node
+
+    def _finish_lap(self, index: int, next_lap_start: float):
+        """Finish current lap, update best lap slot if faster"""
+        lap = self._curr_lap[index]
+        row = index * self._slots + lap % self._recent
+        laptime = next_lap_start - self._lap_start[row]
+        if self._last_node[index] >= self.nodes or laptime <= 0:
+            return  # incomplete lap
+        # Fill remaining nodes towards finish line
+        if self._last_node[index] < self.nodes - 1:
+            self._record(index, row * self.nodes, self.nodes - 1, self.track_length, laptime)
+        self._laptime[row] = laptime
+        self._last_lap[index] = lap
+        best_row = index * self._slots + self._recent
+        best_laptime = self._laptime[best_row]
+        if best_laptime <= 0 or laptime < best_laptime:
+            nodes = self.nodes
+            self._data[best_row * nodes:best_row * nodes + nodes] = (
+                self._data[row * nodes:row * nodes + nodes])
+            self._lap_number[best_row] = lap
+            self._lap_start[best_row] = self._lap_start[row]
+            self._laptime[best_row] = laptime
+            self.bestVersion += 1
+
+    def _reset_vehicle(self, index: int, slot_id: int):
+        """Reset vehicle lap trace"""
+        for row in range(index * self._slots, (index + 1) * self._slots):
+            self._lap_number[row] = -1
+            self._laptime[row] = 0.0
+        self._slot_id[index] = slot_id
+        self._curr_lap[index] = -1
+        self._last_lap[index] = -1
+        self._last_node[index] = self.nodes
+        self.bestVersion += 1
+
+    def _lap_row(self, index: int, lap: int) -> int:
+        """Get row index of recorded lap, -1 if not available"""
+        if lap < 0:
+            return -1
+        row = index * self._slots + lap % self._recent
+        if self._lap_number[row] != lap:
+            return -1
+        return row
+
+    def last_lap(self, index: int) -> int:
+        """Last fully recorded lap number, -1 if not available"""
+        return self._last_lap[index]
+
+    def best_laptime(self, index: int) -> float:
+        """Best fully recorded lap time, 0 if not available"""
+        return self._laptime[index * self._slots + self._recent]
+
+    def lap_dataset(self, index: int, lap: int) -> tuple:
+        """Lap trace data set (distance, laptime) of fully recorded lap"""
+        return self._row_dataset(self._lap_row(index, lap))
+
+    def best_dataset(self, index: int) -> tuple:
+        """Lap trace data set (distance, laptime) of best lap"""
+        return self._row_dataset(index * self._slots + self._recent)
+
+    def _row_dataset(self, row: int) -> tuple:
+        """Create lap trace data set from row"""
+        if row < 0 or self._laptime[row] <= 0:
+            return DELTA_DEFAULT
+        offset = row * self.nodes
+        step = self.step
+        dataset = list(zip(
+            (node * step for node in range(self.nodes)),
+            self._data[offset:offset + self.nodes],
+        ))
+        dataset.append((self.track_length, self._laptime[row]))
+        return tuple(dataset)
+
+    def time_into(self, index: int, lap: int, position: float) -> float:
+        """Lap time at distance into lap of recorded lap, -1 if not available"""
+        row = self._lap_row(index, lap)
+        if row < 0:
+            return -1.0
+        node_pos = position * self._scale
+        node = int(node_pos)
+        if node > self.nodes - 2:  # extrapolate with last segment
+            node = self.nodes - 2
+        offset = row * self.nodes + node
+        lower = self._data[offset]
+        upper = self._data[offset + 1]
+        if lower < 0 or upper < 0:
+            return -1.0
+        return lower + (upper - lower) * (node_pos - node)
+
+    def live_delta(self, index: int) -> float:
+        """Current lap delta against vehicle's last lap at same distance, 0 if not available"""
+        reference = self.time_into(index, self._last_lap[index], self._last_pos[index])
+        if reference < 0 or self._last_lap[index] != self._curr_lap[index] - 1:
+            return 0.0
+        return self._last_time[index] - reference
+
+    def time_gap(self, ahead_index: int, behind_index: int) -> float:
+        """Time gap between vehicle ahead and behind at behind vehicle's current position
+
+        Time since ahead vehicle passed the same distance on the same lap, -1 if not available.
+        """
+        lap = self._curr_lap[behind_index]
+        row = self._lap_row(ahead_index, lap)
+        if row < 0:
+            return -1.0
+        passed = self.time_into(ahead_index, lap, self._last_pos[behind_index])
+        if passed < 0:
+            return -1.0
+        behind_row = behind_index * self._slots + lap % self._recent
+        return (self._lap_start[behind_row] + self._last_time[behind_index]
+                - self._lap_start[row] - passed)
+
+
 class VehiclePitTimer:
     """Vehicle pit timer"""
 
@@ -214,6 +450,8 @@ class DeltaInfo:
         "deltaLast",
         "deltaSession",
         "deltaStint",
+        "deltaClassBest",
+        "deltaRival",
         "isValidLap",
         "lapTimeCurrent",
         "lapTimeLast",
@@ -231,6 +469,8 @@ class DeltaInfo:
         self.deltaLast: float = 0.0
         self.deltaSession: float = 0.0
         self.deltaStint: float = 0.0
+        self.deltaClassBest: float = 0.0
+        self.deltaRival: float = 0.0
         self.isValidLap: bool = False
         self.lapTimeCurrent: float = 0.0
         self.lapTimeLast: float = 0.0
@@ -320,6 +560,149 @@ class FuelInfo:
         self.oneLessPitConsumption: float = 0.0
 
 
+class GapHistory:
+    """Gap history ring buffer
+
+    Fixed size ring buffer of samples in chronological order.
+    Sample columns: 0 session elapsed time, 1 completed laps (fraction),
+    2 gap behind leader, 3 gap behind player.
+    """
+
+    __slots__ = (
+        "capacity",
+        "count",
+        "_head",
+        "_columns",
+    )
+
+    def __init__(self, capacity: int):
+        self.capacity = max(capacity, 1)
+        self.count = 0
+        self._head = 0  # next write position
+        self._columns = tuple(array("d", [0.0]) * self.capacity for _ in range(4))
+
+    def clear(self):
+        """Clear samples"""
+        self.count = 0
+        self._head = 0
+
+    def append(self, elapsed: float, laps: float, gap_leader: float, gap_player: float):
+        """Append sample, overwrite oldest sample if full"""
+        head = self._head
+        etime, lap, leader, player = self._columns
+        etime[head] = elapsed
+        lap[head] = laps
+        leader[head] = gap_leader
+        player[head] = gap_player
+        self._head = (head + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+
+    def _physical(self, logical: int) -> int:
+        """Convert logical (chronological) index to physical index"""
+        return (self._head - self.count + logical) % self.capacity
+
+    def first(self, column: int = 0) -> float:
+        """Oldest sample value of column, -1 if empty"""
+        if self.count:
+            return self._columns[column][self._physical(0)]
+        return -1.0
+
+    def last(self, column: int = 0) -> float:
+        """Latest sample value of column, -1 if empty"""
+        if self.count:
+            return self._columns[column][self._physical(self.count - 1)]
+        return -1.0
+
+    def query(self, start: float, end: float, column: int = 0) -> list[tuple[float, float, float, float]]:
+        """Query samples within range of column value (inclusive)
+
+        Column must be in ascending order, such as elapsed time (0) or laps (1).
+        """
+        key = self._columns[column]
+        # Binary search first sample higher or equal to start
+        lower = 0
+        upper = self.count
+        while lower < upper:
+            center = (lower + upper) // 2
+            if key[self._physical(center)] < start:
+                lower = center + 1
+            else:
+                upper = center
+        output = []
+        etime, lap, leader, player = self._columns
+        for logical in range(lower, self.count):
+            index = self._physical(logical)
+            if key[index] > end:
+                break
+            output.append((etime[index], lap[index], leader[index], player[index]))
+        return output
+
+
+class VehicleGapHistory:
+    """Vehicle gap history with multi-resolution tiers
+
+    Tiers: recent (full-rate), sector, lap, stint.
+    """
+
+    __slots__ = (
+        "slotId",
+        "recent",
+        "sector",
+        "lap",
+        "stint",
+    )
+
+    def __init__(self, recent: int, sector: int, lap: int, stint: int):
+        self.slotId: int = -1
+        self.recent = GapHistory(recent)
+        self.sector = GapHistory(sector)
+        self.lap = GapHistory(lap)
+        self.stint = GapHistory(stint)
+
+    def clear(self):
+        """Clear all tiers"""
+        self.recent.clear()
+        self.sector.clear()
+        self.lap.clear()
+        self.stint.clear()
+
+    def query(self, start: float, end: float, column: int = 0) -> list[tuple[float, float, float, float]]:
+        """Query samples from highest resolution tier that covers range start"""
+        for tier in (self.recent, self.sector, self.lap):
+            if tier.count and tier.first(column) <= start:
+                return tier.query(start, end, column)
+        return self.stint.query(start, end, column)
+
+
+class GapsInfo:
+    """Gaps module output data"""
+
+    __slots__ = (
+        "dataSet",
+        "dataSetVersion",
+    )
+
+    def __init__(self):
+        self.dataSet: tuple[VehicleGapHistory, ...] = ()
+        self.dataSetVersion: int = -1
+
+    def setup(self, recent: int, sector: int, lap: int, stint: int):
+        """Setup gap history size, clear all recorded data"""
+        self.dataSet = tuple(
+            VehicleGapHistory(recent, sector, lap, stint) for _ in range(MAX_VEHICLES)
+        )
+        self.dataSetVersion = -1
+
+    def query(
+        self, index: int, start: float, end: float, column: int = 0
+    ) -> list[tuple[float, float, float, float]]:
+        """Query vehicle gap history within range of elapsed time (column 0) or laps (column 1)"""
+        if 0 <= index < len(self.dataSet):
+            return self.dataSet[index].query(start, end, column)
+        return []
+
+
 class HistoryInfo:
     """History output data"""
 
@@ -380,6 +763,10 @@ class MappingInfo:
         "coordinates",
         "elevations",
         "sectors",
+        "coordinatesRange",
+        "elevationsRange",
+        "coordinatesLod",
+        "elevationsLod",
         "lastModified",
         "pitEntryPosition",
         "pitExitPosition",
@@ -395,6 +782,10 @@ class MappingInfo:
         self.coordinates: tuple[tuple[float, float], ...] | None = None
         self.elevations: tuple[tuple[float, float], ...] | None = None
         self.sectors: tuple[int, int] | None = None
+        self.coordinatesRange: tuple[float, float, float, float] | None = None
+        self.elevationsRange: tuple[float, float, float, float] | None = None
+        self.coordinatesLod: tuple[tuple[float, tuple[int, ...]], ...] = ()
+        self.elevationsLod: tuple[tuple[float, tuple[int, ...]], ...] = ()
         self.lastModified: float = 0.0
         self.pitEntryPosition: float = 0.0
         self.pitExitPosition: float = 0.0
@@ -524,6 +915,7 @@ class VehiclesInfo:
         "nearestTraffic",
         "nearestYellow",
         "leaderBestLapTime",
+        "lapTrace",
     )
 
     def __init__(self):
@@ -538,6 +930,7 @@ class VehiclesInfo:
         self.nearestTraffic: float = MAX_SECONDS
         self.nearestYellow: float = MAX_METERS
         self.leaderBestLapTime: float = MAX_SECONDS
+        self.lapTrace: LapTraceStore = LapTraceStore()
 
 
 class WheelsInfo:
@@ -579,6 +972,7 @@ class ModuleInfo:
         "energy",
         "force",
         "fuel",
+        "gaps",
         "history",
         "hybrid",
         "mapping",
@@ -597,6 +991,7 @@ class ModuleInfo:
         self.energy = FuelInfo()
         self.force = ForceInfo()
         self.fuel = FuelInfo()
+        self.gaps = GapsInfo()
         self.history = HistoryInfo()
         self.hybrid = HybridInfo()
         self.mapping = MappingInfo()
@@ -62,6 +62,7 @@ CFG_FONT_WEIGHT = "font_weight"
 CFG_TARGET_LAPTIME = "target_laptime"
 CFG_TEXT_ALIGNMENT = "text_alignment"
 CFG_MULTIMEDIA_PLUGIN = "multimedia_plugin"
+CFG_RENDERING_BACKEND = "rendering_backend"
 CFG_STATS_CLASSIFICATION = "vehicle_classification"
 CFG_WINDOW_COLOR_THEME = "window_color_theme"
 
@@ -92,6 +93,7 @@ CFG_INTEGER = (
     "^electric_braking_allocation$|"
     "^grid_move_size$|"
     "^lap_time_history_count$|"
+    "^lap_trace_recorded_laps$|"
     "^leading_zero$|"
     "^manual_steering_range$|"
     "^maximum_saving_attempts$|"
@@ -123,10 +125,12 @@ CFG_INTEGER = (
     "font_size|"
     "horizontal_gap|"
     "icon_size|"
+    "interpolation_interval|"
     "inner_gap|"
     "layout|"
     "max_queue|"
     "number_of|"
+    "pool_size|"
     "samples|"
     "sampling_interval|"
     "sound_volume|"
@@ -184,6 +188,7 @@ CHOICE_COMMON = {
     CFG_TARGET_LAPTIME: ["Theoretical", "Personal"],
     CFG_TEXT_ALIGNMENT: ["Left", "Center", "Right"],
     CFG_MULTIMEDIA_PLUGIN: ["WMF", "DirectShow"],
+    CFG_RENDERING_BACKEND: ["Raster", "OpenGL", "Software OpenGL"],
     CFG_STATS_CLASSIFICATION: ["Class - Brand", "Class", "Vehicle"],
     CFG_WINDOW_COLOR_THEME: ["Light", "Dark"],
 }
@@ -48,7 +48,9 @@ from .userfile.json_setting import (
     copy_setting,
     load_setting_json_file,
     load_style_json_file,
+    load_validator_cache,
     save_and_verify_json_file,
+    save_validator_cache,
 )
 from .validator import is_allowed_filename
 
@@ -68,6 +70,7 @@ class FileName:
         "heatmap",
         "tracks",
         "filelock",
+        "validator_cache",
     )
 
     def __init__(self):
@@ -80,6 +83,7 @@ class FileName:
         self.heatmap = f"heatmap{FileExt.JSON}"
         self.tracks = f"tracks{FileExt.JSON}"
         self.filelock = f"config{FileExt.LOCK}"
+        self.validator_cache = f"validator{FileExt.CACHE}"
 
 
 class FilePath:
@@ -142,7 +146,8 @@ class Preset:
     def set_default(self):
         """Set default setting"""
         self.config = MappingProxyType(GLOBAL_DEFAULT)
-        self.setting = MappingProxyType(ChainMap(WIDGET_DEFAULT, MODULE_DEFAULT, COMMON_DEFAULT))
+        # Merge into single dict for faster key lookup, same key order as chained
+        self.setting = MappingProxyType(dict(ChainMap(WIDGET_DEFAULT, MODULE_DEFAULT, COMMON_DEFAULT)))
         self.brakes = MappingProxyType(BRAKES_DEFAULT)
         self.brands = EMPTY_DICT
         self.classes = MappingProxyType(CLASSES_DEFAULT)
@@ -213,6 +218,7 @@ class Setting:
 
     def load_global(self):
         """Load global setting, should only done once per launch"""
+        load_validator_cache(self.filename.validator_cache, self.path.config)
         self.user.config = load_setting_json_file(
             filename=self.filename.config,
             filepath=self.path.config,
@@ -298,6 +304,7 @@ class Setting:
             dict_def=self.default.tracks,
             validator=StyleValidator.tracks,
         )
+        save_validator_cache(self.filename.validator_cache, self.path.config)
         # Assign base setting
         self.overlay = self.user.setting["overlay"]
         self.shared_memory_api = self.user.setting["shared_memory_api"]
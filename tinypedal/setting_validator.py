@@ -23,8 +23,11 @@ Setting validator function
 from __future__ import annotations
 
 import re
+from typing import Any, Callable, Mapping
+from zlib import crc32
 
 from . import regex_pattern as rxp
+from .const_app import VERSION
 from .template.setting_brakes import BRAKEINFO_DEFAULT
 from .template.setting_classes import CLASSINFO_DEFAULT
 from .template.setting_compounds import COMPOUNDINFO_DEFAULT
@@ -165,8 +168,27 @@ class ValueValidator:
         return True
 
 
+def validator_signature() -> str:
+    """Validator signature, changes if APP version or key patterns changed"""
+    patterns = repr((
+        rxp.CFG_BOOL,
+        tuple(rxp.CHOICE_UNITS),
+        tuple(rxp.CHOICE_COMMON),
+        rxp.CFG_COLOR,
+        rxp.CFG_CLOCK_FORMAT,
+        COMMON_STRINGS,
+        rxp.CFG_INTEGER,
+    ))
+    return f"{VERSION}-{crc32(patterns.encode()):08x}"
+
+
 class PresetValidator:
-    """Preset validator"""
+    """Preset validator
+
+    Value validator of each key is selected by matching key name patterns,
+    result is cached by key name, and can be stored & loaded with
+    export_cache() & import_cache() to skip pattern matching on next launch.
+    """
 
     # Set validator methods in ordered list
     _value_validators = (
@@ -179,23 +201,68 @@ class PresetValidator:
         ValueValidator.integer,
         ValueValidator.numeric,
     )
+    # Validator index cache, key = key name, value = index of value validator
+    _validator_index: dict[str, int] = {}
+    _cache_updated = False
+
+    @classmethod
+    def select_validator(cls, key: str, default_value: Any) -> Callable:
+        """Select value validator for key, cached by key name"""
+        index = cls._validator_index.get(key)
+        if index is None:
+            temp_dict = {key: default_value}  # default value is always valid
+            for index, _validator in enumerate(cls._value_validators):
+                if _validator(key, temp_dict):
+                    break
+            cls._validator_index[key] = index
+            cls._cache_updated = True
+        return cls._value_validators[index]
+
+    @classmethod
+    def import_cache(cls, cache: Any) -> bool:
+        """Import validator index cache, ignore if signature mismatched"""
+        if not isinstance(cache, dict) or cache.get("signature") != validator_signature():
+            return False
+        validator_index = cache.get("index")
+        if not isinstance(validator_index, dict):
+            return False
+        total_validators = len(cls._value_validators)
+        cls._validator_index.update(
+            (key, index) for key, index in validator_index.items()
+            if isinstance(key, str) and isinstance(index, int) and 0 <= index < total_validators
+        )
+        return True
+
+    @classmethod
+    def export_cache(cls) -> dict | None:
+        """Export validator index cache, none if not updated since last export"""
+        if not cls._cache_updated:
+            return None
+        cls._cache_updated = False
+        return {"signature": validator_signature(), "index": cls._validator_index.copy()}
 
     @classmethod
-    def remove_invalid_key(cls, key_list_def: tuple[str, ...], dict_user: dict) -> None:
-        """Remove invalid key & value from user dictionary"""
+    def remove_invalid_key(cls, dict_def: Mapping, dict_user: dict) -> None:
+        """Remove invalid key & value from user dictionary
+
+        Value that is identical to default value (same type & value) is skipped.
+        """
         key_list_user = tuple(dict_user)  # create user key list
 
         for key in key_list_user:  # loop through user key list
-            if key not in key_list_def:  # check each user key in default list
+            if key not in dict_def:  # check each user key in default dict
                 dict_user.pop(key)  # remove invalid key
                 continue
+            user_value = dict_user[key]
             # Skip sub_level dict
-            if isinstance(dict_user[key], dict):
+            if isinstance(user_value, dict):
+                continue
+            # Skip default value
+            default_value = dict_def[key]
+            if type(user_value) is type(default_value) and user_value == default_value:
                 continue
             # Validate values
-            for _validator in cls._value_validators:
-                if _validator(key, dict_user):
-                    break
+            cls.select_validator(key, default_value)(key, dict_user)
 
     @staticmethod
     def add_missing_key(key_list_def: tuple[str, ...], dict_user: dict, dict_def: dict) -> bool:
@@ -222,7 +289,7 @@ class PresetValidator:
     def validate_key_pair(cls, dict_user: dict, dict_def: dict) -> None:
         """Create key-only check list, then validate key"""
         key_list_def = tuple(dict_def)
-        cls.remove_invalid_key(key_list_def, dict_user)
+        cls.remove_invalid_key(dict_def, dict_user)
         cls.add_missing_key(key_list_def, dict_user, dict_def)
         cls.sort_key_order(key_list_def, dict_user)
 
@@ -44,11 +44,13 @@ GLOBAL_DEFAULT = {
     },
     "compatibility": {
         "enable_bypass_window_manager": False,
+        "enable_compositor_mode": False,
         "enable_translucent_background": True,
         "enable_window_position_correction": True,
         "enable_x11_platform_plugin_override": False,
         "global_bkg_color": "#000000",
         "multimedia_plugin_on_windows": "WMF",
+        "rendering_backend": "Raster",
     },
     "user_path": {
         "settings_path": "settings/",
@@ -54,6 +54,15 @@ MODULE_DEFAULT = {
         "idle_update_interval": 400,
         "minimum_delta_distance": 5,
     },
+    "module_gaps": {
+        "enable": False,
+        "update_interval": 200,
+        "idle_update_interval": 400,
+        "recent_history_samples": 1500,
+        "sector_history_samples": 600,
+        "lap_history_samples": 1000,
+        "stint_history_samples": 100,
+    },
     "module_hybrid": {
         "enable": True,
         "update_interval": 10,
@@ -79,12 +88,14 @@ MODULE_DEFAULT = {
         "enable": True,
         "update_interval": 100,
         "idle_update_interval": 400,
+        "maximum_update_interval": 30000,
         "url_host": "localhost",
         "url_port_rf2": 5397,
         "url_port_lmu": 6397,
         "connection_timeout": 1,
         "connection_retry": 3,
         "connection_retry_delay": 1,
+        "connection_pool_size": 2,
     },
     "module_sectors": {
         "enable": True,
@@ -105,6 +116,8 @@ MODULE_DEFAULT = {
         "idle_update_interval": 400,
         "lap_difference_ahead_threshold": 0.9,
         "lap_difference_behind_threshold": 0.9,
+        "lap_trace_sampling_distance": 20,
+        "lap_trace_recorded_laps": 2,
     },
     "module_wheels": {
         "enable": True,
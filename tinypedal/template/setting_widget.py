@@ -852,6 +852,8 @@ WIDGET_DEFAULT = {
     "gear": {
         "enable": True,
         "update_interval": 20,
+        "enable_frame_interpolation": False,
+        "frame_interpolation_interval": 16,
         "position_x": 306,
         "position_y": 293,
         "opacity": 0.9,
@@ -1177,6 +1179,8 @@ WIDGET_DEFAULT = {
     "pedal": {
         "enable": True,
         "update_interval": 20,
+        "enable_frame_interpolation": False,
+        "frame_interpolation_interval": 16,
         "position_x": 374,
         "position_y": 401,
         "opacity": 0.9,
@@ -1955,6 +1959,8 @@ WIDGET_DEFAULT = {
     "steering": {
         "enable": True,
         "update_interval": 20,
+        "enable_frame_interpolation": False,
+        "frame_interpolation_interval": 16,
         "position_x": 585,
         "position_y": 358,
         "opacity": 0.9,
@@ -43,9 +43,11 @@ from ..setting import cfg
 from ..units import liter_to_gallon, meter_to_kilometer, meter_to_mile
 from ..userfile.driver_stats import (
     DriverStats,
-    load_stats_json_file,
-    save_stats_json_file,
-    validate_stats_file,
+    delete_stats_track,
+    delete_stats_vehicle,
+    load_stats_tracks,
+    load_stats_vehicles,
+    reset_stats_value,
 )
 from ._common import (
     BaseEditor,
@@ -104,7 +106,6 @@ class DriverStatsViewer(BaseEditor):
         self.set_utility_title("Driver Stats Viewer")
         self.setMinimumSize(UIScaler.size(66), UIScaler.size(30))
 
-        self.stats_temp = {}
         self.selected_stats_key = ""  # get active session key
         self.selected_stats_dict = {}
 
@@ -168,22 +169,13 @@ class DriverStatsViewer(BaseEditor):
 
     def reload_stats(self):
         """Reload stats data"""
-        stats_user = load_stats_json_file(
-            filepath=cfg.path.config,
-        )
-        if stats_user is None:
-            return
-
-        self.stats_temp = validate_stats_file(stats_user)
-
         if self.selected_stats_key:
             last_selected_stats_key = self.selected_stats_key
         else:  # initial load current track name
             last_selected_stats_key = api.read.session.track_name()
 
         self.stats_list.clear()
-        if self.stats_temp:
-            self.stats_list.addItems(sorted(self.stats_temp.keys(), key=sort_stats_key))
+        self.stats_list.addItems(sorted(load_stats_tracks(cfg.path.config), key=sort_stats_key))
         self.stats_list.setCurrentText(last_selected_stats_key)
 
     def refresh_table(self):
@@ -199,7 +191,7 @@ class DriverStatsViewer(BaseEditor):
         self.table_stats.setSortingEnabled(True)
         self.table_stats.sortByColumn(1, Qt.AscendingOrder)  # sort by laptime
 
-    def add_stats_vehicle(self, row_index: int, veh_name: str, veh_data: dict):
+    def add_stats_vehicle(self, row_index: int, veh_name: str, veh_data: DriverStats):
         """Add stats vehicle to table"""
         self.table_stats.insertRow(row_index)
         for column_index, header_key in enumerate(self.table_header_key):
@@ -210,7 +202,7 @@ class DriverStatsViewer(BaseEditor):
                 self.table_stats.setItem(row_index, column_index, item)
                 continue
             # Vehicle stats
-            value_raw = veh_data.get(header_key, 0)
+            value_raw = getattr(veh_data, header_key)
             item = NumericTableItem(value_raw, str(parse_display_value(header_key, value_raw)))
             item.setFlags(Qt.ItemFlags(33))
             item.setTextAlignment(Qt.AlignCenter)
@@ -220,7 +212,7 @@ class DriverStatsViewer(BaseEditor):
         """Select stats key"""
         self.selected_stats_key = self.stats_list.currentText()
         if self.selected_stats_key:
-            self.selected_stats_dict = self.stats_temp[self.selected_stats_key]
+            self.selected_stats_dict = load_stats_vehicles(self.selected_stats_key, cfg.path.config)
             self.refresh_table()
         else:
             self.table_stats.setRowCount(0)  # clear table if no track data found
@@ -237,11 +229,7 @@ class DriverStatsViewer(BaseEditor):
             "This cannot be undone!"
         )
         if self.confirm_operation(message=msg_text):
-            self.stats_temp.pop(self.selected_stats_key, None)  # remove from dict
-            save_stats_json_file(
-                stats_user=self.stats_temp,
-                filepath=cfg.path.config,
-            )
+            delete_stats_track(self.selected_stats_key, cfg.path.config)
             self.reload_stats()
 
     def remove_vehicle(self):
@@ -251,8 +239,7 @@ class DriverStatsViewer(BaseEditor):
             QMessageBox.warning(self, "Error", "No data selected.")
             return
 
-        track_stats = self.stats_temp.get(self.selected_stats_key, None)
-        if not isinstance(track_stats, dict):
+        if not self.selected_stats_key:
             QMessageBox.warning(self, "Error", "No data found.")
             return
 
@@ -262,11 +249,7 @@ class DriverStatsViewer(BaseEditor):
             "This cannot be undone!"
         )
         if self.confirm_operation(message=msg_text):
-            track_stats.pop(selected_vehicle, None)  # remove from dict
-            save_stats_json_file(
-                stats_user=self.stats_temp,
-                filepath=cfg.path.config,
-            )
+            delete_stats_vehicle(self.selected_stats_key, selected_vehicle, cfg.path.config)
             self.reload_stats()
 
     def reset_stat(self, row: int, column: int):
@@ -279,12 +262,7 @@ class DriverStatsViewer(BaseEditor):
             "This cannot be undone!"
         )
         if self.confirm_operation(message=msg_text):
-            default_value = DriverStats.__dict__[selected_column]
-            self.stats_temp[self.selected_stats_key][selected_vehicle][selected_column] = default_value
-            save_stats_json_file(
-                stats_user=self.stats_temp,
-                filepath=cfg.path.config,
-            )
+            reset_stats_value(self.selected_stats_key, selected_vehicle, selected_column, cfg.path.config)
             self.reload_stats()
 
     def open_context_menu(self, position: QPoint):
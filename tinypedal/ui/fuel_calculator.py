@@ -35,6 +35,7 @@ from PySide2.QtWidgets import (
     QGridLayout,
     QHBoxLayout,
     QHeaderView,
+    QInputDialog,
     QLabel,
     QLineEdit,
     QMessageBox,
@@ -49,11 +50,12 @@ from PySide2.QtWidgets import (
 
 from .. import calculation as calc
 from ..api_control import api
-from ..const_file import FileFilter
+from ..const_file import FileExt, FileFilter
 from ..formatter import laptime_string_to_seconds
 from ..module_info import ConsumptionDataSet, minfo
 from ..setting import cfg
 from ..units import set_symbol_fuel, set_unit_fuel
+from ..userfile.combo_store import combo_store
 from ..userfile.consumption_history import load_consumption_history_file
 from ._common import BaseDialog, UIScaler
 
@@ -175,11 +177,36 @@ class FuelCalculator(BaseDialog):
         history_data = load_consumption_history_file(
             filepath=filepath,
             filename=filename,
+            from_store=False,
         )
         self.refresh_table(history_data)
         self.fill_in_data(history_data)
         self.status_bar.showMessage(f"File Source: {filename}")
 
+    def load_stored_data(self):
+        """Load history data from combo store"""
+        extension = FileExt.CONSUMPTION
+        combo_list = [
+            name[:-len(extension)]
+            for name in combo_store.get(cfg.path.fuel_delta).names(extension)
+        ]
+        if not combo_list:
+            QMessageBox.warning(self, "Error", "No data found.")
+            return
+
+        filename, confirmed = QInputDialog.getItem(
+            self, "Load Stored", "Select track & vehicle combo:", combo_list, 0, False)
+        if not confirmed:
+            return
+
+        history_data = load_consumption_history_file(
+            filepath=cfg.path.fuel_delta,
+            filename=filename,
+        )
+        self.refresh_table(history_data)
+        self.fill_in_data(history_data)
+        self.status_bar.showMessage(f"Stored Source: {filename}")
+
     def load_live_data(self):
         """Load history data from live session"""
         self.refresh_table(minfo.history.consumptionDataSet)
@@ -288,6 +315,10 @@ class FuelCalculator(BaseDialog):
         button_loadlive.clicked.connect(self.load_live_data)
         button_loadlive.setFocusPolicy(Qt.NoFocus)
 
+        button_loadstored = QPushButton("Load Stored")
+        button_loadstored.clicked.connect(self.load_stored_data)
+        button_loadstored.setFocusPolicy(Qt.NoFocus)
+
         button_loadfile = QPushButton("Load File")
         button_loadfile.clicked.connect(self.load_file)
         button_loadfile.setFocusPolicy(Qt.NoFocus)
@@ -315,6 +346,7 @@ class FuelCalculator(BaseDialog):
 
         layout_button = QHBoxLayout()
         layout_button.addWidget(button_loadlive, stretch=1)
+        layout_button.addWidget(button_loadstored, stretch=1)
         layout_button.addWidget(button_loadfile, stretch=1)
         layout_button.addStretch(1)
         layout_button.addWidget(self.button_toggle, stretch=2)
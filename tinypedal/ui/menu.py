@@ -32,6 +32,7 @@ from ..const_file import ConfigType
 from ..module_info import minfo
 from ..overlay_control import octrl
 from ..setting import cfg
+from ..userfile.combo_store import combo_store
 from .about import About
 from .brake_editor import BrakeEditor
 from .config import FontConfig, UserConfig
@@ -170,7 +171,8 @@ class ResetDataMenu(QMenu):
         """Reset deltabest data"""
         self.__confirmation(
             data_type="delta best",
-            extension="csv",
+            extension="delta",
+            legacy_extension="csv",
             filepath=cfg.path.delta_best,
             filename=api.read.check.combo_id(),
         )
@@ -179,7 +181,8 @@ class ResetDataMenu(QMenu):
         """Reset energy delta data"""
         self.__confirmation(
             data_type="energy delta",
-            extension="energy",
+            extension="energydelta",
+            legacy_extension="energy",
             filepath=cfg.path.energy_delta,
             filename=api.read.check.combo_id(),
         )
@@ -188,7 +191,8 @@ class ResetDataMenu(QMenu):
         """Reset fuel delta data"""
         self.__confirmation(
             data_type="fuel delta",
-            extension="fuel",
+            extension="fueldelta",
+            legacy_extension="fuel",
             filepath=cfg.path.fuel_delta,
             filename=api.read.check.combo_id(),
         )
@@ -221,7 +225,9 @@ class ResetDataMenu(QMenu):
             filename=api.read.check.track_id(),
         )
 
-    def __confirmation(self, data_type: str, extension: str, filepath: str, filename: str) -> bool:
+    def __confirmation(
+        self, data_type: str, extension: str, filepath: str, filename: str,
+        legacy_extension: str = "") -> bool:
         """Message confirmation, returns true if file deleted"""
         # Check if on track
         if api.state:
@@ -231,9 +237,14 @@ class ResetDataMenu(QMenu):
                 "Cannot reset data while on track.",
             )
             return False
-        # Check if file exist
+        # Check if data exist in combo store or file
+        store = combo_store.get(filepath)
+        store_name = f"{filename}.{extension}"
         filename_full = f"{filepath}{filename}.{extension}"
-        if not os.path.exists(filename_full):
+        filename_legacy = f"{filepath}{filename}.{legacy_extension}" if legacy_extension else ""
+        is_stored = store_name in store.names(f".{extension}")
+        if not is_stored and not os.path.exists(filename_full) and not (
+            filename_legacy and os.path.exists(filename_legacy)):
             QMessageBox.warning(
                 self._parent,
                 "Error",
@@ -253,8 +264,12 @@ class ResetDataMenu(QMenu):
         )
         if delete_msg != QMessageBox.Yes:
             return False
-        # Delete file
-        os.remove(filename_full)
+        # Delete data from combo store, also legacy file to prevent importing again
+        if is_stored:
+            store.delete(store_name)
+        for filename_delete in (filename_full, filename_legacy):
+            if filename_delete and os.path.exists(filename_delete):
+                os.remove(filename_delete)
         QMessageBox.information(
             self._parent,
             f"Reset {data_type.title()}",
@@ -43,7 +43,7 @@ from PySide2.QtWidgets import (
 from .. import calculation as calc
 from ..const_file import ConfigType, FileExt, FileFilter
 from ..setting import cfg
-from ..userfile.track_map import load_track_map_file
+from ..userfile.track_map import load_track_map_data
 from ._common import BaseDialog, CompactButton, UIScaler
 from .config import UserConfig
 
@@ -109,6 +109,8 @@ class MapView(QWidget):
         self.raw_dists = None
 
         self.map_path = None
+        self.map_lod = ()
+        self.map_lod_nodes = None
         self.sfinish_path = None
         self.sector1_path = None
         self.sector2_path = None
@@ -270,6 +272,8 @@ class MapView(QWidget):
         """Update control"""
         self.map_scale = self.spinbox_map_scale.value()
         self.curve_nodes = self.spinbox_nodes.value()
+        if self.raw_coords and self.map_lod_nodes is not self.select_lod_nodes():
+            self.map_path = self.create_map_outline(self.raw_coords)
         self.update()
 
     def reset_control(self):
@@ -358,20 +362,26 @@ class MapView(QWidget):
             QMessageBox.warning(self, "Error", msg_text)
             return
 
-        self.raw_coords, self.raw_dists, sector_index = load_track_map_file(
+        map_data = load_track_map_data(
             filepath=filepath,
             filename=filename,
         )
 
-        if self.raw_coords and len(self.raw_coords) > 9:
+        if map_data and len(map_data.coords) > 9:
+            self.raw_coords = map_data.coords
+            self.raw_dists = map_data.dists
             self.map_length = self.raw_dists[-1][0]
             self.map_nodes = len(self.raw_coords)
             self.map_filename = filename
-            self.create_map_path(self.raw_coords, sector_index)
+            self.map_lod = map_data.coords_lod
+            self.create_map_path(self.raw_coords, map_data.sectors)
         else:
+            self.raw_coords = None
+            self.raw_dists = None
             self.map_length = 0
             self.map_nodes = 0
             self.map_filename = ""
+            self.map_lod = ()
             msg_text = (
                 "Unable to load track map file from<br>"
                 f"<b>{filepath}{filename}{FileExt.SVG}</b><br><br>"
@@ -385,19 +395,11 @@ class MapView(QWidget):
 
     def create_map_path(self, raw_coords, sectors_index):
         """Create map path"""
-        map_path = QPainterPath()
+        map_path = self.create_map_outline(raw_coords)
         sfinish_path = QPainterPath()
         sector1_path = QPainterPath()
         sector1_path = QPainterPath()
 
-        for index, coords in enumerate(raw_coords):
-            if index == 0:
-                map_path.moveTo(*coords)
-            else:
-                map_path.lineTo(*coords)
-        # Close map loop if start & end distance less than 500 meters
-        if calc.distance(raw_coords[0], raw_coords[-1]) < 500:
-            map_path.closeSubpath()
         # Create start/finish path
         sfinish_path = self.create_sector_path(
             sfinish_path, self.ecfg["start_line_length"], 0, 1)
@@ -414,6 +416,26 @@ class MapView(QWidget):
         self.sector1_path = sector1_path
         self.sector2_path = sector1_path
 
+    def create_map_outline(self, raw_coords):
+        """Create map outline path from level of detail nodes of current scale"""
+        map_path = QPainterPath()
+        self.map_lod_nodes = self.select_lod_nodes()
+        if self.map_lod_nodes is None:
+            lod_nodes = range(len(raw_coords))
+        else:
+            lod_nodes = self.map_lod_nodes
+        map_path.moveTo(*raw_coords[lod_nodes[0]])
+        for index in lod_nodes[1:]:
+            map_path.lineTo(*raw_coords[index])
+        # Close map loop if start & end distance less than 500 meters
+        if calc.distance(raw_coords[0], raw_coords[-1]) < 500:
+            map_path.closeSubpath()
+        return map_path
+
+    def select_lod_nodes(self):
+        """Select map level of detail nodes within quarter pixel of current scale"""
+        return calc.select_lod_nodes(self.map_lod, 0.25 / self.map_scale)
+
     def create_sector_path(self, sector_path, length, node_idx1, node_idx2):
         """Create sector line"""
         pos_x1, pos_y1, pos_x2, pos_y2 = calc.line_intersect_coords(
@@ -20,10 +20,14 @@
 Brand logo file function
 """
 
+from __future__ import annotations
+
 import os
+import threading
+from collections import OrderedDict
 
 from PySide2.QtCore import Qt
-from PySide2.QtGui import QPixmap
+from PySide2.QtGui import QImage, QPixmap
 
 from ..const_file import FileExt
 
@@ -35,18 +39,139 @@ def exceeded_max_logo_width(
     return org_width * max_height / max(org_height, 1) > max_width
 
 
-def load_brand_logo_file(
+def load_brand_logo_image(
     filepath:str, filename: str, max_width: int, max_height: int, extension: str = FileExt.PNG
-) -> QPixmap:
-    """Load brand logo file (*.png)"""
+) -> QImage:
+    """Load brand logo image file (*.png), can be used outside GUI thread"""
     filename_full = f"{filepath}{filename}{extension}"
     # Check existing file and size < 1mb
     if not os.path.exists(filename_full) or os.path.getsize(filename_full) > 1024000:
-        return QPixmap()
+        return QImage()
     # Load and scale logo
-    logo = QPixmap(filename_full)
+    logo = QImage(filename_full)
+    if logo.isNull():
+        return logo
     if exceeded_max_logo_width(logo.width(), logo.height(), max_width, max_height):
         logo_scaled = logo.scaledToWidth(max_width, mode=Qt.SmoothTransformation)
     else:
         logo_scaled = logo.scaledToHeight(max_height, mode=Qt.SmoothTransformation)
     return logo_scaled
+
+
+def load_brand_logo_file(
+    filepath:str, filename: str, max_width: int, max_height: int, extension: str = FileExt.PNG
+) -> QPixmap:
+    """Load brand logo file (*.png)"""
+    return QPixmap.fromImage(
+        load_brand_logo_image(filepath, filename, max_width, max_height, extension))
+
+
+class BrandLogoCache:
+    """Brand logo cache
+
+    Shared LRU pixmap cache for all widgets, key = (brand name, width, height).
+    Logo files are decoded & scaled in background thread,
+    and converted to pixmap on GUI thread on first request.
+    Decoded image from before clearing cache is discarded.
+    """
+
+    __slots__ = (
+        "_max_size",
+        "_pixmaps",
+        "_images",
+        "_queue",
+        "_sizes",
+        "_cond",
+        "_started",
+        "_generation",
+    )
+
+    def __init__(self, max_size: int = 200):
+        self._max_size = max(max_size, 1)
+        self._pixmaps: OrderedDict[tuple[str, int, int], QPixmap] = OrderedDict()
+        self._images: OrderedDict[tuple[str, int, int], QImage] = OrderedDict()
+        self._queue: dict[tuple[str, int, int], str] = {}
+        self._sizes: dict[tuple[int, int], int] = {}
+        self._cond = threading.Condition()
+        self._started = False
+        self._generation = 0  # increased on clearing cache
+
+    def add_size(self, width: int, height: int):
+        """Add logo size used by widget, for prewarming"""
+        key = (width, height)
+        self._sizes[key] = self._sizes.get(key, 0) + 1
+
+    def remove_size(self, width: int, height: int):
+        """Remove logo size used by widget"""
+        key = (width, height)
+        count = self._sizes.get(key, 0) - 1
+        if count > 0:
+            self._sizes[key] = count
+        else:
+            self._sizes.pop(key, None)
+
+    def get(self, filepath: str, brand_name: str, width: int, height: int) -> QPixmap | None:
+        """Get brand logo pixmap (GUI thread only)
+
+        Returns:
+            QPixmap, or None if logo is being loaded in background.
+        """
+        key = (brand_name, width, height)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+            return pixmap
+        with self._cond:
+            image = self._images.pop(key, None)
+            if image is None:
+                self.__request(filepath, key)
+                return None
+        pixmap = self._pixmaps[key] = QPixmap.fromImage(image)
+        if len(self._pixmaps) > self._max_size:
+            self._pixmaps.popitem(last=False)
+        return pixmap
+
+    def prewarm(self, filepath: str, brand_names: set[str]):
+        """Load brand logos in background for all widget logo sizes"""
+        with self._cond:
+            for width, height in tuple(self._sizes):
+                for brand_name in brand_names:
+                    key = (brand_name, width, height)
+                    if key not in self._pixmaps and key not in self._images:
+                        self.__request(filepath, key)
+
+    def clear(self):
+        """Clear cache"""
+        with self._cond:
+            self._queue.clear()
+            self._images.clear()
+            self._pixmaps.clear()
+            self._generation += 1
+
+    def __request(self, filepath: str, key: tuple[str, int, int]):
+        """Add decoding request to queue (lock held)"""
+        self._queue[key] = filepath
+        if not self._started:
+            self._started = True
+            threading.Thread(target=self.__decoding, daemon=True).start()
+        self._cond.notify_all()
+
+    def __decoding(self):
+        """Decoding thread"""
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._queue)
+                key = next(iter(self._queue))
+                filepath = self._queue[key]  # keep in queue while decoding
+                generation = self._generation
+            image = load_brand_logo_image(filepath, *key)
+            with self._cond:
+                if generation != self._generation:  # cache cleared while decoding
+                    continue
+                self._queue.pop(key, None)
+                self._images[key] = image
+                if len(self._images) > self._max_size:
+                    self._images.popitem(last=False)
+
+
+logo_cache = BrandLogoCache()
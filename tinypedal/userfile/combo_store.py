@@ -0,0 +1,455 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Combo user data store
+
+Per combo user data (delta best, sector best, fuel/energy delta, consumption history)
+are stored as packed payloads in one data file, with an index file that maps
+entry name to payload offset, so that loading session data only requires
+one open and a few seeks. Entry name is the same as legacy file name
+(combo id + extension), legacy files are imported on first load,
+and original files are kept.
+
+Data file structure (little-endian):
+    0: header (12 bytes):
+        magic bytes (4 bytes, b"TPCD"), format version (uint16), padding (2 bytes),
+        generation (uint32, random value, changed on every compaction)
+   12: records, each record contains:
+        record header (10 bytes): name length (uint16), payload length (uint32), payload crc32 (uint32)
+        name (utf-8), payload
+
+Index file structure (little-endian):
+    0: header (24 bytes):
+        magic bytes (4 bytes, b"TPCI"), format version (uint16), padding (2 bytes),
+        generation (uint32, same as data file), number of entries (uint32),
+        end offset of indexed records (uint64)
+   24: entries, each entry contains:
+        entry header (18 bytes): payload offset (uint64), payload length (uint32),
+        payload crc32 (uint32), name length (uint16)
+        name (utf-8)
+
+Records are only appended, newer record replaces older record of the same name in index.
+Record with empty payload is a deletion marker, which removes entry from index.
+Records appended after indexed end offset (such as interrupted index saving) are recovered
+on opening, and index is rebuilt from records if index file is missing or mismatched.
+Data file is compacted once obsolete records take more than half of file size.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import struct
+import threading
+from functools import partial
+from typing import BinaryIO
+from zlib import crc32
+
+from ..const_file import FileExt, StoreFile
+from .file_writer import fwriter, write_file_atomic
+
+logger = logging.getLogger(__name__)
+
+DATA_MAGIC = b"TPCD"
+DATA_VERSION = 1
+DATA_HEADER = struct.Struct("<4sH2xI")
+RECORD_HEADER = struct.Struct("<HII")
+INDEX_MAGIC = b"TPCI"
+INDEX_VERSION = 1
+INDEX_HEADER = struct.Struct("<4sH2xIIQ")
+INDEX_ENTRY = struct.Struct("<QIIH")
+COMPACT_MIN_SIZE = 1024 * 1024  # minimum obsolete bytes before compaction
+DELETED = b""  # empty payload, deletion marker
+
+
+def new_generation() -> int:
+    """New random data file generation"""
+    return int.from_bytes(os.urandom(4), "little")
+
+
+class ComboStore:
+    """Combo user data store
+
+    Store files are opened on first access. Reading is thread-safe,
+    writing is queued to background file writer, and pending data
+    is returned on reading until written. Data failed to write is
+    kept in pending data and logged as not saved.
+
+    Args:
+        filepath: store file path.
+        filename: store file name (without extension).
+    """
+
+    __slots__ = (
+        "_filepath",
+        "_filename_index",
+        "_filename_data",
+        "_lock",
+        "_file",
+        "_index",
+        "_pending",
+        "_generation",
+        "_data_end",
+        "_obsolete",
+    )
+
+    def __init__(self, filepath: str, filename: str = StoreFile.COMBO):
+        self._filepath = filepath
+        self._filename_index = f"{filepath}{filename}{FileExt.COMBO_INDEX}"
+        self._filename_data = f"{filepath}{filename}{FileExt.COMBO_DATA}"
+        self._lock = threading.Lock()
+        self._file: BinaryIO | None = None
+        # Entry name: (payload offset, payload length, payload crc32)
+        self._index: dict[str, tuple[int, int, int]] = {}
+        self._pending: dict[str, bytes] = {}
+        self._generation = 0
+        self._data_end = 0  # end offset of indexed records
+        self._obsolete = 0  # size of obsolete records
+
+    def read(self, name: str) -> bytes:
+        """Read entry payload
+
+        Raises:
+            FileNotFoundError: if entry not exists.
+            ValueError: if corrupted payload.
+        """
+        with self._lock:
+            data = self._pending.get(name)
+            if data is DELETED:
+                raise FileNotFoundError(name)
+            if data is not None:
+                return data
+            if not self.__open(create=False):
+                raise FileNotFoundError(name)
+            entry = self._index.get(name)
+            if entry is None:
+                raise FileNotFoundError(name)
+            offset, length, checksum = entry
+            self._file.seek(offset)
+            data = self._file.read(length)
+        if len(data) != length or crc32(data) != checksum:
+            raise ValueError(f"corrupted {name} data")
+        return data
+
+    def write(self, name: str, data: bytes):
+        """Write entry payload (queued to background writer)"""
+        if not data:  # empty payload is reserved for deletion marker
+            return
+        with self._lock:
+            self._pending[name] = data
+        fwriter.write(f"{self._filepath}{name}", partial(self.__append, name, data))
+
+    def delete(self, name: str):
+        """Delete entry (queued to background writer)"""
+        with self._lock:
+            self._pending[name] = DELETED
+        fwriter.write(f"{self._filepath}{name}", partial(self.__append, name, DELETED))
+
+    def names(self, extension: str = "") -> list[str]:
+        """Get sorted entry name list, filtered by extension"""
+        with self._lock:
+            self.__open(create=False)
+            return sorted(
+                name for name in self._index.keys() | self._pending.keys()
+                if name.endswith(extension) and self._pending.get(name) is not DELETED
+            )
+
+    def close(self):
+        """Close store files"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self._index.clear()
+
+    def __open(self, create: bool = True) -> bool:
+        """Open data file & load index if not opened, returns true if opened
+
+        Args:
+            create: create new data file if not exists.
+        """
+        if self._file is not None:
+            return True
+        if not create and not os.path.exists(self._filename_data):
+            return False
+        try:
+            if os.path.exists(self._filename_data):
+                self._file = open(self._filename_data, "r+b")
+                if not self.__load_data_header():
+                    self._file.close()
+                    os.replace(self._filename_data, f"{self._filename_data}{FileExt.BAK}")
+                    logger.info("USERDATA: invalid %s, backup created", self._filename_data)
+                    self.__create()
+                else:
+                    self.__load_index()
+                    self.__recover()
+            else:
+                self.__create()
+            return True
+        except OSError as error:
+            logger.error("USERDATA: unable to open %s, %s", self._filename_data, error)
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            return False
+
+    def __create(self):
+        """Create new data file"""
+        self._file = open(self._filename_data, "w+b")
+        self._generation = new_generation()
+        self._file.write(DATA_HEADER.pack(DATA_MAGIC, DATA_VERSION, self._generation))
+        self._file.flush()
+        self._index = {}
+        self._data_end = DATA_HEADER.size
+        self._obsolete = 0
+
+    def __load_data_header(self) -> bool:
+        """Load data file header, returns true if valid"""
+        try:
+            magic, version, generation = DATA_HEADER.unpack(self._file.read(DATA_HEADER.size))
+        except struct.error:
+            return False
+        if magic != DATA_MAGIC or version > DATA_VERSION:
+            return False
+        self._generation = generation
+        return True
+
+    def __load_index(self):
+        """Load index file, reset index if invalid"""
+        self._index = {}
+        self._data_end = DATA_HEADER.size
+        try:
+            with open(self._filename_index, "rb") as file:
+                raw_bytes = file.read()
+            magic, version, generation, count, data_end = INDEX_HEADER.unpack_from(raw_bytes)
+            if (magic != INDEX_MAGIC or version > INDEX_VERSION or generation != self._generation
+                or data_end > os.path.getsize(self._filename_data)):
+                raise ValueError
+            index = {}
+            offset = INDEX_HEADER.size
+            for _ in range(count):
+                payload_offset, length, checksum, name_length = INDEX_ENTRY.unpack_from(raw_bytes, offset)
+                offset += INDEX_ENTRY.size
+                name = raw_bytes[offset:offset + name_length].decode("utf-8")
+                offset += name_length
+                index[name] = (payload_offset, length, checksum)
+            self._index = index
+            self._data_end = data_end
+        except FileNotFoundError:
+            pass
+        except (struct.error, UnicodeDecodeError, ValueError):
+            logger.info("USERDATA: invalid %s, rebuild index", self._filename_index)
+        self._obsolete = self._data_end - DATA_HEADER.size - sum(
+            RECORD_HEADER.size + len(name.encode("utf-8")) + length
+            for name, (_, length, _) in self._index.items()
+        )
+
+    def __recover(self):
+        """Recover records after indexed end offset, discard incomplete record"""
+        self._file.seek(self._data_end)
+        raw_bytes = self._file.read()
+        if not raw_bytes:
+            return
+        offset = 0
+        while offset + RECORD_HEADER.size <= len(raw_bytes):
+            name_length, length, checksum = RECORD_HEADER.unpack_from(raw_bytes, offset)
+            name_start = offset + RECORD_HEADER.size
+            payload_start = name_start + name_length
+            payload_end = payload_start + length
+            if payload_end > len(raw_bytes) or crc32(raw_bytes[payload_start:payload_end]) != checksum:
+                break
+            try:
+                name = raw_bytes[name_start:payload_start].decode("utf-8")
+            except UnicodeDecodeError:
+                break
+            self.__update_index(name, self._data_end + payload_start, length, checksum)
+            offset = payload_end
+        if offset < len(raw_bytes):
+            self._file.truncate(self._data_end + offset)
+            logger.info(
+                "USERDATA: discarded %s bytes of incomplete record in %s",
+                len(raw_bytes) - offset, self._filename_data)
+        if offset:
+            self._data_end += offset
+            logger.info("USERDATA: recovered %s bytes of records in %s", offset, self._filename_data)
+            self.__save_index()
+
+    def __update_index(self, name: str, offset: int, length: int, checksum: int):
+        """Update index entry, count replaced record & deletion marker as obsolete"""
+        name_length = len(name.encode("utf-8"))
+        last_entry = self._index.pop(name, None)
+        if last_entry is not None:
+            self._obsolete += RECORD_HEADER.size + name_length + last_entry[1]
+        if length:
+            self._index[name] = (offset, length, checksum)
+        else:
+            self._obsolete += RECORD_HEADER.size + name_length
+
+    def __save_index(self) -> bool:
+        """Save index file"""
+        packed = [INDEX_HEADER.pack(
+            INDEX_MAGIC, INDEX_VERSION, self._generation, len(self._index), self._data_end)]
+        for name, (offset, length, checksum) in self._index.items():
+            name_bytes = name.encode("utf-8")
+            packed.append(INDEX_ENTRY.pack(offset, length, checksum, len(name_bytes)))
+            packed.append(name_bytes)
+        return write_file_atomic(self._filename_index, b"".join(packed), 1)
+
+    def __append(self, name: str, data: bytes) -> bool:
+        """Append record to data file & update index (run in writer thread)"""
+        with self._lock:
+            if data is DELETED and (not self.__open(create=False) or name not in self._index):
+                if self._pending.get(name) is data:  # nothing to delete
+                    self._pending.pop(name)
+                return True
+            if not self.__open():
+                self.__log_unsaved(name)
+                return False
+            name_bytes = name.encode("utf-8")
+            checksum = crc32(data)
+            try:
+                self._file.seek(self._data_end)
+                self._file.write(RECORD_HEADER.pack(len(name_bytes), len(data), checksum))
+                self._file.write(name_bytes)
+                self._file.write(data)
+                self._file.flush()
+                os.fsync(self._file.fileno())
+            except OSError as error:
+                logger.error("USERDATA: failed saving %s, %s", name, error)
+                self.__log_unsaved(name)
+                return False
+            payload_offset = self._data_end + RECORD_HEADER.size + len(name_bytes)
+            self.__update_index(name, payload_offset, len(data), checksum)
+            self._data_end = payload_offset + len(data)
+            if self._pending.get(name) is data:
+                self._pending.pop(name)
+            if self._obsolete > COMPACT_MIN_SIZE and self._obsolete * 2 > self._data_end:
+                self.__compact()
+            else:
+                self.__save_index()
+            return True
+
+    def __log_unsaved(self, name: str):
+        """Log unsaved entry, which is kept in pending data until next write of the same name"""
+        logger.error(
+            "USERDATA: %s not saved to %s, kept in memory for current session only",
+            name, self._filename_data)
+
+    def __compact(self):
+        """Compact data file, remove obsolete records"""
+        filename_temp = f"{self._filename_data}{FileExt.TMP}"
+        generation = new_generation()
+        index = {}
+        try:
+            with open(filename_temp, "wb") as tempfile:
+                tempfile.write(DATA_HEADER.pack(DATA_MAGIC, DATA_VERSION, generation))
+                data_end = DATA_HEADER.size
+                for name, (offset, length, checksum) in self._index.items():
+                    self._file.seek(offset)
+                    name_bytes = name.encode("utf-8")
+                    tempfile.write(RECORD_HEADER.pack(len(name_bytes), length, checksum))
+                    tempfile.write(name_bytes)
+                    tempfile.write(self._file.read(length))
+                    data_end += RECORD_HEADER.size + len(name_bytes)
+                    index[name] = (data_end, length, checksum)
+                    data_end += length
+                tempfile.flush()
+                os.fsync(tempfile.fileno())
+            self._file.close()
+            self._file = None
+            os.replace(filename_temp, self._filename_data)
+        except OSError as error:
+            logger.error("USERDATA: failed compacting %s, %s", self._filename_data, error)
+            if os.path.exists(filename_temp):
+                os.remove(filename_temp)
+            if self._file is None:  # reload from original file
+                self.__open()
+            else:
+                self.__save_index()
+            return
+        logger.info(
+            "USERDATA: compacted %s, %s bytes removed", self._filename_data, self._data_end - data_end)
+        self._generation = generation
+        self._index = index
+        self._data_end = data_end
+        self._obsolete = 0
+        self.__save_index()
+        self.__open()
+
+
+class ComboStoreSet:
+    """Combo store set, one store per user data path"""
+
+    __slots__ = (
+        "_stores",
+        "_lock",
+    )
+
+    def __init__(self):
+        self._stores: dict[str, ComboStore] = {}
+        self._lock = threading.Lock()
+
+    def get(self, filepath: str) -> ComboStore:
+        """Get combo store of user data path"""
+        with self._lock:
+            store = self._stores.get(filepath)
+            if store is None:
+                store = self._stores[filepath] = ComboStore(filepath)
+            return store
+
+    def close(self):
+        """Close all stores, call after all pending writes finished"""
+        with self._lock:
+            for store in self._stores.values():
+                store.close()
+            self._stores.clear()
+
+
+def load_combo_data(filepath: str, filename: str, extension: str) -> bytes:
+    """Load combo data from store, import from legacy file if not exist in store
+
+    Raises:
+        FileNotFoundError: if neither store entry nor legacy file exists.
+    """
+    store = combo_store.get(filepath)
+    name = f"{filename}{extension}"
+    try:
+        return store.read(name)
+    except FileNotFoundError:
+        pass
+    except ValueError as error:
+        logger.info("USERDATA: %s, fallback to legacy file", error)
+    with open(f"{filepath}{name}", "rb") as file:
+        data = file.read()
+    store.write(name, data)
+    logger.info("USERDATA: %s imported to %s%s", name, StoreFile.COMBO, FileExt.COMBO_DATA)
+    return data
+
+
+def save_combo_data(filepath: str, filename: str, extension: str, data: bytes) -> None:
+    """Save combo data to store (queued to background writer)"""
+    combo_store.get(filepath).write(f"{filename}{extension}", data)
+
+
+def delete_combo_data(filepath: str, filename: str, extension: str) -> None:
+    """Delete combo data from store (queued to background writer)"""
+    combo_store.get(filepath).delete(f"{filename}{extension}")
+
+
+combo_store = ComboStoreSet()
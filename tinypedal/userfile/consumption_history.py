@@ -23,21 +23,32 @@ Consumption history file function
 from __future__ import annotations
 
 import csv
+import io
 import logging
 
 from ..const_file import FileExt
 from ..module_info import ConsumptionDataSet
 from ..validator import dict_value_type, invalid_save_name
+from .combo_store import load_combo_data, save_combo_data
 
 logger = logging.getLogger(__name__)
 
 
 def load_consumption_history_file(
-    filepath: str, filename: str, extension: str = FileExt.CONSUMPTION
+    filepath: str, filename: str, extension: str = FileExt.CONSUMPTION, from_store: bool = True
 ) -> tuple[ConsumptionDataSet, ...]:
-    """Load fuel/energy consumption history file (*.consumption)"""
+    """Load fuel/energy consumption history file (*.consumption)
+
+    Args:
+        from_store: load from combo store, otherwise load from file directly.
+    """
     try:
-        with open(f"{filepath}{filename}{extension}", newline="", encoding="utf-8") as csvfile:
+        if from_store:
+            raw_bytes = load_combo_data(filepath, filename, extension)
+        else:
+            with open(f"{filepath}{filename}{extension}", "rb") as file:
+                raw_bytes = file.read()
+        with io.StringIO(raw_bytes.decode("utf-8"), newline="") as csvfile:
             data_reader = csv.DictReader(csvfile, restval="", restkey="unknown")
             default_data = ConsumptionDataSet._field_defaults
             dataset = tuple(
@@ -57,11 +68,11 @@ def load_consumption_history_file(
 def save_consumption_history_file(
     dataset: tuple, filepath: str, filename: str, extension: str = FileExt.CONSUMPTION
 ) -> None:
-    """Save fuel/energy consumption history file (*.consumption)"""
+    """Save fuel/energy consumption history file (*.consumption) to combo store"""
     if len(dataset) < 2 or invalid_save_name(filename):
         return
-    with open(f"{filepath}{filename}{extension}", "w", newline="", encoding="utf-8") as csvfile:
+    with io.StringIO(newline="") as csvfile:
         data_writer = csv.writer(csvfile, quoting=csv.QUOTE_NONNUMERIC)
         data_writer.writerow(ConsumptionDataSet._fields)  # write field name as column header
         data_writer.writerows(dataset)
-        logger.info("USERDATA: %s%s saved", filename, extension)
+        save_combo_data(filepath, filename, extension, csvfile.getvalue().encode("utf-8"))
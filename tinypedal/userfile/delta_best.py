@@ -22,23 +22,22 @@ Delta best file function
 
 from __future__ import annotations
 
-import csv
 import logging
 
 from ..const_file import FileExt
 from ..validator import invalid_save_name, valid_delta_set
+from .delta_trace import load_delta_trace_file, save_delta_trace_file
 
 logger = logging.getLogger(__name__)
 
 
 def load_delta_best_file(
-    filepath: str, filename: str, defaults: tuple, extension: str = FileExt.CSV
+    filepath: str, filename: str, defaults: tuple, extension: str = FileExt.DELTA,
+    legacy_extension: str = FileExt.CSV,
 ) -> tuple[tuple, float]:
-    """Load delta best file (*.csv)"""
+    """Load delta best file (*.delta), migrate from legacy file (*.csv) if not exist"""
     try:
-        with open(f"{filepath}{filename}{extension}", newline="", encoding="utf-8") as csvfile:
-            data_reader = csv.reader(csvfile, quoting=csv.QUOTE_NONNUMERIC)
-            temp_list = tuple(tuple(data) for data in data_reader)
+        temp_list = load_delta_trace_file(filepath, filename, extension, legacy_extension)
         # Validate data
         bestlist = valid_delta_set(temp_list)
         laptime_best = bestlist[-1][1]
@@ -51,12 +50,9 @@ def load_delta_best_file(
 
 
 def save_delta_best_file(
-    filepath: str, filename: str, dataset: tuple, extension: str = FileExt.CSV
+    filepath: str, filename: str, dataset: tuple, extension: str = FileExt.DELTA
 ) -> None:
-    """Save delta best file (*.csv)"""
+    """Save delta best file (*.delta)"""
     if len(dataset) < 10 or invalid_save_name(filename):
         return
-    with open(f"{filepath}{filename}{extension}", "w", newline="", encoding="utf-8") as csvfile:
-        data_writer = csv.writer(csvfile)
-        data_writer.writerows(dataset)
-        logger.info("USERDATA: %s%s saved", filename, extension)
+    save_delta_trace_file(filepath, filename, extension, dataset)
@@ -0,0 +1,152 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Delta trace binary file function
+
+Binary file structure (little-endian header, 16 bytes):
+    0: magic bytes (4 bytes, b"TPDT")
+    4: format version (uint16)
+    6: number of columns (uint16)
+    8: number of rows (uint32)
+   12: column type code (1 byte, "f" float32, "d" float64)
+   13: byte order of column data (uint8, 0 little-endian, 1 big-endian)
+   14: padding (2 bytes)
+   16: packed columns, stored column by column
+"""
+
+from __future__ import annotations
+
+import csv
+import logging
+import struct
+import sys
+from array import array
+from typing import Sequence
+
+from ..validator import valid_delta_set
+from .combo_store import load_combo_data, save_combo_data
+
+logger = logging.getLogger(__name__)
+
+TRACE_MAGIC = b"TPDT"
+TRACE_VERSION = 1
+TRACE_HEADER = struct.Struct("<4sHHIcB2x")
+TRACE_TYPECODES = ("f", "d")
+NATIVE_BYTEORDER = int(sys.byteorder == "big")
+
+
+class DeltaTrace(Sequence):
+    """Delta trace data set
+
+    Read-only row view over packed columns, each row returns a tuple.
+    Column data is not copied or parsed on load.
+    """
+
+    __slots__ = (
+        "_columns",
+        "_rows",
+    )
+
+    def __init__(self, columns: Sequence[Sequence[float]], rows: int):
+        self._columns = tuple(columns)
+        self._rows = rows
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self[idx] for idx in range(*index.indices(self._rows)))
+        return tuple(column[index] for column in self._columns)
+
+    def column(self, index: int) -> Sequence[float]:
+        """Get column data"""
+        return self._columns[index]
+
+
+def unpack_delta_trace(raw_bytes: bytes) -> DeltaTrace:
+    """Unpack delta trace from binary data"""
+    try:
+        magic, version, columns, rows, typecode, byteorder = TRACE_HEADER.unpack_from(raw_bytes)
+        typecode = typecode.decode()
+    except (struct.error, UnicodeDecodeError) as error:
+        raise ValueError from error
+    if magic != TRACE_MAGIC or version > TRACE_VERSION or typecode not in TRACE_TYPECODES:
+        raise ValueError
+    column_size = array(typecode).itemsize * rows
+    if len(raw_bytes) != TRACE_HEADER.size + column_size * columns:
+        raise ValueError
+    view = memoryview(raw_bytes)
+    offset = TRACE_HEADER.size
+    column_set = []
+    for _ in range(columns):
+        column_bytes = view[offset:offset + column_size]
+        if byteorder == NATIVE_BYTEORDER:
+            column_set.append(column_bytes.cast(typecode))
+        else:  # copy & swap only if byte order mismatched
+            column_data = array(typecode, column_bytes)
+            column_data.byteswap()
+            column_set.append(column_data)
+        offset += column_size
+    return DeltaTrace(column_set, rows)
+
+
+def pack_delta_trace(dataset: Sequence[Sequence[float]], typecode: str = "d") -> bytes:
+    """Pack delta trace to binary data"""
+    if isinstance(dataset, DeltaTrace):
+        columns = [dataset.column(index) for index in range(len(dataset[0]))]
+    else:
+        columns = list(zip(*dataset))
+    packed = [
+        TRACE_HEADER.pack(
+            TRACE_MAGIC, TRACE_VERSION, len(columns), len(columns[0]) if columns else 0,
+            typecode.encode(), NATIVE_BYTEORDER)
+    ]
+    packed.extend(array(typecode, column).tobytes() for column in columns)
+    return b"".join(packed)
+
+
+def load_delta_trace_file(
+    filepath: str, filename: str, extension: str, legacy_extension: str = ""
+) -> Sequence[Sequence[float]]:
+    """Load delta trace binary data from combo store, or migrate from legacy CSV file if not exist
+
+    Raises:
+        FileNotFoundError: if neither binary nor legacy file exists.
+        ValueError, IndexError, TypeError: if invalid data.
+    """
+    try:
+        return unpack_delta_trace(load_combo_data(filepath, filename, extension))
+    except FileNotFoundError:
+        if not legacy_extension:
+            raise
+    # Migrate from legacy file
+    with open(f"{filepath}{filename}{legacy_extension}", newline="", encoding="utf-8") as csvfile:
+        data_reader = csv.reader(csvfile, quoting=csv.QUOTE_NONNUMERIC)
+        dataset = valid_delta_set(tuple(tuple(data) for data in data_reader))
+    save_delta_trace_file(filepath, filename, extension, dataset)
+    logger.info("USERDATA: %s%s converted to %s", filename, legacy_extension, extension)
+    return dataset
+
+
+def save_delta_trace_file(
+    filepath: str, filename: str, extension: str, dataset: Sequence[Sequence[float]]
+) -> None:
+    """Save delta trace binary data to combo store (queued to background writer)"""
+    save_combo_data(filepath, filename, extension, pack_delta_trace(dataset))
@@ -18,25 +18,23 @@
 
 """
 Driver stats file function
+
+Driver stats are stored in SQLite database (WAL mode), one row per
+track & vehicle combo, so that each update only touches its own row.
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import sqlite3
+from contextlib import closing
 from dataclasses import dataclass
-from time import sleep
 from typing import KeysView, get_type_hints
 
 from ..const_common import MAX_SECONDS
 from ..const_file import FileExt, StatsFile
-from ..validator import convert_value_type, purge_data_key
-from .json_setting import (
-    create_backup_file,
-    save_and_verify_json_file,
-    save_json_file,
-    set_backup_timestamp,
-)
+from ..validator import convert_value_type
 
 logger = logging.getLogger(__name__)
 
@@ -62,138 +60,181 @@ class DriverStats:
         return cls.__annotations__.keys()
 
 
-def validate_stats_file(stats_user: dict) -> dict:
-    """Validate stats file
+STATS_TYPE = get_type_hints(DriverStats)
+STATS_DEFAULT = {key: DriverStats.__dict__[key] for key in DriverStats.keys()}
+STATS_COLUMN = ", ".join(DriverStats.keys())
+STATS_DB_VERSION = 1  # database user_version, 0 = stats json file not imported
 
-    Full validation for every primary key (track name) and secondary key (vehicle name),
-    Only required for loading file in Driver Stats Viewer.
-    """
-    for key in stats_user:
-        if not isinstance(stats_user[key], dict):
-            stats_user[key] = {}
-        sub_value = stats_user[key]
-        for sub_key in sub_value:
-            if not isinstance(sub_value[sub_key], dict):
-                sub_value[sub_key] = {}
-    return stats_user
+# Primary key (track, vehicle) also serves as index for track queries
+SQL_CREATE_TABLE = (
+    "CREATE TABLE IF NOT EXISTS driver_stats ("
+    "track TEXT NOT NULL, vehicle TEXT NOT NULL, "
+    + "".join(
+        f"{key} {'INTEGER' if STATS_TYPE[key] is int else 'REAL'} NOT NULL DEFAULT {value}, "
+        for key, value in STATS_DEFAULT.items()
+    )
+    + "PRIMARY KEY (track, vehicle))"
+)
+SQL_INSERT_DEFAULT = "INSERT OR IGNORE INTO driver_stats (track, vehicle) VALUES (?, ?)"
+SQL_UPDATE_STATS = (
+    "UPDATE driver_stats SET "
+    + ", ".join(
+        "pb = min(pb, ?)" if key == "pb" else f"{key} = {key} + ?"
+        for key in DriverStats.keys()
+    )
+    + " WHERE track = ? AND vehicle = ?"
+)
+SQL_SELECT_STATS = f"SELECT {STATS_COLUMN} FROM driver_stats WHERE track = ? AND vehicle = ?"
+SQL_SELECT_TRACKS = "SELECT DISTINCT track FROM driver_stats"
+SQL_SELECT_VEHICLES = f"SELECT vehicle, {STATS_COLUMN} FROM driver_stats WHERE track = ?"
+SQL_IMPORT_STATS = (
+    f"INSERT OR IGNORE INTO driver_stats (track, vehicle, {STATS_COLUMN}) "
+    f"VALUES (?, ?{', ?' * len(STATS_DEFAULT)})"
+)
 
 
-def get_sub_dict(source: dict, key_name: str) -> dict:
-    """Get sub dict, create new if not exist"""
-    sub_dict = source.get(key_name)
-    if not isinstance(sub_dict, dict):
-        source[key_name] = {}
-        sub_dict = source[key_name]
-    return sub_dict
+def connect_stats_db(filepath: str, filename: str = StatsFile.DRIVER) -> sqlite3.Connection:
+    """Connect stats database, create table & import from stats json file if not imported"""
+    conn = sqlite3.connect(f"{filepath}{filename}{FileExt.STATS_DB}", timeout=5)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        if conn.execute("PRAGMA user_version").fetchone()[0] < STATS_DB_VERSION:
+            import_stats_json_file(conn, filepath, filename)
+    except sqlite3.Error:
+        conn.close()
+        raise
+    return conn
 
 
 def load_driver_stats(
     key_list: tuple[str, str], filepath: str, filename: str = StatsFile.DRIVER
 ) -> DriverStats:
     """Load driver stats"""
-    stats_user = load_stats_json_file(
-        filepath=filepath,
-        filename=filename,
-    )
-    if stats_user is None:
-        return DriverStats()
-    # Get data from matching key
-    loaded_dict = stats_user
-    for key in key_list:
-        loaded_dict = loaded_dict.get(key)
-        if not isinstance(loaded_dict, dict):  # not exist, set to default
-            return DriverStats()
-    # Add data to DriverStats
     try:
-        return DriverStats(**purge_data_key(loaded_dict, DriverStats.keys()))
-    except (AttributeError, TypeError, KeyError, ValueError):
+        with closing(connect_stats_db(filepath, filename)) as conn:
+            row = conn.execute(SQL_SELECT_STATS, key_list).fetchone()
+    except sqlite3.Error as error:
+        logger.error("USERDATA: unable to load %s%s, %s", filename, FileExt.STATS_DB, error)
+        return DriverStats()
+    if row is None:  # not exist, set to default
         return DriverStats()
+    return DriverStats(*row)
 
 
 def save_driver_stats(
     key_list: tuple[str, str], stats_update: DriverStats, filepath: str, filename: str = StatsFile.DRIVER
 ) -> None:
-    """Save driver stats"""
+    """Save driver stats, update laptime if faster, increment other values"""
     if not key_list or not all(key_list):  # ignore invalid key name
         return
-    # Load stats with limited attempts
-    load_attempts = 10
-    while load_attempts > 0:
-        stats_user = load_stats_json_file(
-            filepath=filepath,
-            filename=filename,
-            show_log=False,
-        )
-        if stats_user is not None:
-            break
-        load_attempts -= 1
-        logger.info("USERDATA: unable to load %s%s, %s attempt(s) left", filename, FileExt.STATS, load_attempts)
-        sleep(0.05)
-    # Create backup if failed to load stats
-    if stats_user is None:
-        logger.info("USERDATA: unable to load %s%s, creating backup", filename, FileExt.STATS)
-        if not create_backup_file(f"{filename}{FileExt.STATS}", filepath, set_backup_timestamp(), show_log=True):
-            return  # abort saving if failed to create backup
-        stats_user = {}  # reset stats
-    # Get data from matching key
-    loaded_dict = stats_user
-    for key in key_list:
-        loaded_dict = get_sub_dict(loaded_dict, key)
-    # Verify and update new data
-    default_dict = DriverStats.__dict__
-    default_type = get_type_hints(DriverStats)
-    for key, value in stats_update.__dict__.items():
-        # Add new default value if not exists
-        if key not in loaded_dict:
-            loaded_dict[key] = default_dict[key]
-        # Check value type, auto correct if mismatch
-        if not isinstance(loaded_dict[key], default_type[key]):
-            loaded_dict[key] = convert_value_type(loaded_dict[key], default_dict[key], default_type[key])
-        # Update laptime value faster than old value
-        if key == "pb":
-            if loaded_dict[key] > value:
-                loaded_dict[key] = value
-            continue
-        # Update value (increment)
-        loaded_dict[key] += value
-    # Save new data
-    save_stats_json_file(
-        stats_user=stats_user,
-        filepath=filepath,
-        filename=filename,
-    )
+    try:
+        with closing(connect_stats_db(filepath, filename)) as conn:
+            with conn:
+                conn.execute(SQL_INSERT_DEFAULT, key_list)
+                conn.execute(SQL_UPDATE_STATS, (*stats_update.__dict__.values(), *key_list))
+    except sqlite3.Error as error:
+        logger.error("USERDATA: unable to save %s%s, %s", filename, FileExt.STATS_DB, error)
 
 
-def load_stats_json_file(
-    filepath: str, filename: str = StatsFile.DRIVER, extension: str = FileExt.STATS, show_log: bool = True
-) -> dict | None:
-    """Load stats json file, create new if not exists, or returns "None" if invalid"""
+def load_stats_tracks(filepath: str, filename: str = StatsFile.DRIVER) -> list[str]:
+    """Load track name list"""
     try:
-        with open(f"{filepath}{filename}{extension}", "r", encoding="utf-8") as jsonfile:
+        with closing(connect_stats_db(filepath, filename)) as conn:
+            return [row[0] for row in conn.execute(SQL_SELECT_TRACKS)]
+    except sqlite3.Error as error:
+        logger.error("USERDATA: unable to load %s%s, %s", filename, FileExt.STATS_DB, error)
+        return []
+
+
+def load_stats_vehicles(track: str, filepath: str, filename: str = StatsFile.DRIVER) -> dict[str, DriverStats]:
+    """Load stats of all vehicles from track"""
+    try:
+        with closing(connect_stats_db(filepath, filename)) as conn:
+            return {
+                vehicle: DriverStats(*values)
+                for vehicle, *values in conn.execute(SQL_SELECT_VEHICLES, (track,))
+            }
+    except sqlite3.Error as error:
+        logger.error("USERDATA: unable to load %s%s, %s", filename, FileExt.STATS_DB, error)
+        return {}
+
+
+def delete_stats_track(track: str, filepath: str, filename: str = StatsFile.DRIVER) -> None:
+    """Delete stats of all vehicles from track"""
+    execute_stats_query("DELETE FROM driver_stats WHERE track = ?", (track,), filepath, filename)
+
+
+def delete_stats_vehicle(track: str, vehicle: str, filepath: str, filename: str = StatsFile.DRIVER) -> None:
+    """Delete vehicle stats from track"""
+    execute_stats_query(
+        "DELETE FROM driver_stats WHERE track = ? AND vehicle = ?", (track, vehicle), filepath, filename)
+
+
+def reset_stats_value(
+    track: str, vehicle: str, key: str, filepath: str, filename: str = StatsFile.DRIVER
+) -> None:
+    """Reset vehicle stats value to default"""
+    if key not in STATS_DEFAULT:  # only allow stats column name
+        return
+    execute_stats_query(
+        f"UPDATE driver_stats SET {key} = ? WHERE track = ? AND vehicle = ?",
+        (STATS_DEFAULT[key], track, vehicle), filepath, filename)
+
+
+def execute_stats_query(query: str, params: tuple, filepath: str, filename: str = StatsFile.DRIVER) -> None:
+    """Execute stats query in transaction"""
+    try:
+        with closing(connect_stats_db(filepath, filename)) as conn:
+            with conn:
+                conn.execute(query, params)
+    except sqlite3.Error as error:
+        logger.error("USERDATA: unable to save %s%s, %s", filename, FileExt.STATS_DB, error)
+
+
+def import_stats_json_file(conn: sqlite3.Connection, filepath: str, filename: str = StatsFile.DRIVER) -> None:
+    """Create table & import stats from json file (old format), original file is kept
+
+    Table creation, importing and database version update are done in one transaction,
+    importing is retried on next connection if failed. Existing rows are not overwritten.
+    """
+    rows = []
+    try:
+        with open(f"{filepath}{filename}{FileExt.STATS}", "r", encoding="utf-8") as jsonfile:
             stats_user = json.load(jsonfile)
             if not isinstance(stats_user, dict):
                 raise TypeError
-            return stats_user
+        rows = [
+            (track, vehicle, *validate_stats_values(veh_data))
+            for track, track_data in stats_user.items() if isinstance(track_data, dict)
+            for vehicle, veh_data in track_data.items() if isinstance(veh_data, dict)
+        ]
     except FileNotFoundError:
-        if show_log:
-            logger.info("MISSING: %s stats (%s) data, create new stats", filename, extension)
-        stats_user = {}
-        save_json_file(stats_user, filename, filepath, extension, compact_json=True)
-        return stats_user
+        pass
     except (AttributeError, TypeError, KeyError, ValueError):
-        if show_log:
-            logger.info("MISSING: invalid %s stats (%s) data", filename, extension)
-    return None
+        logger.info("MISSING: invalid %s stats (%s) data, skip importing", filename, FileExt.STATS)
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        conn.execute(SQL_CREATE_TABLE)
+        conn.executemany(SQL_IMPORT_STATS, rows)
+        conn.execute(f"PRAGMA user_version = {STATS_DB_VERSION}")
+        conn.commit()
+    except sqlite3.Error:
+        conn.rollback()
+        raise
+    if rows:
+        logger.info(
+            "USERDATA: imported %s stats from %s%s to %s%s",
+            len(rows), filename, FileExt.STATS, filename, FileExt.STATS_DB,
+        )
 
 
-def save_stats_json_file(
-    stats_user: dict, filepath: str, filename: str = StatsFile.DRIVER, extension: str = FileExt.STATS
-) -> None:
-    """Save stats to json file"""
-    save_and_verify_json_file(
-        dict_user=stats_user,
-        filename=f"{filename}{extension}",
-        filepath=filepath,
-        max_attempts=10,
-        compact_json=True,
-    )
+def validate_stats_values(veh_data: dict) -> tuple:
+    """Validate stats values, auto correct if type mismatch"""
+    output = []
+    for key, default_value in STATS_DEFAULT.items():
+        value = veh_data.get(key, default_value)
+        if not isinstance(value, STATS_TYPE[key]) or isinstance(value, bool):
+            value = convert_value_type(value, default_value, STATS_TYPE[key])
+        output.append(value)
+    return tuple(output)
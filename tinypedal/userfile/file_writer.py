@@ -0,0 +1,126 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Background user file writer
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import threading
+from time import sleep
+from typing import Callable
+
+from ..const_file import FileExt
+
+logger = logging.getLogger(__name__)
+
+
+def write_file_atomic(filename_full: str, data: bytes, max_attempts: int = 3) -> bool:
+    """Write file atomically via temporary file and rename, returns true if succeed"""
+    filename_temp = f"{filename_full}{FileExt.TMP}"
+    for _ in range(max_attempts):
+        try:
+            with open(filename_temp, "wb") as tempfile:
+                tempfile.write(data)
+                tempfile.flush()
+                os.fsync(tempfile.fileno())
+            os.replace(filename_temp, filename_full)
+            return True
+        except OSError as error:  # file locked by other process, retry
+            logger.error("USERDATA: failed saving %s, %s", filename_full, error)
+            sleep(0.05)
+    if os.path.exists(filename_temp):
+        try:
+            os.remove(filename_temp)
+        except OSError:
+            pass
+    return False
+
+
+class FileWriter:
+    """Background user file writer
+
+    Write tasks are queued per file, a newer task replaces pending
+    task of the same file, so that only latest data is written.
+    Realtime module threads only serialize data and never wait on disk.
+    Task data can be either bytes (written to file atomically), or
+    a callable that performs writing and returns true if succeed.
+    """
+
+    __slots__ = (
+        "_queue",
+        "_cond",
+        "_writing",
+        "_started",
+    )
+
+    def __init__(self):
+        self._queue: dict[str, bytes | Callable[[], bool]] = {}
+        self._cond = threading.Condition()
+        self._writing = ""  # filename of writing task
+        self._started = False
+
+    def write(self, filename_full: str, data: bytes | Callable[[], bool]):
+        """Add write task to queue"""
+        with self._cond:
+            self._queue.pop(filename_full, None)  # coalesce pending task
+            self._queue[filename_full] = data
+            if not self._started:
+                self._started = True
+                threading.Thread(target=self.__writing, daemon=True).start()
+            self._cond.notify_all()
+
+    def pending(self, filename_full: str) -> bool:
+        """Check if file has pending or writing task"""
+        return filename_full in self._queue or filename_full == self._writing
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until all queued tasks finished, returns false if timeout"""
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not self._queue and not self._writing, timeout)
+
+    def __writing(self):
+        """Writing thread"""
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._queue)
+                filename_full = next(iter(self._queue))
+                data = self._queue.pop(filename_full)
+                self._writing = filename_full
+            try:
+                if callable(data):
+                    saved = data()
+                else:
+                    saved = write_file_atomic(filename_full, data)
+                if saved:
+                    logger.info("USERDATA: %s saved", os.path.basename(filename_full))
+            except Exception as error:  # keep writer thread alive
+                logger.error("USERDATA: failed saving %s, %s", filename_full, error)
+            finally:
+                with self._cond:
+                    self._writing = ""
+                    self._cond.notify_all()
+
+
+fwriter = FileWriter()
+atexit.register(fwriter.flush)
@@ -22,22 +22,23 @@ Fuel/Energy delta file function
 
 from __future__ import annotations
 
-import csv
 import logging
 
 from ..validator import invalid_save_name, valid_delta_set
+from .delta_trace import load_delta_trace_file, save_delta_trace_file
 
 logger = logging.getLogger(__name__)
 
 
 def load_fuel_delta_file(
-    filepath: str, filename: str, extension: str, defaults: tuple
+    filepath: str, filename: str, extension: str, defaults: tuple, legacy_extension: str = "",
 ) -> tuple[tuple, float, float]:
-    """Load fuel/energy delta file (*.fuel, *.energy)"""
+    """Load fuel/energy delta file (*.fueldelta, *.energydelta)
+
+    Migrate from legacy file (*.fuel, *.energy) if not exist.
+    """
     try:
-        with open(f"{filepath}{filename}{extension}", newline="", encoding="utf-8") as csvfile:
-            data_reader = csv.reader(csvfile, quoting=csv.QUOTE_NONNUMERIC)
-            temp_list = tuple(tuple(data) for data in data_reader)
+        temp_list = load_delta_trace_file(filepath, filename, extension, legacy_extension)
         # Validate data
         lastlist = valid_delta_set(temp_list)
         used_last = lastlist[-1][1]
@@ -53,10 +54,7 @@ def load_fuel_delta_file(
 def save_fuel_delta_file(
     filepath: str, filename: str, extension: str, dataset: tuple
 ) -> None:
-    """Save fuel/energy delta file (*.fuel, *.energy)"""
+    """Save fuel/energy delta file (*.fueldelta, *.energydelta)"""
     if len(dataset) < 10 or invalid_save_name(filename):
         return
-    with open(f"{filepath}{filename}{extension}", "w", newline="", encoding="utf-8") as csvfile:
-        data_writer = csv.writer(csvfile)
-        data_writer.writerows(dataset)
-        logger.info("USERDATA: %s%s saved", filename, extension)
+    save_delta_trace_file(filepath, filename, extension, dataset)
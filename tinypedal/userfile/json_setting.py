@@ -24,13 +24,15 @@ from __future__ import annotations
 
 import json
 import logging
-import os
+import marshal
 import shutil
 from time import localtime, monotonic, sleep, strftime
 from typing import Callable
+from zlib import crc32
 
 from ..const_file import FileExt
 from ..setting_validator import PresetValidator
+from .file_writer import fwriter, write_file_atomic
 
 logger = logging.getLogger(__name__)
 
@@ -75,6 +77,28 @@ def load_setting_json_file(
     return setting_user
 
 
+def load_validator_cache(filename: str, filepath: str) -> None:
+    """Load preset validator cache, ignore if outdated"""
+    try:
+        with open(f"{filepath}{filename}", "rb") as cachefile:
+            cache = marshal.load(cachefile)
+        if PresetValidator.import_cache(cache):
+            logger.info("USERDATA: %s loaded (validator cache)", filename)
+        else:
+            logger.info("USERDATA: %s outdated, rebuild (validator cache)", filename)
+    except FileNotFoundError:
+        pass
+    except (EOFError, ValueError, TypeError, OSError):
+        logger.error("USERDATA: %s failed loading, rebuild (validator cache)", filename)
+
+
+def save_validator_cache(filename: str, filepath: str) -> None:
+    """Save preset validator cache in background, skip if not updated"""
+    cache = PresetValidator.export_cache()
+    if cache is not None:
+        fwriter.write(f"{filepath}{filename}", marshal.dumps(cache))
+
+
 def load_style_json_file(
     filename: str, filepath: str, dict_def: dict,
     check_missing: bool = False, file_info: str = "style preset",
@@ -124,19 +148,20 @@ def save_json_file(
             json.dump(dict_user, jsonfile, indent=4)
 
 
-def verify_json_file(
-    dict_user: dict, filename: str, filepath: str, extension: str = ""
-) -> bool:
-    """Verify saved json file"""
-    filename_source = f"{filepath}{filename}{extension}"
+def serialize_json(dict_user: dict, compact_json: bool = False) -> bytes:
+    """Serialize json data to bytes, same format as save_json_file"""
+    if compact_json:
+        return json.dumps(dict_user, separators=(",", ":")).encode("utf-8")
+    return json.dumps(dict_user, indent=4).encode("utf-8")
+
+
+def read_file_bytes(filename_full: str) -> bytes | None:
+    """Read file bytes, returns none if failed"""
     try:
-        with open(filename_source, "r", encoding="utf-8") as jsonfile:
-            return json.load(jsonfile) == dict_user
-    except FileNotFoundError:
-        logger.error("USERDATA: not found %s", filename_source)
-    except (ValueError, OSError):
-        logger.error("USERDATA: unable to verify %s", filename_source)
-    return False
+        with open(filename_full, "rb") as file:
+            return file.read()
+    except OSError:
+        return None
 
 
 def create_backup_file(
@@ -159,62 +184,6 @@ def create_backup_file(
     return False
 
 
-def restore_backup_file(
-    filename: str, filepath: str, extension: str = FileExt.BAK
-) -> bool:
-    """Restore backup file if saving failed"""
-    filename_backup = f"{filepath}{filename}{extension}"
-    filename_source = f"{filepath}{filename}"
-    try:
-        shutil.copyfile(filename_backup, filename_source)
-        logger.info("USERDATA: backup restored %s", filename_source)
-        return True
-    except FileNotFoundError:
-        logger.error("USERDATA: backup not found %s", filename_backup)
-    except PermissionError:
-        logger.error("USERDATA: no permission to access backup %s", filename_backup)
-    except OSError:
-        logger.error("USERDATA: unable to restore backup %s", filename_backup)
-    return False
-
-
-def copy_and_rename_backup_file(
-    filename: str, filepath: str, extension: str = FileExt.BAK
-) -> bool:
-    """Copy and rename backup file if restoring backup failed"""
-    filename_backup = f"{filepath}{filename}{extension}"
-    filename_renamed = f"{filepath}{filename}{set_backup_timestamp()}"
-    try:
-        shutil.copyfile(filename_backup, filename_renamed)
-        logger.info("USERDATA: backup renamed %s", filename_renamed)
-        return True
-    except FileNotFoundError:
-        logger.error("USERDATA: backup not found %s", filename_backup)
-    except PermissionError:
-        logger.error("USERDATA: no permission to access backup %s", filename_backup)
-    except OSError:
-        logger.error("USERDATA: unable to copy and rename backup %s", filename_backup)
-    return False
-
-
-def delete_backup_file(
-    filename: str, filepath: str, extension: str = FileExt.BAK
-) -> bool:
-    """Delete backup file"""
-    filename_backup = f"{filepath}{filename}{extension}"
-    try:
-        if os.path.exists(filename_backup):
-            os.remove(filename_backup)
-        return True
-    except FileNotFoundError:
-        logger.error("USERDATA: backup not found %s", filename_backup)
-    except PermissionError:
-        logger.error("USERDATA: no permission to access backup %s", filename_backup)
-    except OSError:
-        logger.error("USERDATA: unable to delete backup %s", filename_backup)
-    return False
-
-
 def save_and_verify_json_file(
     dict_user: dict,
     filename: str,
@@ -222,34 +191,38 @@ def save_and_verify_json_file(
     max_attempts: int = 10,
     compact_json: bool = False,
 ) -> None:
-    """Save and verify json file, backup or restore if saving failed"""
-    file_found = os.path.exists(f"{filepath}{filename}")
-    # Create backup: abort saving if backup failed; skip backup and create new if not exist
-    if not file_found:
-        logger.info("USERDATA: %s not found, create new", filename)
-    elif not create_backup_file(filename, filepath):
-        logger.info("USERDATA: %s saving abort", filename)
+    """Save and verify json file
+
+    Data is serialized once, and saving is skipped if file content is unchanged.
+    File is written to a temporary file then replaces target file, and verified
+    with checksum. Original file is kept intact if saving failed.
+    """
+    filename_full = f"{filepath}{filename}"
+    try:
+        data = serialize_json(dict_user, compact_json)
+    except (TypeError, ValueError, RuntimeError):
+        logger.error("USERDATA: %s saving abort, invalid data", filename)
         return
+    last_data = read_file_bytes(filename_full)
+    if last_data == data:
+        logger.info("USERDATA: %s unchanged, skip saving", filename)
+        return
+    if last_data is None:
+        logger.info("USERDATA: %s not found, create new", filename)
     # Start saving attempts
+    checksum = crc32(data)
     attempts = max_attempts
     timer_start = monotonic()
     while attempts > 0:
-        save_json_file(dict_user, filename, filepath, compact_json=compact_json)
-        if verify_json_file(dict_user, filename, filepath):
-            break
+        if write_file_atomic(filename_full, data, 1):
+            saved_data = read_file_bytes(filename_full)
+            if saved_data is not None and crc32(saved_data) == checksum:
+                break
         attempts -= 1
         logger.error("USERDATA: %s failed saving, %s attempt(s) left", filename, attempts)
         sleep(0.05)
     timer_end = round((monotonic() - timer_start) * 1000)
-    # Clean up
-    if attempts > 0:
-        state_text = "saved"
-    else:
-        if file_found and not restore_backup_file(filename, filepath):
-            copy_and_rename_backup_file(filename, filepath)
-        state_text = "failed saving"
-    if file_found:
-        delete_backup_file(filename, filepath)
+    state_text = "saved" if attempts > 0 else "failed saving"
     logger.info(
         "USERDATA: %s %s (took %sms, %s/%s attempts)",
         filename,
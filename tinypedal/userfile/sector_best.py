@@ -23,10 +23,12 @@ Sector best file function
 from __future__ import annotations
 
 import csv
+import io
 import logging
 
 from ..const_file import FileExt
 from ..validator import invalid_save_name
+from .combo_store import load_combo_data, save_combo_data
 
 logger = logging.getLogger(__name__)
 
@@ -34,9 +36,10 @@ logger = logging.getLogger(__name__)
 def load_sector_best_file(
     filepath:str, filename: str, session_id: tuple, defaults: list, extension: str = FileExt.SECTOR
 ) -> tuple[list, list, list, list]:
-    """Load sector best file (*.sector)"""
+    """Load sector best file (*.sector) from combo store"""
     try:
-        with open(f"{filepath}{filename}{extension}", newline="", encoding="utf-8") as csvfile:
+        raw_bytes = load_combo_data(filepath, filename, extension)
+        with io.StringIO(raw_bytes.decode("utf-8"), newline="") as csvfile:
             temp_list = list(csv.reader(csvfile, quoting=csv.QUOTE_NONNUMERIC))
         # Check if same session
         if (temp_list[0][0] == session_id[0] and  # session_stamp
@@ -54,7 +57,7 @@ def load_sector_best_file(
         return best_s_tb, best_s_pb, all_best_s_tb, all_best_s_pb
     except FileNotFoundError:
         logger.info("MISSING: sector best (%s) data", extension)
-    except (IndexError, ValueError, TypeError):
+    except (IndexError, ValueError, TypeError):  # UnicodeDecodeError is subclass of ValueError
         logger.info("MISSING: invalid sector best (%s) data", extension)
     return defaults.copy(), defaults.copy(), defaults.copy(), defaults.copy()
 
@@ -62,7 +65,7 @@ def load_sector_best_file(
 def save_sector_best_file(
     filepath: str, filename: str, dataset: tuple, extension: str = FileExt.SECTOR
 ) -> None:
-    """Save sector best file (*.sector)
+    """Save sector best file (*.sector) to combo store
 
     sector(CSV) file structure:
         Line 0: session stamp, session elapsed time, session total laps
@@ -73,7 +76,7 @@ def save_sector_best_file(
     """
     if len(dataset) != 5 or invalid_save_name(filename):
         return
-    with open(f"{filepath}{filename}{extension}", "w", newline="", encoding="utf-8") as csvfile:
+    with io.StringIO(newline="") as csvfile:
         data_writer = csv.writer(csvfile)
         data_writer.writerows(dataset)
-        logger.info("USERDATA: %s%s saved", filename, extension)
+        save_combo_data(filepath, filename, extension, csvfile.getvalue().encode("utf-8"))
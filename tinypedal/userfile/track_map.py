@@ -18,19 +18,169 @@
 
 """
 Track map file function
+
+Track map cache binary file structure (*.tpmap), generated from svg track map:
+    0: header (little-endian, 40 bytes)
+        magic bytes (4 bytes, b"TPTM"), format version (uint16),
+        byte order of data (uint8, 0 little-endian, 1 big-endian), padding (1 byte),
+        svg file last modified time (float64),
+        number of coordinates nodes (uint32), number of distance nodes (uint32),
+        sector index (2 x int32),
+        number of coordinates LOD levels (uint32), number of distance LOD levels (uint32)
+   40: float64 data
+        coordinates range (4), distance range (4),
+        coordinates x, coordinates y, distance, elevation columns,
+        coordinates LOD tolerances, distance LOD tolerances
+    -: uint32 data
+        coordinates LOD sizes, distance LOD sizes,
+        LOD node indices of all levels
 """
 
 from __future__ import annotations
 
 import logging
+import struct
+import sys
 import xml.dom.minidom
 import xml.parsers.expat
+from array import array
+from itertools import accumulate, chain
+from typing import Sequence
 
+from .. import calculation as calc
 from ..const_file import FileExt
-from ..validator import invalid_save_name
+from ..validator import file_last_modified, invalid_save_name
+from .file_writer import fwriter
 
 logger = logging.getLogger(__name__)
 
+MAP_MAGIC = b"TPTM"
+MAP_VERSION = 1
+MAP_HEADER = struct.Struct("<4sHBxdIIiiII")
+NATIVE_BYTEORDER = int(sys.byteorder == "big")
+
+
+class TrackMapData:
+    """Track map data
+
+    Attributes:
+        coords: ((x,y), (x,y), ...) raw coordinates.
+        dists: ((distance,elevation), ...) raw distance reference points.
+        sectors: (sector 1 index, sector 2 index) of coordinates.
+        coords_range: (min x, max x, min y, max y) of coordinates.
+        dists_range: (min distance, max distance, min elevation, max elevation).
+        coords_lod: ((tolerance, node indices), ...) coordinates level of detail.
+        dists_lod: ((tolerance, node indices), ...) elevation level of detail.
+    """
+
+    __slots__ = (
+        "coords",
+        "dists",
+        "sectors",
+        "coords_range",
+        "dists_range",
+        "coords_lod",
+        "dists_lod",
+    )
+
+    def __init__(
+        self, coords: tuple, dists: tuple, sectors: tuple,
+        coords_range: tuple, dists_range: tuple, coords_lod: tuple, dists_lod: tuple):
+        self.coords = coords
+        self.dists = dists
+        self.sectors = sectors
+        self.coords_range = coords_range
+        self.dists_range = dists_range
+        self.coords_lod = coords_lod
+        self.dists_lod = dists_lod
+
+
+def create_track_map_data(raw_coords: tuple, raw_dists: tuple, sector_index: tuple) -> TrackMapData:
+    """Create track map data with range & level of detail from raw data"""
+    return TrackMapData(
+        coords=raw_coords,
+        dists=raw_dists,
+        sectors=tuple(sector_index),
+        coords_range=calc.coords_range(raw_coords),
+        dists_range=calc.coords_range(raw_dists),
+        coords_lod=calc.polyline_lod(raw_coords),
+        dists_lod=calc.polyline_lod(raw_dists, base_tolerance=0.01, vertical=True),
+    )
+
+
+def pack_track_map_data(data: TrackMapData, source_modified: float) -> bytes:
+    """Pack track map data to binary data"""
+    lod_set = data.coords_lod + data.dists_lod
+    float_data = array("d", chain(data.coords_range, data.dists_range))
+    float_data.extend(chain.from_iterable(zip(*data.coords)))
+    float_data.extend(chain.from_iterable(zip(*data.dists)))
+    float_data.extend(level[0] for level in lod_set)
+    int_data = array("I", (len(level[1]) for level in lod_set))
+    int_data.extend(chain.from_iterable(level[1] for level in lod_set))
+    header = MAP_HEADER.pack(
+        MAP_MAGIC, MAP_VERSION, NATIVE_BYTEORDER, source_modified,
+        len(data.coords), len(data.dists), data.sectors[0], data.sectors[1],
+        len(data.coords_lod), len(data.dists_lod),
+    )
+    return b"".join((header, float_data.tobytes(), int_data.tobytes()))
+
+
+def unpack_track_map_data(raw_bytes: bytes, source_modified: float) -> TrackMapData:
+    """Unpack track map data from binary data
+
+    Raises:
+        ValueError: if invalid or outdated data.
+    """
+    try:
+        (magic, version, byteorder, modified, total_coords, total_dists,
+         sector1, sector2, coords_levels, dists_levels) = MAP_HEADER.unpack_from(raw_bytes)
+    except struct.error as error:
+        raise ValueError from error
+    if magic != MAP_MAGIC or version != MAP_VERSION or modified != source_modified:
+        raise ValueError
+    total_levels = coords_levels + dists_levels
+    float_size = (8 + total_coords * 2 + total_dists * 2 + total_levels) * 8
+    view = memoryview(raw_bytes)[MAP_HEADER.size:]
+    float_data = unpack_array("d", view[:float_size], byteorder)
+    int_data = unpack_array("I", view[float_size:], byteorder)
+    lod_sizes = int_data[:total_levels]
+    if len(float_data) * 8 != float_size or len(int_data) != total_levels + sum(lod_sizes):
+        raise ValueError
+    # Columns
+    offset = 8
+    columns = []
+    for size in (total_coords, total_coords, total_dists, total_dists):
+        columns.append(float_data[offset:offset + size])
+        offset += size
+    # Level of detail
+    lod_set = []
+    index_end = tuple(accumulate(lod_sizes, initial=total_levels))
+    for level in range(total_levels):
+        lod_set.append((
+            float_data[offset + level],
+            tuple(int_data[index_end[level]:index_end[level + 1]]),
+        ))
+    return TrackMapData(
+        coords=tuple(zip(columns[0], columns[1])),
+        dists=tuple(zip(columns[2], columns[3])),
+        sectors=(sector1, sector2),
+        coords_range=tuple(float_data[0:4]),
+        dists_range=tuple(float_data[4:8]),
+        coords_lod=tuple(lod_set[:coords_levels]),
+        dists_lod=tuple(lod_set[coords_levels:]),
+    )
+
+
+def unpack_array(typecode: str, raw_bytes: memoryview, byteorder: int) -> Sequence:
+    """Unpack array from binary data without copy if byte order matched"""
+    if len(raw_bytes) % array(typecode).itemsize:
+        raise ValueError
+    if byteorder == NATIVE_BYTEORDER:
+        return raw_bytes.cast(typecode)
+    data = array(typecode, raw_bytes)  # copy & swap only if byte order mismatched
+    data.byteswap()
+    return data
+
 
 def string_pair_to_int(string: str) -> tuple[int, int]:
     """Convert string pair "x,y" to int list"""
@@ -158,6 +308,39 @@ def save_track_map_file(
     dist_node.setAttribute("points", svg_dists)
     root_node.appendChild(dist_node)
     # Save svg
-    with open(f"{filepath}{filename}{extension}", "w", encoding="utf-8") as svgfile:
-        new_svg.writexml(svgfile, indent="", addindent="\t", newl="\n", encoding="utf-8")
-        logger.info("USERDATA: %s%s saved", filename, extension)
+    fwriter.write(
+        f"{filepath}{filename}{extension}",
+        new_svg.toprettyxml(indent="\t", newl="\n", encoding="utf-8"),
+    )
+
+
+def load_track_map_data(
+    filepath: str, filename: str, extension: str = FileExt.SVG,
+    cache_extension: str = FileExt.TRACK_MAP,
+) -> TrackMapData | None:
+    """Load track map data from cache file (*.tpmap)
+
+    Cache file is generated from svg track map file (*.svg) if not exist,
+    and regenerated if svg file last modified time mismatched.
+    """
+    source_modified = file_last_modified(filepath, filename, extension)
+    if source_modified <= 0:
+        logger.info("MISSING: track map (%s) data", extension)
+        return None
+    try:
+        with open(f"{filepath}{filename}{cache_extension}", "rb") as binfile:
+            return unpack_track_map_data(binfile.read(), source_modified)
+    except FileNotFoundError:
+        pass
+    except (IndexError, ValueError):
+        logger.info("USERDATA: outdated track map (%s) data", cache_extension)
+    raw_coords, raw_dists, sector_index = load_track_map_file(filepath, filename, extension)
+    if not raw_coords or not raw_dists:
+        return None
+    data = create_track_map_data(raw_coords, raw_dists, sector_index)
+    if not invalid_save_name(filename):
+        fwriter.write(
+            f"{filepath}{filename}{cache_extension}",
+            pack_track_map_data(data, source_modified),
+        )
+    return data
@@ -22,6 +22,8 @@ Widget modules
 Add new widget to import list below in ascending order,
 file name must match corresponding key name
 in template/setting_widget.py dictionary.
+
+Widgets are imported on first use by module control.
 """
 
 __all__ = [
@@ -87,5 +89,3 @@ __all__ = [
     "weather_forecast",
     "wheel_alignment",
 ]
-
-from . import *
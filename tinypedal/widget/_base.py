@@ -25,13 +25,26 @@ from __future__ import annotations
 from typing import Any, NamedTuple
 
 from PySide2.QtCore import QBasicTimer, Qt, Slot, QPoint, QRect
-from PySide2.QtGui import QFont, QFontMetrics, QPalette, QPixmap
-from PySide2.QtWidgets import QGridLayout, QLabel, QLayout, QWidget, QMenu, QAction
+from PySide2.QtGui import QFont, QFontMetrics, QPainter, QPalette, QPixmap
+from PySide2.QtWidgets import (
+    QAction,
+    QGraphicsOpacityEffect,
+    QGridLayout,
+    QLabel,
+    QLayout,
+    QMenu,
+    QWidget,
+)
 
 from .. import regex_pattern as rxp
 from ..const_app import APP_NAME
 from ..overlay_control import octrl
 from ..setting import Setting
+from ._compositor import compositor
+from ._painter import FrameInterpolator, OpenGLPaintCanvas, PaintCanvas
+
+# Shared style palette cache, key = qt style sheet string
+_style_palette_cache: dict[str, QPalette] = {}
 
 
 class Overlay(QWidget):
@@ -53,6 +66,7 @@ class Overlay(QWidget):
         # Base setting
         self.setWindowTitle(f"{APP_NAME} - {widget_name.capitalize()}")
         self.move(self.wcfg["position_x"], self.wcfg["position_y"])
+        self._origin = QPoint(0, 0)  # parent window global position in compositor mode
 
         # Widget mouse event
         self._mouse_pos = None
@@ -67,13 +81,18 @@ class Overlay(QWidget):
     def start(self):
         """Set initial widget state in orders, and start update"""
         self.__connect_signal()
-        self.__set_window_attributes()  # 1
-        self.__set_window_flags()  # 2
+        if self.cfg.compatibility["enable_compositor_mode"]:
+            self.__set_compositor()
+        else:
+            self.__set_window_attributes()  # 1
+            self.__set_window_flags()  # 2
         self.__toggle_timer(not self.state.active)
 
     def stop(self):
         """Stop and close widget"""
         self.__toggle_timer(True)
+        for interpolator in self.findChildren(FrameInterpolator):
+            interpolator.stop()
         self.__break_signal()
         self.unload_resource()
         self.wcfg = None
@@ -116,6 +135,30 @@ class Overlay(QWidget):
         palette.setColor(QPalette.Window, self.cfg.compatibility["global_bkg_color"])
         self.setPalette(palette)
 
+    def __set_compositor(self):
+        """Set widget as child widget of compositor window"""
+        self.setAttribute(Qt.WA_DeleteOnClose, True)
+        if self.wcfg["opacity"] < 1:
+            effect = QGraphicsOpacityEffect(self)
+            effect.setOpacity(self.wcfg["opacity"])
+            self.setGraphicsEffect(effect)
+        if not self.cfg.compatibility["enable_translucent_background"]:
+            self.__set_window_style()
+            self.setAutoFillBackground(True)
+        self._origin = compositor.attach(self, self.wcfg["position_x"], self.wcfg["position_y"])
+
+    def global_pos(self) -> QPoint:
+        """Widget global position"""
+        return self.pos() + self._origin
+
+    def global_geometry(self) -> QRect:
+        """Widget global geometry"""
+        return QRect(self.global_pos(), self.size())
+
+    def move_global(self, pos: QPoint):
+        """Move widget to global position"""
+        self.move(pos - self._origin)
+
     def contextMenuEvent(self, event):
         """Widget context menu"""
         menu = QMenu()
@@ -139,7 +182,7 @@ class Overlay(QWidget):
             if self.cfg.overlay["enable_grid_move"]:
                 move_size = max(self.cfg.application["grid_move_size"], 1)
                 pos = pos / move_size * move_size
-            self.move(pos)
+            self.move_global(pos)
 
             # Don't snap if Ctrl is not pressed
             if not (event.modifiers() & Qt.ControlModifier):
@@ -176,7 +219,7 @@ class Overlay(QWidget):
                     continue
                 if self.screen() is not widget.screen():
                     continue
-                other = widget.geometry()
+                other = widget.global_geometry()
                 # X
                 if abs(geom.left() - other.right()) < snap_distance:
                     new_x = other.right() + snap_gap
@@ -188,7 +231,7 @@ class Overlay(QWidget):
                 elif abs(geom.bottom() - other.top()) < snap_distance:
                     new_y = other.top() - self.height() - snap_gap
 
-            self.move(QPoint(int(new_x), int(new_y)))
+            self.move_global(QPoint(int(new_x), int(new_y)))
 
     def mousePressEvent(self, event):
         """Set offset position & press state"""
@@ -202,21 +245,28 @@ class Overlay(QWidget):
         """Save position on release"""
         if self._mouse_pos:
             self._mouse_pos = None
-            self.wcfg["position_x"] = self.x()
-            self.wcfg["position_y"] = self.y()
+            pos = self.global_pos()
+            self.wcfg["position_x"] = pos.x()
+            self.wcfg["position_y"] = pos.y()
             self.cfg.save()
+            # Move to compositor window of new screen if changed
+            if self.parentWidget() is not None:
+                self._origin = compositor.attach(self, pos.x(), pos.y())
+                self.setHidden(self.cfg.overlay["auto_hide"] and not self.state.active)
 
     @Slot(bool)
     def __toggle_lock(self, locked: bool):
         """Toggle widget lock state"""
-        self.setWindowFlag(Qt.WindowTransparentForInput, locked)
+        if self.parentWidget() is None:  # compositor window handles lock state
+            self.setWindowFlag(Qt.WindowTransparentForInput, locked)
         # Need re-check after lock/unlock
         self.setHidden(self.cfg.overlay["auto_hide"] and not self.state.active)
 
     @Slot(bool)
     def __toggle_vr_compat(self, enabled: bool):
         """Toggle widget VR compatibility"""
-        self.setWindowFlag(Qt.Tool, not enabled)
+        if self.parentWidget() is None:  # compositor window handles VR compatibility
+            self.setWindowFlag(Qt.Tool, not enabled)
         # Need re-check
         self.setHidden(self.cfg.overlay["auto_hide"] and not self.state.active)
 
@@ -232,17 +282,21 @@ class Overlay(QWidget):
     @Slot()
     def center_horizontally(self):
         """Center widget horizontally"""
-        self.move(self.screen().geometry().width() / 2 - self.width() / 2, self.y())
-        self.wcfg["position_x"] = self.x()
-        self.wcfg["position_y"] = self.y()
+        self.move_global(QPoint(
+            int(self.screen().geometry().width() / 2 - self.width() / 2), self.global_pos().y()))
+        pos = self.global_pos()
+        self.wcfg["position_x"] = pos.x()
+        self.wcfg["position_y"] = pos.y()
         self.cfg.save()
 
     @Slot()
     def center_vertically(self):
         """Center widget vertically"""
-        self.move(self.x(), self.screen().geometry().height() / 2 - self.height() / 2)
-        self.wcfg["position_x"] = self.x()
-        self.wcfg["position_y"] = self.y()
+        self.move_global(QPoint(
+            self.global_pos().x(), int(self.screen().geometry().height() / 2 - self.height() / 2)))
+        pos = self.global_pos()
+        self.wcfg["position_x"] = pos.x()
+        self.wcfg["position_y"] = pos.y()
         self.cfg.save()
 
     def __connect_signal(self):
@@ -265,6 +319,30 @@ class Overlay(QWidget):
             event.ignore()
 
     # Common GUI methods
+    def set_canvas(self, width: int, height: int) -> QWidget:
+        """Set widget size & paint canvas
+
+        Paint canvas draws whole widget content via draw_canvas method,
+        OpenGL canvas is used if enabled in "rendering_backend" option.
+
+        Args:
+            width: canvas width in pixel.
+            height: canvas height in pixel.
+
+        Returns:
+            Paint canvas widget, call canvas update() to redraw.
+        """
+        if self.cfg.compatibility["rendering_backend"] == "Raster":
+            canvas = PaintCanvas(self, self.draw_canvas)
+        else:
+            canvas = OpenGLPaintCanvas(self, self.draw_canvas)
+        self.resize(width, height)
+        canvas.resize(width, height)
+        return canvas
+
+    def draw_canvas(self, painter: QPainter):
+        """Draw paint canvas, re-implement in widget that uses set_canvas"""
+
     def config_font(self, name: str = "", size: int = 1, weight: str = "") -> QFont:
         """Config font
 
@@ -357,6 +435,36 @@ class Overlay(QWidget):
             return Qt.AlignLeft | Qt.AlignVCenter
         return Qt.AlignRight | Qt.AlignVCenter
 
+    @staticmethod
+    def get_style_palette(style: str) -> QPalette:
+        """Get style palette from cache
+
+        Convert qt style sheet (foreground & background color) to palette once,
+        and reuse for all widgets.
+
+        Args:
+            style: qt style sheet string.
+
+        Returns:
+            QPalette object.
+        """
+        palette = _style_palette_cache.get(style)
+        if palette is None:
+            palette = _style_palette_cache[style] = style_to_palette(style)
+        return palette
+
+    def set_style_palette(self, target: QWidget, style: str):
+        """Set widget style with cached palette
+
+        Used for switching style at runtime without re-parsing style sheet.
+        Target must not have style sheet with color or background.
+
+        Args:
+            target: QWidget object.
+            style: qt style sheet string.
+        """
+        target.setPalette(self.get_style_palette(style))
+
     @staticmethod
     def set_qss(
         fg_color: str = "",
@@ -397,6 +505,7 @@ class Overlay(QWidget):
         text: str | None = None,
         pixmap: QPixmap | None = None,
         style: str | None = None,
+        palette_style: str | None = None,
         width: int = 0,
         height: int = 0,
         fixed_width: int = 0,
@@ -410,6 +519,7 @@ class Overlay(QWidget):
             text: label text.
             pixmap: pixmap image.
             style: qt style sheet.
+            palette_style: qt style sheet, applied as cached palette for runtime style switching.
             width: minimum label width in pixel.
             height: minimum label height in pixel.
             fixed_width: fixed label width in pixel, takes priority over width.
@@ -433,6 +543,10 @@ class Overlay(QWidget):
         if style is not None:
             bar_temp.setStyleSheet(style)
 
+        if palette_style is not None:
+            bar_temp.setAutoFillBackground(True)
+            bar_temp.setPalette(self.get_style_palette(palette_style))
+
         if fixed_width > 0:
             bar_temp.setFixedWidth(fixed_width)
         elif width > 0:
@@ -453,6 +567,7 @@ class Overlay(QWidget):
         text: str | None = None,
         pixmap: QPixmap | None = None,
         style: str | None = None,
+        palette_style: str | None = None,
         width: int = 0,
         height: int = 0,
         fixed_width: int = 0,
@@ -467,6 +582,7 @@ class Overlay(QWidget):
             text: label text.
             pixmap: pixmap image.
             style: qt style sheet.
+            palette_style: qt style sheet, applied as cached palette for runtime style switching.
             width: minimum label width in pixel.
             height: minimum label height in pixel.
             fixed_width: fixed label width in pixel, takes priority over width.
@@ -484,6 +600,7 @@ class Overlay(QWidget):
                 text=text,
                 pixmap=pixmap,
                 style=style,
+                palette_style=palette_style,
                 width=width,
                 height=height,
                 fixed_width=fixed_width,
@@ -632,6 +749,22 @@ class Overlay(QWidget):
             layout.addLayout(target, *order)
 
 
+def style_to_palette(style: str) -> QPalette:
+    """Convert qt style sheet (foreground & background color) to palette"""
+    palette = QPalette()
+    for rule in style.split(";"):
+        name, _, value = rule.partition(":")
+        name = name.strip()
+        value = value.strip()
+        if not value:
+            continue
+        if name == "color":
+            palette.setColor(QPalette.WindowText, value)
+        elif name in ("background", "background-color"):
+            palette.setColor(QPalette.Window, value)
+    return palette
+
+
 def validate_column_order(config: dict):
     """Validate column/row index order, correct any overlapping indexes"""
     column_set = []
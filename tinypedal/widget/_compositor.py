@@ -0,0 +1,159 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Overlay compositor
+
+Host all overlay widgets as child widgets of one full-screen transparent
+window per screen, instead of one top-level window per widget, which
+reduces window system and compositing cost with large number of widgets.
+"""
+
+from __future__ import annotations
+
+from PySide2.QtCore import QEvent, QObject, QPoint, Qt, QTimer, Slot
+from PySide2.QtGui import QGuiApplication, QRegion, QScreen
+from PySide2.QtWidgets import QWidget
+
+from ..const_app import APP_NAME
+from ..overlay_control import octrl
+from ..setting import cfg
+
+
+class CompositorWindow(QWidget):
+    """Compositor window
+
+    Full-screen transparent window that hosts overlay widgets on one screen.
+    Window mask is limited to visible overlay widgets area, so that other area
+    is not painted and passes mouse input through.
+    """
+
+    def __init__(self, screen: QScreen):
+        super().__init__()
+        self.setWindowTitle(f"{APP_NAME} - Compositor")
+        self.setGeometry(screen.geometry())
+        self.setAttribute(Qt.WA_TranslucentBackground, True)
+        self.setWindowFlag(Qt.FramelessWindowHint, True)
+        self.setWindowFlag(Qt.WindowStaysOnTopHint, True)
+        if not cfg.overlay["vr_compatibility"]:  # hide taskbar widget
+            self.setWindowFlag(Qt.Tool, True)
+        if cfg.compatibility["enable_bypass_window_manager"]:
+            self.setWindowFlag(Qt.X11BypassWindowManagerHint, True)
+        self.setWindowFlag(Qt.WindowTransparentForInput, cfg.overlay["fixed_position"])
+
+        # Coalesce mask update from multiple child events
+        self._mask_timer = QTimer(self)
+        self._mask_timer.setSingleShot(True)
+        self._mask_timer.timeout.connect(self.update_mask)
+
+        octrl.state.locked.connect(self.__toggle_lock)
+        octrl.state.vr_compat.connect(self.__toggle_vr_compat)
+
+    def add_overlay(self, overlay: QWidget):
+        """Add overlay widget as child widget"""
+        overlay.setParent(self)
+        overlay.installEventFilter(self)
+        self._mask_timer.start(0)
+
+    def remove_overlay(self, overlay: QWidget):
+        """Remove overlay widget from child widget"""
+        overlay.removeEventFilter(self)
+        overlay.setParent(None)
+        self._mask_timer.start(0)
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        """Update mask if overlay widget geometry or visibility changed
+
+        ShowToParent & HideToParent are sent on changing widget visibility,
+        even while compositor window itself is hidden.
+        """
+        if event.type() in (QEvent.Move, QEvent.Resize, QEvent.ShowToParent, QEvent.HideToParent):
+            self._mask_timer.start(0)
+        return False
+
+    def update_mask(self):
+        """Update window mask from visible overlay widgets, hide if none visible
+
+        Child visibility is checked relative to compositor window,
+        as child widget is never visible while compositor window is hidden.
+        """
+        region = QRegion()
+        for child in self.children():
+            if isinstance(child, QWidget) and child.isVisibleTo(self):
+                region = region.united(child.geometry())
+        if region.isEmpty():
+            self.hide()
+        else:
+            self.setMask(region)
+            self.show()
+
+    @Slot(bool)
+    def __toggle_lock(self, locked: bool):
+        """Toggle window lock state"""
+        self.setWindowFlag(Qt.WindowTransparentForInput, locked)
+        self.update_mask()  # need re-show after changing flag
+
+    @Slot(bool)
+    def __toggle_vr_compat(self, enabled: bool):
+        """Toggle window VR compatibility"""
+        self.setWindowFlag(Qt.Tool, not enabled)
+        self.update_mask()
+
+
+class OverlayCompositor:
+    """Overlay compositor
+
+    Compositor window is created on demand for each screen,
+    and is kept hidden while no overlay widget is visible.
+    """
+
+    __slots__ = (
+        "_windows",
+    )
+
+    def __init__(self):
+        self._windows: dict[str, CompositorWindow] = {}
+
+    def attach(self, overlay: QWidget, pos_x: int, pos_y: int) -> QPoint:
+        """Attach overlay widget to compositor window of screen at global position
+
+        Returns:
+            Compositor window origin (global position).
+        """
+        screen = QGuiApplication.screenAt(QPoint(pos_x, pos_y)) or QGuiApplication.primaryScreen()
+        window = self._windows.get(screen.name())
+        if window is None:
+            window = self._windows[screen.name()] = CompositorWindow(screen)
+        if overlay.parentWidget() is not window:
+            parent = overlay.parentWidget()
+            if isinstance(parent, CompositorWindow):
+                parent.remove_overlay(overlay)
+            window.add_overlay(overlay)
+        origin = window.geometry().topLeft()
+        overlay.move(pos_x - origin.x(), pos_y - origin.y())
+        return origin
+
+    def clear(self):
+        """Close all compositor windows"""
+        for window in self._windows.values():
+            window.close()
+        self._windows.clear()
+
+
+compositor = OverlayCompositor()
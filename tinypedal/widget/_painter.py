@@ -22,11 +22,29 @@ Overlay base painter class.
 
 from __future__ import annotations
 
-from PySide2.QtCore import QRectF, Qt
-from PySide2.QtGui import QFont, QPainter, QPen, QPixmap
+from collections import OrderedDict
+from time import monotonic
+from typing import Callable
+
+from PySide2.QtCore import QBasicTimer, QObject, QPointF, QRectF, Qt
+from PySide2.QtGui import (
+    QColor,
+    QFont,
+    QPainter,
+    QPen,
+    QPixmap,
+    QStaticText,
+    QSurfaceFormat,
+    QTransform,
+)
 from PySide2.QtWidgets import QWidget
 
-from ..const_common import GEAR_SEQUENCE
+try:
+    from PySide2.QtWidgets import QOpenGLWidget
+except ImportError:  # moved to QtOpenGLWidgets in qt6
+    from PySide6.QtOpenGLWidgets import QOpenGLWidget
+
+from ..const_common import FLOAT_INF, GEAR_SEQUENCE
 
 
 def split_pixmap_icon(
@@ -39,6 +57,219 @@ def split_pixmap_icon(
     return pixmap
 
 
+class StaticTextCache:
+    """Static text cache
+
+    Shared LRU cache of prepared static text, keyed on font & text string.
+    Frequently drawn readings (lap time, gap, temperature, etc.) skip
+    text layout once cached, least recently used text is removed first.
+
+    Args:
+        max_size: max number of cached text.
+    """
+
+    __slots__ = (
+        "_cache",
+        "_max_size",
+    )
+
+    def __init__(self, max_size: int = 4096):
+        self._cache: OrderedDict[tuple[str, str], QStaticText] = OrderedDict()
+        self._max_size = max(max_size, 1)
+
+    def get(self, text: str, font: QFont) -> QStaticText:
+        """Get prepared static text"""
+        key = (font.key(), text)
+        static_text = self._cache.get(key)
+        if static_text is not None:
+            self._cache.move_to_end(key)
+            return static_text
+        static_text = QStaticText(text)
+        static_text.setTextFormat(Qt.PlainText)
+        static_text.prepare(QTransform(), font)
+        self._cache[key] = static_text
+        if len(self._cache) > self._max_size:
+            self._cache.popitem(last=False)
+        return static_text
+
+    def clear(self):
+        """Clear cache"""
+        self._cache.clear()
+
+
+def draw_static_text(painter: QPainter, rect: QRectF, align: Qt.Alignment, text: str):
+    """Draw text with cached static text, aligned in rect
+
+    Text is laid out with painter font.
+    """
+    static_text = text_cache.get(text, painter.font())
+    size = static_text.size()
+    if align & Qt.AlignLeft:
+        pos_x = rect.left()
+    elif align & Qt.AlignRight:
+        pos_x = rect.right() - size.width()
+    else:
+        pos_x = rect.left() + (rect.width() - size.width()) / 2
+    if align & Qt.AlignTop:
+        pos_y = rect.top()
+    elif align & Qt.AlignBottom:
+        pos_y = rect.bottom() - size.height()
+    else:
+        pos_y = rect.top() + (rect.height() - size.height()) / 2
+    painter.drawStaticText(QPointF(round(pos_x), round(pos_y)), static_text)
+
+
+class PaintCanvas(QWidget):
+    """Paint canvas (raster)
+
+    Draw whole widget content via paint method, which is shared with OpenGL canvas.
+    """
+
+    def __init__(self, parent, paint_method: Callable[[QPainter], None]):
+        super().__init__(parent)
+        self._paint_method = paint_method
+        self.setAttribute(Qt.WA_TransparentForMouseEvents, True)
+
+    def paintEvent(self, event):
+        """Draw"""
+        self._paint_method(QPainter(self))
+
+
+class OpenGLPaintCanvas(QOpenGLWidget):
+    """Paint canvas (OpenGL)
+
+    Draw whole widget content via paint method into OpenGL framebuffer,
+    which is composited by GPU (or software OpenGL) instead of raster painting.
+    """
+
+    def __init__(self, parent, paint_method: Callable[[QPainter], None]):
+        super().__init__(parent)
+        self._paint_method = paint_method
+        surface_format = QSurfaceFormat()
+        surface_format.setAlphaBufferSize(8)
+        surface_format.setSamples(4)  # multisample antialiasing
+        self.setFormat(surface_format)
+        self.setAttribute(Qt.WA_AlwaysStackOnTop, True)  # required for transparency
+        self.setAttribute(Qt.WA_TransparentForMouseEvents, True)
+
+    def paintGL(self):
+        """Draw"""
+        painter = QPainter(self)
+        painter.setCompositionMode(QPainter.CompositionMode_Source)
+        painter.fillRect(self.rect(), Qt.transparent)
+        painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+        self._paint_method(painter)
+
+
+class FrameInput:
+    """Frame interpolation input
+
+    Keep last two telemetry samples with timestamps, and linearly extrapolate
+    values at frame time. Extrapolation is limited to one sample interval,
+    and clamped to value range.
+
+    Args:
+        callback: update method, called with extrapolated values if changed.
+        min_value: minimum value range.
+        max_value: maximum value range.
+    """
+
+    __slots__ = (
+        "_callback",
+        "_min",
+        "_max",
+        "_last",
+        "_time0",
+        "_time1",
+        "_samples0",
+        "_samples1",
+    )
+
+    def __init__(self, callback: Callable, min_value: float = -FLOAT_INF, max_value: float = FLOAT_INF):
+        self._callback = callback
+        self._min = min_value
+        self._max = max_value
+        self._last = None
+        self._time0 = 0.0
+        self._time1 = 0.0
+        self._samples0: tuple[float, ...] = ()
+        self._samples1: tuple[float, ...] = ()
+
+    def add_sample(self, timestamp: float, values: tuple[float, ...]):
+        """Add telemetry sample"""
+        self._time0 = self._time1
+        self._samples0 = self._samples1
+        self._time1 = timestamp
+        self._samples1 = values
+
+    def update(self, timestamp: float) -> bool:
+        """Update extrapolated values, returns true if values still changing"""
+        interval = self._time1 - self._time0
+        if interval > 0 and len(self._samples0) == len(self._samples1) and self._samples0 != self._samples1:
+            ratio = min((timestamp - self._time1) / interval, 1.0)
+            values = tuple(
+                min(max(value1 + (value1 - value0) * ratio, self._min), self._max)
+                for value0, value1 in zip(self._samples0, self._samples1)
+            )
+            changing = ratio < 1
+        else:
+            values = self._samples1
+            changing = False
+        if self._last != values:
+            self._last = values
+            self._callback(*values)
+        return changing
+
+
+class FrameInterpolator(QObject):
+    """Frame-rate-independent interpolation
+
+    Telemetry samples are added at widget update interval, and target inputs
+    are updated at (higher) frame interval with extrapolated values, so that
+    gauges move smoothly without reading telemetry at frame rate.
+    Frame timer only runs while values are changing.
+
+    Args:
+        parent: parent widget.
+        frame_interval: frame interval in milliseconds.
+    """
+
+    def __init__(self, parent, frame_interval: int = 16):
+        super().__init__(parent)
+        self._frame_interval = max(frame_interval, 1)
+        self._frame_timer = QBasicTimer()
+        self._inputs: list[FrameInput] = []
+
+    def add_input(
+        self, callback: Callable, min_value: float = -FLOAT_INF, max_value: float = FLOAT_INF
+    ) -> FrameInput:
+        """Add interpolation input"""
+        frame_input = FrameInput(callback, min_value, max_value)
+        self._inputs.append(frame_input)
+        return frame_input
+
+    def add_sample(self, target: FrameInput, *values: float):
+        """Add telemetry sample to target input, and start frame timer"""
+        target.add_sample(monotonic(), values)
+        if not self._frame_timer.isActive():
+            self._frame_timer.start(self._frame_interval, self)
+            target.update(monotonic())
+
+    def stop(self):
+        """Stop frame timer"""
+        self._frame_timer.stop()
+
+    def timerEvent(self, event):
+        """Update inputs at frame interval"""
+        timestamp = monotonic()
+        changing = False
+        for frame_input in self._inputs:
+            if frame_input.update(timestamp):
+                changing = True
+        if not changing:
+            self._frame_timer.stop()
+
+
 class WheelGaugeBar(QWidget):
     """Wheel gauge bar"""
 
@@ -109,7 +340,7 @@ class WheelGaugeBar(QWidget):
         if self.mark_color:
             painter.fillRect(self.rect_mark, self.mark_color)
         painter.setPen(self.pen)
-        painter.drawText(self.rect_text, self.align, f"{self.last:.0f}")
+        draw_static_text(painter, self.rect_text, self.align, f"{self.last:.0f}")
 
 
 class PedalInputBar(QWidget):
@@ -193,7 +424,7 @@ class PedalInputBar(QWidget):
             painter.fillRect(self.rect_max, self.max_color)
         if self.show_reading:
             painter.setPen(self.pen)
-            painter.drawText(self.rect_text, Qt.AlignCenter, f"{self.input_reading:.0f}")
+            draw_static_text(painter, self.rect_text, Qt.AlignCenter, f"{self.input_reading:.0f}")
 
 
 class ProgressBar(QWidget):
@@ -251,7 +482,7 @@ class ProgressBar(QWidget):
         painter.fillRect(self.rect_input, self.input_color)
         if self.show_reading:
             painter.setPen(self.pen)
-            painter.drawText(self.rect_text, self.align, f"{self.input_reading:.{self.decimals}f}")
+            draw_static_text(painter, self.rect_text, self.align, f"{self.input_reading:.{self.decimals}f}")
 
 
 class FuelLevelBar(QWidget):
@@ -350,10 +581,10 @@ class GearGaugeBar(QWidget):
         if self.color_index == -4:  # flicker trigger
             return
         painter.setPen(self.pen)
-        painter.drawText(self.rect_gear, Qt.AlignCenter, self.gear)
+        draw_static_text(painter, self.rect_gear, Qt.AlignCenter, self.gear)
         if self.show_speed:
             painter.setFont(self.font_speed)
-            painter.drawText(self.rect_speed, Qt.AlignCenter, f"{self.speed:03.0f}")
+            draw_static_text(painter, self.rect_speed, Qt.AlignCenter, f"{self.speed:03.0f}")
 
 
 class TextBar(QWidget):
@@ -385,4 +616,264 @@ class TextBar(QWidget):
         pen = QPen()
         pen.setColor(self.fg_color)
         painter.setPen(pen)
-        painter.drawText(self.rect_text, Qt.AlignCenter, self.text)
+        draw_static_text(painter, self.rect_text, Qt.AlignCenter, self.text)
+
+
+class TableCell:
+    """Table cell
+
+    Cell data is drawn by parent TableBar in a single paint event.
+    Text is prepared as static text from shared text cache.
+    Text & pixmap position is relative to cell position.
+    """
+
+    __slots__ = (
+        "last",
+        "bar_set",
+        "_table",
+        "_styles",
+        "_align",
+        "x",
+        "width",
+        "style",
+        "text",
+        "text_x",
+        "text_y",
+        "pixmap",
+        "pixmap_x",
+        "pixmap_y",
+    )
+
+    def __init__(
+        self,
+        table: TableBar,
+        styles: tuple[int, ...],
+        x: int,
+        width: int,
+        align: Qt.Alignment,
+    ):
+        self.last = None
+        self.bar_set: tuple[TableCell, ...] = ()
+        self._table = table
+        self._styles = styles
+        self._align = align
+        self.x = x
+        self.width = width
+        self.style = styles[0]
+        self.text: QStaticText | None = None
+        self.text_x = 0
+        self.text_y = 0
+        self.pixmap: QPixmap | None = None
+        self.pixmap_x = 0
+        self.pixmap_y = 0
+
+    def set_text(self, text: str, style: int = 0):
+        """Set text & style index"""
+        self.style = self._styles[style]
+        if text:
+            static_text = text_cache.get(text, self._table.text_font)
+            size = static_text.size()
+            if self._align & Qt.AlignLeft:
+                self.text_x = 0
+            elif self._align & Qt.AlignRight:
+                self.text_x = round(self.width - size.width())
+            else:
+                self.text_x = round((self.width - size.width()) / 2)
+            self.text_y = round((self._table.row_height - size.height()) / 2)
+            self.text = static_text
+        else:
+            self.text = None
+        self._table.mark_dirty()
+
+    def set_pixmap(self, pixmap: QPixmap | None, style: int = 0):
+        """Set pixmap (centered) & style index, clear pixmap if None"""
+        self.style = self._styles[style]
+        if pixmap is None or pixmap.isNull():
+            self.pixmap = None
+        else:
+            self.pixmap_x = (self.width - pixmap.width()) // 2
+            self.pixmap_y = (self._table.row_height - pixmap.height()) // 2
+            self.pixmap = pixmap
+        self._table.mark_dirty()
+
+    def set_style(self, style: int = 0):
+        """Set style index"""
+        self.style = self._styles[style]
+        self._table.mark_dirty()
+
+    def set_color(self, text: str, fg_color: str = "", bg_color: str = ""):
+        """Set text with color not predefined in column styles"""
+        self._styles = (self._table.add_style(fg_color, bg_color),)
+        self.set_text(text)
+
+    def clear(self):
+        """Clear text & pixmap"""
+        self.text = None
+        self.pixmap = None
+        self._table.mark_dirty()
+
+
+class TableBar(QWidget):
+    """Table bar
+
+    Draw all table cells in a single paint event, replaces per-cell QLabel grid.
+    Column rects are precomputed on setup, cell colors are palette-indexed.
+
+    Row state: 0 show, 1 draw gap (separator, hide if zero separator height), 2 hide.
+    """
+
+    def __init__(
+        self,
+        parent,
+        font: QFont,
+        row_count: int,
+        row_height: int,
+        row_gap: int = 0,
+        separator_height: int = 0,
+        hide_start: int = 99999,
+    ):
+        super().__init__(parent)
+        self.text_font = font
+        self.row_height = row_height
+        self.row_gap = row_gap
+        self.separator_height = separator_height
+        self.row_count = row_count
+        self.row_state = [int(hide_start <= index) * 2 for index in range(row_count)]
+        self._row_tops: list[tuple[int, int]] = []
+        self._rows: tuple[list[TableCell], ...] = tuple([] for _ in range(row_count))
+        self._columns: list[tuple[int, int, tuple[TableCell, ...], int, bool]] = []
+        self._width = 0
+        self._dirty = False
+        # Palette
+        self._palette_index: dict[tuple[str, str], int] = {}
+        self._pens: list[QPen | None] = []
+        self._brushes: list[QColor | None] = []
+        self.setFont(font)
+
+    def add_style(self, fg_color: str = "", bg_color: str = "") -> int:
+        """Add style to palette, returns palette index"""
+        key = (fg_color, bg_color)
+        index = self._palette_index.get(key)
+        if index is None:
+            index = self._palette_index[key] = len(self._pens)
+            self._pens.append(QPen(QColor(fg_color)) if fg_color else None)
+            self._brushes.append(QColor(bg_color) if bg_color else None)
+        return index
+
+    def add_column(
+        self,
+        column_index: int,
+        width: int,
+        styles: tuple[tuple[str, str], ...],
+        align: Qt.Alignment = Qt.AlignCenter,
+        sub_count: int = 0,
+        sub_width: int = 0,
+        sub_styles: tuple[tuple[str, str], ...] = (("", ""),),
+        sub_padding: int = 0,
+        sub_reversed: bool = False,
+    ) -> tuple[TableCell, ...]:
+        """Add column, returns column cells of each row
+
+        Args:
+            column_index: column display order.
+            width: column width in pixel.
+            styles: column styles, tuple of (foreground color, background color).
+            align: text alignment.
+            sub_count: number of sub cells in each column cell, stored in cell bar_set.
+            sub_width: sub cell width in pixel.
+            sub_styles: sub cell styles.
+            sub_padding: left & right padding of sub cells in pixel.
+            sub_reversed: set sub cells in reversed order.
+
+        Returns:
+            Tuple of TableCell, one per row.
+        """
+        if sub_count > 0:
+            width = max(width, sub_width * sub_count + sub_padding * 2)
+        column_styles = tuple(self.add_style(*style) for style in styles)
+        sub_column_styles = tuple(self.add_style(*style) for style in sub_styles)
+        column_cells = tuple(
+            TableCell(self, column_styles, 0, width, align) for _ in range(self.row_count)
+        )
+        for cell in column_cells:
+            cell.bar_set = tuple(
+                TableCell(self, sub_column_styles, 0, sub_width, align) for _ in range(sub_count)
+            )
+        self._columns.append((column_index, width, column_cells, sub_padding, sub_reversed))
+        self._update_columns()
+        return column_cells
+
+    def _update_columns(self):
+        """Update column cell position in display order"""
+        pos_x = 0
+        for row_cells in self._rows:
+            row_cells.clear()
+        for _, width, column_cells, sub_padding, sub_reversed in sorted(
+            self._columns, key=lambda column: column[0]):
+            for row_cells, cell in zip(self._rows, column_cells):
+                cell.x = pos_x
+                row_cells.append(cell)
+                if sub_reversed:
+                    sub_cells = reversed(cell.bar_set)
+                else:
+                    sub_cells = cell.bar_set
+                sub_x = pos_x + sub_padding
+                for sub_cell in sub_cells:
+                    sub_cell.x = sub_x
+                    sub_x += sub_cell.width
+                    row_cells.append(sub_cell)
+            pos_x += width
+        self._width = pos_x
+        self._update_rows()
+
+    def _update_rows(self):
+        """Update row position & table size"""
+        pos_y = 0
+        row_tops = []
+        for row_index, state in enumerate(self.row_state):
+            if state == 0:
+                row_tops.append((row_index, pos_y))
+                pos_y += self.row_height + self.row_gap
+            elif state == 1 and self.separator_height > 0:
+                pos_y += self.separator_height + self.row_gap
+        self._row_tops = row_tops
+        self.setFixedSize(self._width, max(pos_y - self.row_gap, 0))
+        self.mark_dirty()
+
+    def set_row_state(self, row_index: int, state: int):
+        """Set row state: 0 show, 1 draw gap (separator), 2 hide"""
+        if self.row_state[row_index] != state:
+            self.row_state[row_index] = state
+            self._update_rows()
+
+    def mark_dirty(self):
+        """Schedule a single repaint for all changes"""
+        if not self._dirty:
+            self._dirty = True
+            self.update()
+
+    def paintEvent(self, event):
+        """Draw"""
+        self._dirty = False
+        painter = QPainter(self)
+        painter.setFont(self.text_font)
+        pens = self._pens
+        brushes = self._brushes
+        row_height = self.row_height
+        last_pen = None
+        for row_index, top in self._row_tops:
+            for cell in self._rows[row_index]:
+                brush = brushes[cell.style]
+                if brush is not None:
+                    painter.fillRect(cell.x, top, cell.width, row_height, brush)
+                if cell.pixmap is not None:
+                    painter.drawPixmap(cell.x + cell.pixmap_x, top + cell.pixmap_y, cell.pixmap)
+                if cell.text is not None:
+                    pen = pens[cell.style]
+                    if pen is not None and pen is not last_pen:
+                        painter.setPen(pen)
+                        last_pen = pen
+                    painter.drawStaticText(cell.x + cell.text_x, top + cell.text_y, cell.text)
+
+
+text_cache = StaticTextCache()
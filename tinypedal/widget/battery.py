@@ -61,7 +61,7 @@ class Realtime(Overlay):
             )
             self.bar_charge = self.set_qlabel(
                 text="BATTERY",
-                style=self.bar_style_charge[0],
+                palette_style=self.bar_style_charge[0],
                 width=bar_width,
             )
             self.set_primary_orient(
@@ -168,8 +168,8 @@ class Realtime(Overlay):
         if target.last != data:
             target.last = data
             target.setText(f"B{data: >7.2f}"[:8])
-            target.setStyleSheet(
-                self.bar_style_charge[data <= self.wcfg["low_battery_threshold"]])
+            self.set_style_palette(
+                target, self.bar_style_charge[data <= self.wcfg["low_battery_threshold"]])
 
     def update_drain(self, target, data):
         """Battery drain"""
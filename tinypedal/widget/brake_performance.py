@@ -98,7 +98,7 @@ class Realtime(Overlay):
             )
             self.bar_delta_rate = self.set_qlabel(
                 text="+0.00",
-                style=self.bar_style_delta_rate[2],
+                palette_style=self.bar_style_delta_rate[2],
                 width=bar_width,
                 last=0,
             )
@@ -200,7 +200,7 @@ class Realtime(Overlay):
             else:
                 text = f"{data:+.2f}"
             target.setText(text[:5])
-            target.setStyleSheet(self.bar_style_delta_rate[data > 0])
+            self.set_style_palette(target, self.bar_style_delta_rate[data > 0])
 
     def update_lock_time_f(self, target, data):
         """Front wheel lock duration"""
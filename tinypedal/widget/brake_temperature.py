@@ -82,7 +82,7 @@ class Realtime(Overlay):
         )
         self.bars_btemp = self.set_qlabel(
             text=TEXT_NA,
-            style=bar_style_btemp,
+            palette_style=bar_style_btemp,
             width=font_m.width * text_width + bar_padx,
             count=4,
             last=0,
@@ -109,7 +109,7 @@ class Realtime(Overlay):
             )
             self.bars_btavg = self.set_qlabel(
                 text=TEXT_NA,
-                style=self.bar_style_btavg[0],
+                palette_style=self.bar_style_btavg[0],
                 width=font_m.width * text_width + bar_padx,
                 count=4,
                 last=0,
@@ -177,7 +177,7 @@ class Realtime(Overlay):
                 target.setText(TEXT_PLACEHOLDER)
             else:
                 target.setText(f"{self.unit_temp(data):0{self.leading_zero}f}{self.sign_text}")
-            target.setStyleSheet(calc.select_grade(self.heatmap_styles[index], data))
+            self.set_style_palette(target, calc.select_grade(self.heatmap_styles[index], data))
 
     def update_btavg(self, target, data, highlighted=False):
         """Brake average temperature"""
@@ -187,7 +187,7 @@ class Realtime(Overlay):
                 target.setText(TEXT_PLACEHOLDER)
             else:
                 target.setText(f"{self.unit_temp(data):0{self.leading_zero}f}{self.sign_text}")
-            target.setStyleSheet(self.bar_style_btavg[highlighted])
+            self.set_style_palette(target, self.bar_style_btavg[highlighted])
 
     # Additional methods
     def update_heatmap(self, class_name: str):
@@ -69,7 +69,7 @@ class Realtime(Overlay):
             )
             self.bars_remain = self.set_qlabel(
                 text=TEXT_NA,
-                style=self.bar_style_remain[0],
+                palette_style=self.bar_style_remain[0],
                 width=bar_width,
                 count=4,
                 last=0,
@@ -103,7 +103,7 @@ class Realtime(Overlay):
             )
             self.bars_diff = self.set_qlabel(
                 text=TEXT_NA,
-                style=self.bar_style_diff[0],
+                palette_style=self.bar_style_diff[0],
                 width=bar_width,
                 count=4,
             )
@@ -136,7 +136,7 @@ class Realtime(Overlay):
             )
             self.bars_laps = self.set_qlabel(
                 text=TEXT_NA,
-                style=self.bar_style_laps[0],
+                palette_style=self.bar_style_laps[0],
                 width=bar_width,
                 count=4,
             )
@@ -169,7 +169,7 @@ class Realtime(Overlay):
             )
             self.bars_mins = self.set_qlabel(
                 text=TEXT_NA,
-                style=self.bar_style_mins[0],
+                palette_style=self.bar_style_mins[0],
                 width=bar_width,
                 count=4,
             )
@@ -229,8 +229,8 @@ class Realtime(Overlay):
         if target.last != data:
             target.last = data
             target.setText(self.format_num(data))
-            target.setStyleSheet(
-                self.bar_style_remain[data <= threshold_remaining]
+            self.set_style_palette(
+                target, self.bar_style_remain[data <= threshold_remaining]
             )
 
     def update_diff(self, target, data):
@@ -238,8 +238,8 @@ class Realtime(Overlay):
         if target.last != data:
             target.last = data
             target.setText(self.format_num(data))
-            target.setStyleSheet(
-                self.bar_style_diff[data > self.wcfg["warning_threshold_wear"]]
+            self.set_style_palette(
+                target, self.bar_style_diff[data > self.wcfg["warning_threshold_wear"]]
             )
 
     def update_laps(self, target, data):
@@ -247,8 +247,8 @@ class Realtime(Overlay):
         if target.last != data:
             target.last = data
             target.setText(self.format_num(data))
-            target.setStyleSheet(
-                self.bar_style_laps[data <= self.wcfg["warning_threshold_laps"]]
+            self.set_style_palette(
+                target, self.bar_style_laps[data <= self.wcfg["warning_threshold_laps"]]
             )
 
     def update_mins(self, target, data):
@@ -256,8 +256,8 @@ class Realtime(Overlay):
         if target.last != data:
             target.last = data
             target.setText(self.format_num(data))
-            target.setStyleSheet(
-                self.bar_style_mins[data <= self.wcfg["warning_threshold_minutes"]]
+            self.set_style_palette(
+                target, self.bar_style_mins[data <= self.wcfg["warning_threshold_minutes"]]
             )
 
     # Additional methods
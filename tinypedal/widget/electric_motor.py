@@ -67,7 +67,7 @@ class Realtime(Overlay):
             )
             self.bar_motor = self.set_qlabel(
                 text="M TEMP",
-                style=self.bar_style_motor[0],
+                palette_style=self.bar_style_motor[0],
                 width=bar_width,
             )
             self.set_primary_orient(
@@ -87,7 +87,7 @@ class Realtime(Overlay):
             )
             self.bar_water = self.set_qlabel(
                 text="W TEMP",
-                style=self.bar_style_water[0],
+                palette_style=self.bar_style_water[0],
                 width=bar_width,
             )
             self.set_primary_orient(
@@ -177,14 +177,14 @@ class Realtime(Overlay):
         if target.last != data:
             target.last = data
             target.setText(f"M{self.unit_temp(data): >6.1f}°")
-            target.setStyleSheet(self.bar_style_motor[data >= self.wcfg["overheat_threshold_motor"]])
+            self.set_style_palette(target, self.bar_style_motor[data >= self.wcfg["overheat_threshold_motor"]])
 
     def update_water(self, target, data):
         """Water temperature"""
         if target.last != data:
             target.last = data
             target.setText(f"W{self.unit_temp(data): >6.1f}°")
-            target.setStyleSheet(self.bar_style_water[data >= self.wcfg["overheat_threshold_water"]])
+            self.set_style_palette(target, self.bar_style_water[data >= self.wcfg["overheat_threshold_water"]])
 
     def update_rpm(self, target, data):
         """Motor rpm"""
@@ -74,7 +74,7 @@ class Realtime(Overlay):
         self.symbol_dist = set_symbol_distance(self.cfg.units["distance_unit"])
 
         # Config canvas
-        self.resize(self.display_width, self.display_height)
+        self.canvas = self.set_canvas(self.display_width, self.display_height)
         self.pixmap_background = QPixmap(self.display_width, self.display_height)
         self.pixmap_progress = QPixmap(self.display_width, self.display_height)
         self.pixmap_progress_line = QPixmap(self.display_width, self.display_height)
@@ -105,7 +105,7 @@ class Realtime(Overlay):
         temp_veh_pos = self.display_width * api.read.lap.progress()
         if self.veh_pos != temp_veh_pos:
             self.veh_pos = temp_veh_pos
-            self.update()
+            self.canvas.update()
 
     # GUI update methods
     def update_elevation(self, data):
@@ -119,9 +119,8 @@ class Realtime(Overlay):
             self.draw_progress_line(map_path)
             self.draw_marks(map_path)
 
-    def paintEvent(self, event):
+    def draw_canvas(self, painter):
         """Draw"""
-        painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing, True)
         painter.drawPixmap(0, 0, self.pixmap_background)
 
@@ -163,7 +162,8 @@ class Realtime(Overlay):
             self.map_scaled, self.map_range, self.map_scale = calc.scale_elevation(
                 raw_coords,
                 self.display_width,
-                self.display_height - self.display_margin_top - self.display_margin_bottom)
+                self.display_height - self.display_margin_top - self.display_margin_bottom,
+                minfo.mapping.elevationsRange)
 
             # Correct start & finish nodes position
             sf_y_average = (self.map_scaled[0][1] + self.map_scaled[-1][1]) * 0.5
@@ -172,20 +172,22 @@ class Realtime(Overlay):
             map_path.moveTo(-999, self.map_scaled[-2][1])  # 2nd last node y pos
 
             # Set middle nodes
-            total_nodes = len(self.map_scaled) - 1
-            skip_node = calc.skip_map_nodes(total_nodes, self.display_width, self.display_detail_level)
+            # Select cached LOD nodes, tolerance in pixels converted to elevation unit
+            lod_nodes = calc.select_display_lod_nodes(
+                minfo.mapping.elevationsLod, self.display_detail_level, self.map_scale[1])
+            if lod_nodes is None or lod_nodes[-1] >= len(self.map_scaled):
+                lod_nodes = range(len(self.map_scaled))
+            total_nodes = lod_nodes[-1]
             last_dist = 0
-            last_skip = 0
-            for index, coords in enumerate(self.map_scaled):
+            for index in lod_nodes:
+                coords = self.map_scaled[index]
                 if index == 0:
                     map_path.lineTo(0, sf_y_average)
                 elif index >= total_nodes:  # don't skip last node
                     map_path.lineTo(self.display_width, sf_y_average)
-                elif coords[0] > last_dist and last_skip >= skip_node:
+                elif coords[0] > last_dist:
                     map_path.lineTo(*coords)
-                    last_skip = 0
                     last_dist = coords[0]
-                last_skip += 1
 
             # Set boundary end node
             map_path.lineTo(self.display_width + 999, self.map_scaled[1][1])  # 2nd node y pos
@@ -75,7 +75,7 @@ class Realtime(Overlay):
             )
             self.bar_oil = self.set_qlabel(
                 text="Oil T",
-                style=self.bar_style_oil[0],
+                palette_style=self.bar_style_oil[0],
                 width=bar_width,
             )
             self.set_primary_orient(
@@ -95,7 +95,7 @@ class Realtime(Overlay):
             )
             self.bar_water = self.set_qlabel(
                 text="Water T",
-                style=self.bar_style_water[0],
+                palette_style=self.bar_style_water[0],
                 width=bar_width,
             )
             self.set_primary_orient(
@@ -227,14 +227,14 @@ class Realtime(Overlay):
         if target.last != data:
             target.last = data
             target.setText(f"O{self.unit_temp(data): >6.1f}°")
-            target.setStyleSheet(self.bar_style_oil[data >= self.wcfg["overheat_threshold_oil"]])
+            self.set_style_palette(target, self.bar_style_oil[data >= self.wcfg["overheat_threshold_oil"]])
 
     def update_water(self, target, data):
         """Water temperature"""
         if target.last != data:
             target.last = data
             target.setText(f"W{self.unit_temp(data): >6.1f}°")
-            target.setStyleSheet(self.bar_style_water[data >= self.wcfg["overheat_threshold_water"]])
+            self.set_style_palette(target, self.bar_style_water[data >= self.wcfg["overheat_threshold_water"]])
 
     def update_turbo(self, target, data):
         """Turbo pressure"""
@@ -72,7 +72,7 @@ class Realtime(Overlay):
             )
             self.bar_pit_timer = self.set_qlabel(
                 text="PITST0P",
-                style=self.bar_style_pit_timer[0],
+                palette_style=self.bar_style_pit_timer[0],
                 width=bar_width,
             )
             self.set_primary_orient(
@@ -156,7 +156,7 @@ class Realtime(Overlay):
             )
             self.bar_startlights = self.set_qlabel(
                 text="SLIGHTS",
-                style=self.bar_style_startlights[0],
+                palette_style=self.bar_style_startlights[0],
                 width=bar_width,
             )
             self.set_primary_orient(
@@ -208,7 +208,7 @@ class Realtime(Overlay):
             )
             self.bar_finish_state = self.set_qlabel(
                 text="FINISH",
-                style=self.bar_style_finish_state[0],
+                palette_style=self.bar_style_finish_state[0],
                 width=bar_width,
             )
             self.set_primary_orient(
@@ -303,7 +303,7 @@ class Realtime(Overlay):
                     color = self.bar_style_pit_timer[2]
                     state = self.wcfg["pit_closed_text"]
                 target.setText(state)
-                target.setStyleSheet(color)
+                self.set_style_palette(target, color)
                 target.show()
             else:
                 target.hide()
@@ -354,11 +354,11 @@ class Realtime(Overlay):
             target.last = data
             if data > 0:
                 target.setText(f"{self.wcfg['red_lights_text'][:6]: <6}{data}")
-                target.setStyleSheet(self.bar_style_startlights[0])
+                self.set_style_palette(target, self.bar_style_startlights[0])
                 target.show()
             elif data == 0:
                 target.setText(self.wcfg["green_flag_text"])
-                target.setStyleSheet(self.bar_style_startlights[1])
+                self.set_style_palette(target, self.bar_style_startlights[1])
                 target.show()
             else:
                 target.hide()
@@ -389,11 +389,11 @@ class Realtime(Overlay):
             target.last = data
             if data == 1:
                 target.setText(self.wcfg["finish_text"])
-                target.setStyleSheet(self.bar_style_finish_state[0])
+                self.set_style_palette(target, self.bar_style_finish_state[0])
                 target.show()
             elif data == 3:
                 target.setText(self.wcfg["disqualify_text"])
-                target.setStyleSheet(self.bar_style_finish_state[1])
+                self.set_style_palette(target, self.bar_style_finish_state[1])
                 target.show()
             else:
                 target.hide()
@@ -107,7 +107,7 @@ class Realtime(Overlay):
             )
             self.bar_df_front = self.set_qlabel(
                 text=TEXT_NA,
-                style=self.bar_style_df_front[0],
+                palette_style=self.bar_style_df_front[0],
                 width=bar_width,
             )
             self.set_primary_orient(
@@ -127,7 +127,7 @@ class Realtime(Overlay):
             )
             self.bar_df_rear = self.set_qlabel(
                 text=TEXT_NA,
-                style=self.bar_style_df_rear[0],
+                palette_style=self.bar_style_df_rear[0],
                 width=bar_width,
             )
             self.set_primary_orient(
@@ -187,14 +187,14 @@ class Realtime(Overlay):
         if target.last != data:
             target.last = data
             target.setText(f"F{abs(data):5.0f}"[:6])
-            target.setStyleSheet(self.bar_style_df_front[data < 0])
+            self.set_style_palette(target, self.bar_style_df_front[data < 0])
 
     def update_df_rear(self, target, data):
         """Downforce rear"""
         if target.last != data:
             target.last = data
             target.setText(f"R{abs(data):5.0f}"[:6])
-            target.setStyleSheet(self.bar_style_df_rear[data < 0])
+            self.set_style_palette(target, self.bar_style_df_rear[data < 0])
 
     # Additional methods
     @staticmethod
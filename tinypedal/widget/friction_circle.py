@@ -82,7 +82,7 @@ class Realtime(Overlay):
         )
 
         # Config canvas
-        self.resize(self.area_size, self.area_size)
+        self.canvas = self.set_canvas(self.area_size, self.area_size)
         self.pixmap_background = QPixmap(self.area_size, self.area_size)
         self.pixmap_dot = QPixmap(self.dot_size * 2, self.dot_size * 2)
         self.pixmap_trace = QPixmap(self.area_size, self.area_size)
@@ -137,12 +137,11 @@ class Realtime(Overlay):
             if self.wcfg["show_trace"]:
                 self.data_gforce.append(QPointF(self.last_x, self.last_y))
                 self.draw_trace()
-            self.update()
+            self.canvas.update()
 
     # GUI update methods
-    def paintEvent(self, event):
+    def draw_canvas(self, painter):
         """Draw"""
-        painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing, True)
         # Draw g circle background
         painter.drawPixmap(0, 0, self.pixmap_background)
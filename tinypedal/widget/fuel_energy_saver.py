@@ -124,7 +124,7 @@ class Realtime(Overlay):
         )
         self.bars_delta = self.set_qlabel(
             text=TEXT_PLACEHOLDER,
-            style=self.delta_color[2],
+            palette_style=self.delta_color[2],
             width=bar_width,
             count=self.total_slot,
             last=-MAX_SECONDS,
@@ -242,7 +242,7 @@ class Realtime(Overlay):
                 delta_text = TEXT_PLACEHOLDER
                 style = self.delta_color[2]
             target.setText(delta_text)
-            target.setStyleSheet(style)
+            self.set_style_palette(target, style)
 
     def update_total_laps(self, target, data):
         """Total laps"""
@@ -20,11 +20,13 @@
 Gear Widget
 """
 
+from functools import partial
+
 from ..api_control import api
 from ..module_info import minfo
 from ..units import set_unit_speed
 from ._base import Overlay
-from ._painter import GearGaugeBar, ProgressBar, TextBar
+from ._painter import FrameInterpolator, GearGaugeBar, ProgressBar, TextBar
 
 
 class Realtime(Overlay):
@@ -149,6 +151,14 @@ class Realtime(Overlay):
                 row=1,
             )
 
+        # Frame interpolation
+        if self.wcfg["enable_frame_interpolation"] and self.wcfg["show_rpm_bar"]:
+            self.frame_interp = FrameInterpolator(self, self.wcfg["frame_interpolation_interval"])
+            self.input_rpmbar = self.frame_interp.add_input(
+                partial(self.update_rpmbar, self.bar_rpmbar), 0)
+        else:
+            self.frame_interp = None
+
         # Last data
         self.flicker = 0
         self.shifting_timer_start = 0
@@ -188,7 +198,10 @@ class Realtime(Overlay):
 
         # RPM bar
         if self.wcfg["show_rpm_bar"]:
-            self.update_rpmbar(self.bar_rpmbar, rpm)
+            if self.frame_interp:
+                self.frame_interp.add_sample(self.input_rpmbar, rpm)
+            else:
+                self.update_rpmbar(self.bar_rpmbar, rpm)
 
         # Battery bar
         if self.wcfg["show_battery_bar"]:
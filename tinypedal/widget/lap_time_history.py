@@ -94,11 +94,11 @@ class Realtime(Overlay):
         )
         self.bars_time = self.set_qlabel(
             text="-:--.---",
-            style=self.bar_style_time[1],
+            palette_style=self.bar_style_time[1],
             width=font_m.width * 8 + bar_padx,
             count=history_slot + 1,
         )
-        self.bars_time[0].setStyleSheet(self.bar_style_time[0])
+        self.set_style_palette(self.bars_time[0], self.bar_style_time[0])
         self.set_grid_layout_table_column(
             layout=layout,
             targets=self.bars_time,
@@ -234,7 +234,7 @@ class Realtime(Overlay):
                 self.update_fuel(self.bars_fuel[index], data[3])
                 self.update_wear(self.bars_wear[index], data[4])
                 # Highlight invalid lap time
-                self.bars_time[index].setStyleSheet(self.bar_style_time[2 - data[2]])
+                self.set_style_palette(self.bars_time[index], self.bar_style_time[2 - data[2]])
             elif not self.wcfg["show_empty_history"]:
                 unavailable = True
 
@@ -77,7 +77,7 @@ class Realtime(Overlay):
             )
             self.bar_lap_number = self.set_qlabel(
                 text=text_lap_number,
-                style=self.bar_style_lap_number[0],
+                palette_style=self.bar_style_lap_number[0],
                 width=font_m.width * len(text_lap_number) + bar_padx,
             )
             self.set_primary_orient(
@@ -176,7 +176,7 @@ class Realtime(Overlay):
             lap_total = lap_max if api.read.session.lap_type() else "--"
             text_laps = f"{lap_num + data:02.2f}/{lap_total}"[:9]
             target.setText(f"{self.prefix_lap_number}{text_laps: >9}")
-            target.setStyleSheet(self.bar_style_lap_number[lap_num - lap_max >= -1])
+            self.set_style_palette(target, self.bar_style_lap_number[lap_num - lap_max >= -1])
 
     def update_position(self, target, place, total, prefix):
         """Driver place & total vehicles"""
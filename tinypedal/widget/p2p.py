@@ -66,7 +66,7 @@ class Realtime(Overlay):
             )
             self.bar_charge = self.set_qlabel(
                 text="P2P",
-                style=self.bar_style_charge[1],
+                palette_style=self.bar_style_charge[1],
                 width=font_m.width * 3 + bar_padx,
             )
             layout.addWidget(self.bar_charge, 0, self.wcfg["column_index_battery_charge"])
@@ -83,7 +83,7 @@ class Realtime(Overlay):
             )
             self.bar_timer = self.set_qlabel(
                 text="0.00",
-                style=self.bar_style_timer[0],
+                palette_style=self.bar_style_timer[0],
                 width=font_m.width * 4 + bar_padx,
             )
             layout.addWidget(self.bar_timer, 0, self.wcfg["column_index_activation_timer"])
@@ -119,11 +119,11 @@ class Realtime(Overlay):
             else:
                 format_text = "MAX"
             target.setText(format_text)
-            target.setStyleSheet(self.bar_style_charge[data[1]])
+            self.set_style_palette(target, self.bar_style_charge[data[1]])
 
     def update_active_timer(self, target, data):
         """P2P activation timer"""
         if target.last != data:
             target.last = data
             target.setText(f"{data[0]:.2f}"[:4])
-            target.setStyleSheet(self.bar_style_timer[data[1] != 2])
+            self.set_style_palette(target, self.bar_style_timer[data[1] != 2])
@@ -20,9 +20,11 @@
 Pedal Widget
 """
 
+from functools import partial
+
 from ..api_control import api
 from ._base import Overlay
-from ._painter import PedalInputBar
+from ._painter import FrameInterpolator, PedalInputBar
 
 
 class Realtime(Overlay):
@@ -117,6 +119,24 @@ class Realtime(Overlay):
                 default=1,
             )
 
+        # Frame interpolation
+        if self.wcfg["enable_frame_interpolation"]:
+            self.frame_interp = FrameInterpolator(self, self.wcfg["frame_interpolation_interval"])
+            if self.wcfg["show_throttle"]:
+                self.input_throttle = self.frame_interp.add_input(
+                    partial(self.update_pedal_filtered, self.bar_throttle), 0, 1)
+            if self.wcfg["show_brake"]:
+                self.input_brake = self.frame_interp.add_input(
+                    partial(self.update_pedal_filtered, self.bar_brake), 0, 1)
+            if self.wcfg["show_clutch"]:
+                self.input_clutch = self.frame_interp.add_input(
+                    partial(self.update_pedal_filtered, self.bar_clutch), 0, 1)
+            if self.wcfg["show_ffb_meter"]:
+                self.input_ffb = self.frame_interp.add_input(
+                    partial(self.update_ffb, self.bar_ffb), 0)
+        else:
+            self.frame_interp = None
+
         # Last data
         self.max_brake_pres = 0.01
 
@@ -129,10 +149,13 @@ class Realtime(Overlay):
         if self.wcfg["show_throttle"]:
             raw_throttle = api.read.inputs.throttle_raw()
             if self.wcfg["show_throttle_filtered"]:
-                throttle = raw_throttle + api.read.inputs.throttle()
+                f_throttle = api.read.inputs.throttle()
+            else:
+                f_throttle = raw_throttle
+            if self.frame_interp:
+                self.frame_interp.add_sample(self.input_throttle, raw_throttle, f_throttle)
             else:
-                throttle = raw_throttle + raw_throttle
-            self.update_pedal(self.bar_throttle, throttle, raw_throttle)
+                self.update_pedal(self.bar_throttle, raw_throttle + f_throttle, raw_throttle)
 
         # Brake
         if self.wcfg["show_brake"]:
@@ -142,24 +165,32 @@ class Realtime(Overlay):
                     f_brake = self.filtered_brake_pressure(api.read.brake.pressure())
                 else:
                     f_brake = api.read.inputs.brake()
-                brake = raw_brake + f_brake
             else:
-                brake = raw_brake + raw_brake
-            self.update_pedal(self.bar_brake, brake, raw_brake)
+                f_brake = raw_brake
+            if self.frame_interp:
+                self.frame_interp.add_sample(self.input_brake, raw_brake, f_brake)
+            else:
+                self.update_pedal(self.bar_brake, raw_brake + f_brake, raw_brake)
 
         # Clutch
         if self.wcfg["show_clutch"]:
             raw_clutch = api.read.inputs.clutch_raw()
             if self.wcfg["show_clutch_filtered"]:
-                clutch = raw_clutch + api.read.inputs.clutch()
+                f_clutch = api.read.inputs.clutch()
+            else:
+                f_clutch = raw_clutch
+            if self.frame_interp:
+                self.frame_interp.add_sample(self.input_clutch, raw_clutch, f_clutch)
             else:
-                clutch = raw_clutch + raw_clutch
-            self.update_pedal(self.bar_clutch, clutch, raw_clutch)
+                self.update_pedal(self.bar_clutch, raw_clutch + f_clutch, raw_clutch)
 
         # Force feedback
         if self.wcfg["show_ffb_meter"]:
             ffb = abs(api.read.inputs.force_feedback())
-            self.update_ffb(self.bar_ffb, ffb)
+            if self.frame_interp:
+                self.frame_interp.add_sample(self.input_ffb, ffb)
+            else:
+                self.update_ffb(self.bar_ffb, ffb)
 
     # GUI update methods
     def update_pedal(self, target, data, raw):
@@ -168,6 +199,10 @@ class Realtime(Overlay):
             target.last = data
             target.update_input(raw, data - raw)
 
+    def update_pedal_filtered(self, target, raw, filtered):
+        """Pedal update from raw & filtered input"""
+        self.update_pedal(target, raw + filtered, raw)
+
     def update_ffb(self, target, data):
         """FFB update"""
         if target.last != data:
@@ -103,7 +103,7 @@ class Realtime(Overlay):
             self.cone_angle_r = right_start * 16, cone_angle * 16
 
         # Config canvas
-        self.resize(self.area_size, self.area_size)
+        self.canvas = self.set_canvas(self.area_size, self.area_size)
         self.pixmap_mask = QPixmap(self.area_size, self.area_size)
         self.pixmap_marks = QPixmap(self.area_size, self.area_size)
         self.rect_radar = QRectF(0, 0, self.area_size, self.area_size)
@@ -138,13 +138,12 @@ class Realtime(Overlay):
         veh_data_version = minfo.vehicles.dataSetVersion
         if self.last_veh_data_version != veh_data_version:
             self.last_veh_data_version = veh_data_version
-            self.update()
+            self.canvas.update()
 
     # GUI update methods
-    def paintEvent(self, event):
+    def draw_canvas(self, painter):
         """Draw"""
         if self.show_radar:
-            painter = QPainter(self)
             painter.setRenderHint(QPainter.Antialiasing, True)
             # Draw marks
             painter.drawPixmap(0, 0, self.pixmap_marks)
@@ -62,7 +62,7 @@ class Realtime(Overlay):
         text_rake = self.format_rake(0)
         self.bar_rake = self.set_qlabel(
             text=text_rake,
-            style=self.bar_style_rake[0],
+            palette_style=self.bar_style_rake[0],
             width=font_m.width * len(text_rake) + bar_padx,
         )
         layout.addWidget(self.bar_rake, 0, 0)
@@ -79,7 +79,7 @@ class Realtime(Overlay):
         if target.last != data:
             target.last = data
             target.setText(self.format_rake(data))
-            target.setStyleSheet(self.bar_style_rake[data < 0])
+            self.set_style_palette(target, self.bar_style_rake[data < 0])
 
     def format_rake(self, rake):
         """Format rake"""
@@ -24,9 +24,10 @@ from .. import calculation as calc
 from ..const_common import TEXT_PLACEHOLDER
 from ..formatter import random_color_class, shorten_driver_name
 from ..module_info import minfo
-from ..userfile.brand_logo import load_brand_logo_file
+from ..userfile.brand_logo import logo_cache
 from ..userfile.heatmap import select_compound_symbol
 from ._base import Overlay
+from ._painter import TableBar
 
 
 class Realtime(Overlay):
@@ -35,12 +36,16 @@ class Realtime(Overlay):
     def __init__(self, config, widget_name):
         # Assign base setting
         super().__init__(config, widget_name)
-        layout = self.set_grid_layout(gap_vert=self.wcfg["bar_gap"])
+        layout = self.set_grid_layout()
         self.set_primary_layout(layout=layout)
 
         # Config font
-        font_m = self.get_font_metrics(
-            self.config_font(self.wcfg["font_name"], self.wcfg["font_size"]))
+        font = self.config_font(
+            self.wcfg["font_name"],
+            self.wcfg["font_size"],
+            self.wcfg["font_weight"]
+        )
+        font_m = self.get_font_metrics(font)
 
         # Config variable
         bar_padx = self.set_padding(self.wcfg["font_size"], self.wcfg["bar_padding"])
@@ -52,208 +57,151 @@ class Realtime(Overlay):
         self.gap_width = max(int(self.wcfg["time_gap_width"]), 1)
         self.gap_decimals = max(int(self.wcfg["time_gap_decimal_places"]), 0)
 
-        # Base style
-        self.setStyleSheet(self.set_qss(
-            font_family=self.wcfg["font_name"],
-            font_size=self.wcfg["font_size"],
-            font_weight=self.wcfg["font_weight"])
-        )
-
         # Max display players
         veh_add_front = min(max(int(self.wcfg["additional_players_front"]), 0), 60)
         veh_add_behind = min(max(int(self.wcfg["additional_players_behind"]), 0), 60)
         self.veh_range = max(7 + veh_add_front + veh_add_behind, 7)
 
         # Empty dataset
-        self.pixmap_brandlogo = {}
         self.row_visible = [False] * self.veh_range
 
+        # Relative table
+        self.table = TableBar(
+            self,
+            font=font,
+            row_count=self.veh_range,
+            row_height=font_m.height,
+            row_gap=self.wcfg["bar_gap"],
+        )
+        layout.addWidget(self.table, 0, 0)
+
         # Driver position
         if self.wcfg["show_position"]:
-            self.bar_style_pos = self.set_qss_lap_difference(
+            self.bar_style_pos = self.set_style_lap_difference(
                 fg_color=self.wcfg["font_color_position"],
                 bg_color=self.wcfg["bkg_color_position"],
                 plr_fg_color=self.wcfg["font_color_player_position"],
                 plr_bg_color=self.wcfg["bkg_color_player_position"],
             )
-            self.bars_pos = self.set_qlabel(
-                style=self.bar_style_pos[0],
-                width=2 * font_m.width + bar_padx,
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_pos,
+            self.bars_pos = self.table.add_column(
                 column_index=self.wcfg["column_index_position"],
+                width=2 * font_m.width + bar_padx,
+                styles=self.bar_style_pos,
             )
         # Driver position change
         if self.wcfg["show_position_change"]:
             self.bar_style_pgl = (
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_position_same"],
-                    bg_color=self.wcfg["bkg_color_position_same"]),
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_position_gain"],
-                    bg_color=self.wcfg["bkg_color_position_gain"]),
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_position_loss"],
-                    bg_color=self.wcfg["bkg_color_position_loss"]),
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_player_position_change"],
-                    bg_color=self.wcfg["bkg_color_player_position_change"])
-            )
-            self.bars_pgl = self.set_qlabel(
-                style=self.bar_style_pgl[0],
-                width=3 * font_m.width + bar_padx,
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_pgl,
+                (self.wcfg["font_color_position_same"],
+                 self.wcfg["bkg_color_position_same"]),
+                (self.wcfg["font_color_position_gain"],
+                 self.wcfg["bkg_color_position_gain"]),
+                (self.wcfg["font_color_position_loss"],
+                 self.wcfg["bkg_color_position_loss"]),
+                (self.wcfg["font_color_player_position_change"],
+                 self.wcfg["bkg_color_player_position_change"])
+            )
+            self.bars_pgl = self.table.add_column(
                 column_index=self.wcfg["column_index_position_change"],
+                width=3 * font_m.width + bar_padx,
+                styles=self.bar_style_pgl,
             )
         # Driver name
         if self.wcfg["show_driver_name"]:
-            self.bar_style_drv = self.set_qss_lap_difference(
+            self.bar_style_drv = self.set_style_lap_difference(
                 fg_color=self.wcfg["font_color_driver_name"],
                 bg_color=self.wcfg["bkg_color_driver_name"],
                 plr_fg_color=self.wcfg["font_color_player_driver_name"],
                 plr_bg_color=self.wcfg["bkg_color_player_driver_name"],
             )
-            self.bars_drv = self.set_qlabel(
-                style=self.bar_style_drv[0],
-                width=self.drv_width * font_m.width + bar_padx,
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_drv,
+            self.bars_drv = self.table.add_column(
                 column_index=self.wcfg["column_index_driver"],
+                width=self.drv_width * font_m.width + bar_padx,
+                styles=self.bar_style_drv,
             )
         # Vehicle name
         if self.wcfg["show_vehicle_name"]:
-            self.bar_style_veh = self.set_qss_lap_difference(
+            self.bar_style_veh = self.set_style_lap_difference(
                 fg_color=self.wcfg["font_color_vehicle_name"],
                 bg_color=self.wcfg["bkg_color_vehicle_name"],
                 plr_fg_color=self.wcfg["font_color_player_vehicle_name"],
                 plr_bg_color=self.wcfg["bkg_color_player_vehicle_name"],
             )
-            self.bars_veh = self.set_qlabel(
-                style=self.bar_style_veh[0],
-                width=self.veh_width * font_m.width + bar_padx,
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_veh,
+            self.bars_veh = self.table.add_column(
                 column_index=self.wcfg["column_index_vehicle"],
+                width=self.veh_width * font_m.width + bar_padx,
+                styles=self.bar_style_veh,
             )
         # Brand logo
         if self.wcfg["show_brand_logo"]:
+            logo_cache.add_size(self.brd_width, self.brd_height)
             self.bar_style_brd = (
-                self.set_qss(
-                    bg_color=self.wcfg["bkg_color_brand_logo"]),
-                self.set_qss(
-                    bg_color=self.wcfg["bkg_color_player_brand_logo"])
+                ("", self.wcfg["bkg_color_brand_logo"]),
+                ("", self.wcfg["bkg_color_player_brand_logo"])
             )
-            self.bars_brd = self.set_qlabel(
-                style=self.bar_style_brd[0],
-                width=self.brd_width,
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_brd,
+            self.bars_brd = self.table.add_column(
                 column_index=self.wcfg["column_index_brand_logo"],
+                width=self.brd_width,
+                styles=self.bar_style_brd,
             )
         # Time gap
         if self.wcfg["show_time_gap"]:
             self.bar_style_gap = (
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_time_gap"],
-                    bg_color=self.wcfg["bkg_color_time_gap"]),
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_player_time_gap"],
-                    bg_color=self.wcfg["bkg_color_player_time_gap"]),
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_nearest_time_gap"],
-                    bg_color=self.wcfg["bkg_color_nearest_time_gap"])
+                (self.wcfg["font_color_time_gap"],
+                 self.wcfg["bkg_color_time_gap"]),
+                (self.wcfg["font_color_player_time_gap"],
+                 self.wcfg["bkg_color_player_time_gap"]),
+                (self.wcfg["font_color_nearest_time_gap"],
+                 self.wcfg["bkg_color_nearest_time_gap"])
             )
             self.nearest_time_gap = (
                 -max(self.wcfg["nearest_time_gap_threshold_behind"], 0),
                 max(self.wcfg["nearest_time_gap_threshold_front"], 0),
             )
-            self.bars_gap = self.set_qlabel(
-                style=self.bar_style_gap[0],
-                width=self.gap_width * font_m.width + bar_padx,
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_gap,
+            self.bars_gap = self.table.add_column(
                 column_index=self.wcfg["column_index_timegap"],
+                width=self.gap_width * font_m.width + bar_padx,
+                styles=self.bar_style_gap,
             )
         # Vehicle laptime
         if self.wcfg["show_laptime"]:
             self.bar_style_lpt = (
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_laptime"],
-                    bg_color=self.wcfg["bkg_color_laptime"]),
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_player_laptime"],
-                    bg_color=self.wcfg["bkg_color_player_laptime"]),
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_fastest_last_laptime"],
-                    bg_color=self.wcfg["bkg_color_fastest_last_laptime"]),
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_player_fastest_last_laptime"],
-                    bg_color=self.wcfg["bkg_color_player_fastest_last_laptime"])
-            )
-            self.bars_lpt = self.set_qlabel(
-                style=self.bar_style_lpt[0],
-                width=8 * font_m.width + bar_padx,
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_lpt,
+                (self.wcfg["font_color_laptime"],
+                 self.wcfg["bkg_color_laptime"]),
+                (self.wcfg["font_color_player_laptime"],
+                 self.wcfg["bkg_color_player_laptime"]),
+                (self.wcfg["font_color_fastest_last_laptime"],
+                 self.wcfg["bkg_color_fastest_last_laptime"]),
+                (self.wcfg["font_color_player_fastest_last_laptime"],
+                 self.wcfg["bkg_color_player_fastest_last_laptime"])
+            )
+            self.bars_lpt = self.table.add_column(
                 column_index=self.wcfg["column_index_laptime"],
+                width=8 * font_m.width + bar_padx,
+                styles=self.bar_style_lpt,
             )
         # Position in class
         if self.wcfg["show_position_in_class"]:
             self.bar_style_pic = (
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_position_in_class"],
-                    bg_color=self.wcfg["bkg_color_position_in_class"]),
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_player_position_in_class"],
-                    bg_color=self.wcfg["bkg_color_player_position_in_class"])
-            )
-            self.bars_pic = self.set_qlabel(
-                style=self.bar_style_pic[0],
-                width=2 * font_m.width + bar_padx,
-                count=self.veh_range,
+                (self.wcfg["font_color_position_in_class"],
+                 self.wcfg["bkg_color_position_in_class"]),
+                (self.wcfg["font_color_player_position_in_class"],
+                 self.wcfg["bkg_color_player_position_in_class"])
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_pic,
+            self.bars_pic = self.table.add_column(
                 column_index=self.wcfg["column_index_position_in_class"],
+                width=2 * font_m.width + bar_padx,
+                styles=self.bar_style_pic,
             )
         # Vehicle class
         if self.wcfg["show_class"]:
-            bar_style_cls = self.set_qss(
-                fg_color=self.wcfg["font_color_class"],
-                bg_color=self.wcfg["bkg_color_class"]
-            )
-            self.bars_cls = self.set_qlabel(
-                style=bar_style_cls,
-                width=self.cls_width * font_m.width + bar_padx,
-                count=self.veh_range,
+            bar_style_cls = (
+                self.wcfg["font_color_class"],
+                self.wcfg["bkg_color_class"]
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_cls,
+            self.bars_cls = self.table.add_column(
                 column_index=self.wcfg["column_index_class"],
+                width=self.cls_width * font_m.width + bar_padx,
+                styles=(bar_style_cls,),
             )
         # Vehicle in pit
         if self.wcfg["show_pit_status"]:
@@ -263,71 +211,54 @@ class Realtime(Overlay):
                 self.wcfg["garage_status_text"]
             )
             self.bar_style_pit = (
-                "",
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_pit"],
-                    bg_color=self.wcfg["bkg_color_pit"]),
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_garage"],
-                    bg_color=self.wcfg["bkg_color_garage"])
-            )
-            self.bars_pit = self.set_qlabel(
-                style=self.bar_style_pit[0],
-                width=max(map(len, self.pit_status_text)) * font_m.width + bar_padx,
-                count=self.veh_range,
+                ("", ""),
+                (self.wcfg["font_color_pit"],
+                 self.wcfg["bkg_color_pit"]),
+                (self.wcfg["font_color_garage"],
+                 self.wcfg["bkg_color_garage"])
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_pit,
+            self.bars_pit = self.table.add_column(
                 column_index=self.wcfg["column_index_pitstatus"],
+                width=max(map(len, self.pit_status_text)) * font_m.width + bar_padx,
+                styles=self.bar_style_pit,
             )
         # Tyre compound index
         if self.wcfg["show_tyre_compound"]:
             self.bar_style_tcp = (
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_tyre_compound"],
-                    bg_color=self.wcfg["bkg_color_tyre_compound"]),
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_player_tyre_compound"],
-                    bg_color=self.wcfg["bkg_color_player_tyre_compound"])
-            )
-            self.bars_tcp = self.set_qlabel(
-                style=self.bar_style_tcp[0],
-                width=2 * font_m.width + bar_padx,
-                count=self.veh_range,
+                (self.wcfg["font_color_tyre_compound"],
+                 self.wcfg["bkg_color_tyre_compound"]),
+                (self.wcfg["font_color_player_tyre_compound"],
+                 self.wcfg["bkg_color_player_tyre_compound"])
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_tcp,
+            self.bars_tcp = self.table.add_column(
                 column_index=self.wcfg["column_index_tyre_compound"],
+                width=2 * font_m.width + bar_padx,
+                styles=self.bar_style_tcp,
             )
         # Pitstop count
         if self.wcfg["show_pitstop_count"]:
             self.bar_style_psc = (
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_pitstop_count"],
-                    bg_color=self.wcfg["bkg_color_pitstop_count"]),
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_player_pitstop_count"],
-                    bg_color=self.wcfg["bkg_color_player_pitstop_count"]),
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_pit_request"],
-                    bg_color=self.wcfg["bkg_color_pit_request"]),
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_penalty_count"],
-                    bg_color=self.wcfg["bkg_color_penalty_count"])
-            )
-            self.bars_psc = self.set_qlabel(
-                style=self.bar_style_psc[0],
-                width=2 * font_m.width + bar_padx,
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_psc,
+                (self.wcfg["font_color_pitstop_count"],
+                 self.wcfg["bkg_color_pitstop_count"]),
+                (self.wcfg["font_color_player_pitstop_count"],
+                 self.wcfg["bkg_color_player_pitstop_count"]),
+                (self.wcfg["font_color_pit_request"],
+                 self.wcfg["bkg_color_pit_request"]),
+                (self.wcfg["font_color_penalty_count"],
+                 self.wcfg["bkg_color_penalty_count"])
+            )
+            self.bars_psc = self.table.add_column(
                 column_index=self.wcfg["column_index_pitstop_count"],
+                width=2 * font_m.width + bar_padx,
+                styles=self.bar_style_psc,
             )
 
+    def unload_resource(self):
+        """Unload resource on close"""
+        super().unload_resource()
+        if self.wcfg["show_brand_logo"]:
+            logo_cache.remove_size(self.brd_width, self.brd_height)
+
     def timerEvent(self, event):
         """Update when vehicle on track"""
         relative_list = minfo.relative.relative
@@ -408,17 +339,16 @@ class Realtime(Overlay):
         if target.last != data:
             target.last = data
             if data[2]:  # highlight player
-                color = self.bar_style_pos[1]
+                color_index = 1
             elif self.wcfg["show_lap_difference"]:
-                color = self.bar_style_pos[lap_difference_index(data[1])]
+                color_index = lap_difference_index(data[1])
             else:
-                color = self.bar_style_pos[0]
+                color_index = 0
             if data[-1]:
                 text = f"{data[0]:02d}"
             else:
                 text = ""
-            target.setText(text)
-            target.setStyleSheet(color)
+            target.set_text(text, color_index)
 
     def update_pgl(self, target, *data):
         """Driver position change (gain/loss)"""
@@ -440,19 +370,18 @@ class Realtime(Overlay):
             else:
                 text = ""
                 color_index = 0
-            target.setText(text)
-            target.setStyleSheet(self.bar_style_pgl[color_index])
+            target.set_text(text, color_index)
 
     def update_drv(self, target, *data):
         """Driver name"""
         if target.last != data:
             target.last = data
             if data[2]:  # highlight player
-                color = self.bar_style_drv[1]
+                color_index = 1
             elif self.wcfg["show_lap_difference"]:
-                color = self.bar_style_drv[lap_difference_index(data[1])]
+                color_index = lap_difference_index(data[1])
             else:
-                color = self.bar_style_drv[0]
+                color_index = 0
             if data[-1]:
                 if self.wcfg["driver_name_shorten"]:
                     text = shorten_driver_name(data[0])
@@ -466,19 +395,18 @@ class Realtime(Overlay):
                     text = text[:self.drv_width].ljust(self.drv_width)
             else:
                 text = ""
-            target.setText(text)
-            target.setStyleSheet(color)
+            target.set_text(text, color_index)
 
     def update_veh(self, target, *data):
         """Vehicle name"""
         if target.last != data:
             target.last = data
             if data[2]:  # highlight player
-                color = self.bar_style_veh[1]
+                color_index = 1
             elif self.wcfg["show_lap_difference"]:
-                color = self.bar_style_veh[lap_difference_index(data[1])]
+                color_index = lap_difference_index(data[1])
             else:
-                color = self.bar_style_veh[0]
+                color_index = 0
             if data[-1]:
                 if self.wcfg["show_vehicle_brand_as_name"]:
                     text = self.cfg.user.brands.get(data[0], data[0])
@@ -492,19 +420,20 @@ class Realtime(Overlay):
                     text = text[:self.veh_width].ljust(self.veh_width)
             else:
                 text = ""
-            target.setText(text)
-            target.setStyleSheet(color)
+            target.set_text(text, color_index)
 
     def update_brd(self, target, *data):
         """Brand logo"""
         if target.last != data:
-            target.last = data
             if data[-1]:
-                brand_name = self.cfg.user.brands.get(data[0], data[0])
-            else:
-                brand_name = ""
-            target.setPixmap(self.set_brand_logo(brand_name))
-            target.setStyleSheet(self.bar_style_brd[data[1]])
+                brand_logo = self.set_brand_logo(self.cfg.user.brands.get(data[0], data[0]))
+                if brand_logo is None:  # clear last logo, retry on next update
+                    target.set_pixmap(None, data[1])
+                    return
+            else:  # no logo for empty row
+                brand_logo = None
+            target.last = data
+            target.set_pixmap(brand_logo, data[1])
 
     def update_gap(self, target, *data):
         """Time gap"""
@@ -528,8 +457,7 @@ class Realtime(Overlay):
                     text = value[:self.gap_width].strip(".").rjust(self.gap_width)
             else:
                 text = ""
-            target.setText(text)
-            target.setStyleSheet(self.bar_style_gap[color_index])
+            target.set_text(text, color_index)
 
     def update_lpt(self, target, *data):
         """Vehicle laptime"""
@@ -543,8 +471,7 @@ class Realtime(Overlay):
                 text = data[0]
             else:
                 text = ""
-            target.setText(text)
-            target.setStyleSheet(self.bar_style_lpt[color_index])
+            target.set_text(text, color_index)
 
     def update_pic(self, target, *data):
         """Position in class"""
@@ -554,16 +481,14 @@ class Realtime(Overlay):
                 text = f"{data[0]:02d}"
             else:
                 text = ""
-            target.setText(text)
-            target.setStyleSheet(self.bar_style_pic[data[1]])
+            target.set_text(text, data[1])
 
     def update_cls(self, target, *data):
         """Vehicle class"""
         if target.last != data:
             target.last = data
             text, bg_color = self.set_class_style(data[0])
-            target.setText(text[:self.cls_width])
-            target.setStyleSheet(f"color:{self.wcfg['font_color_class']};background:{bg_color};")
+            target.set_color(text[:self.cls_width], self.wcfg["font_color_class"], bg_color)
 
     def update_pit(self, target, *data):
         """Vehicle in pit"""
@@ -573,8 +498,7 @@ class Realtime(Overlay):
                 text = self.pit_status_text[data[0]]
             else:
                 text = ""
-            target.setText(text)
-            target.setStyleSheet(self.bar_style_pit[data[0]])
+            target.set_text(text, data[0])
 
     def update_tcp(self, target, *data):
         """Tyre compound index"""
@@ -584,8 +508,7 @@ class Realtime(Overlay):
                 text = f"{select_compound_symbol(data[0])}{select_compound_symbol(data[1])}"
             else:
                 text = ""
-            target.setText(text)
-            target.setStyleSheet(self.bar_style_tcp[data[2]])
+            target.set_text(text, data[2])
 
     def update_psc(self, target, *data):
         """Pitstop count"""
@@ -605,42 +528,34 @@ class Realtime(Overlay):
                 text = TEXT_PLACEHOLDER
             else:
                 text = f"{data[0]}"
-            target.setText(text)
-            target.setStyleSheet(self.bar_style_psc[color_index])
+            target.set_text(text, color_index)
 
     # Additional methods
-    def set_qss_lap_difference(self, fg_color, bg_color, plr_fg_color, plr_bg_color):
-        """Set style with player & lap difference:
+    def set_style_lap_difference(self, fg_color, bg_color, plr_fg_color, plr_bg_color):
+        """Set style (foreground & background color) with player & lap difference:
         0 default, 1 player, 2 same lap, 3 behind lap, 4 ahead lap.
         """
         return (
-            self.set_qss(  # 0 default
-                fg_color=fg_color,
-                bg_color=bg_color),
-            self.set_qss(  # 1 player
-                fg_color=plr_fg_color,
-                bg_color=plr_bg_color),
-            self.set_qss(  # 2 same lap
-                fg_color=self.wcfg["font_color_same_lap"],
-                bg_color=bg_color),
-            self.set_qss(  # 3 behind lap
-                fg_color=self.wcfg["font_color_laps_behind"],
-                bg_color=bg_color),
-            self.set_qss(  # 4 ahead lap
-                fg_color=self.wcfg["font_color_laps_ahead"],
-                bg_color=bg_color),
+            (fg_color,  # 0 default
+             bg_color),
+            (plr_fg_color,  # 1 player
+             plr_bg_color),
+            (self.wcfg["font_color_same_lap"],  # 2 same lap
+             bg_color),
+            (self.wcfg["font_color_laps_behind"],  # 3 behind lap
+             bg_color),
+            (self.wcfg["font_color_laps_ahead"],  # 4 ahead lap
+             bg_color),
         )
 
     def set_brand_logo(self, brand_name: str):
-        """Set brand logo"""
-        if brand_name not in self.pixmap_brandlogo:  # load & cache logo
-            self.pixmap_brandlogo[brand_name] = load_brand_logo_file(
-                filepath=self.cfg.path.brand_logo,
-                filename=brand_name,
-                max_width=self.brd_width,
-                max_height=self.brd_height,
-            )
-        return self.pixmap_brandlogo[brand_name]
+        """Set brand logo from shared cache, returns None if loading in background"""
+        return logo_cache.get(
+            filepath=self.cfg.path.brand_logo,
+            brand_name=brand_name,
+            width=self.brd_width,
+            height=self.brd_height,
+        )
 
     def set_class_style(self, class_name: str):
         """Compare vehicle class name with user defined dictionary"""
@@ -128,7 +128,7 @@ class Realtime(Overlay):
         )
         self.bars_lap_leader = self.set_qlabel(
             text=TEXT_PLACEHOLDER,
-            style=self.leader_lap_color[0],
+            palette_style=self.leader_lap_color[0],
             width=bar_width,
             count=self.total_slot,
         )
@@ -154,7 +154,7 @@ class Realtime(Overlay):
         )
         self.bars_lap_player = self.set_qlabel(
             text=TEXT_PLACEHOLDER,
-            style=self.player_lap_color[0],
+            palette_style=self.player_lap_color[0],
             width=bar_width,
             count=self.total_slot,
         )
@@ -325,7 +325,7 @@ class Realtime(Overlay):
             else:
                 lap_text = TEXT_PLACEHOLDER
             target.setText(lap_text)
-            target.setStyleSheet(self.leader_lap_color[highlight])
+            self.set_style_palette(target, self.leader_lap_color[highlight])
 
     def update_lap_player(self, target, data, highlight):
         """Player final lap progress"""
@@ -336,7 +336,7 @@ class Realtime(Overlay):
             else:
                 lap_text = TEXT_PLACEHOLDER
             target.setText(lap_text)
-            target.setStyleSheet(self.player_lap_color[highlight])
+            self.set_style_palette(target, self.player_lap_color[highlight])
 
     def update_lap_int(self, target, data):
         """Lap progress difference"""
@@ -27,7 +27,7 @@ from ..api_control import api
 from ..const_common import TEXT_PLACEHOLDER
 from ..formatter import random_color_class, shorten_driver_name
 from ..module_info import minfo
-from ..userfile.brand_logo import load_brand_logo_file
+from ..userfile.brand_logo import logo_cache
 from ..userfile.heatmap import select_compound_symbol
 from ._base import Overlay
 
@@ -67,7 +67,6 @@ class Realtime(Overlay):
         self.veh_range = 2
 
         # Empty dataset
-        self.pixmap_brandlogo = {}
         self.row_visible = [True] * self.veh_range
 
         # Driver position
@@ -101,7 +100,7 @@ class Realtime(Overlay):
                     bg_color=self.wcfg["bkg_color_position_loss"])
             )
             self.bars_pgl = self.set_qlabel(
-                style=self.bar_style_pgl[0],
+                palette_style=self.bar_style_pgl[0],
                 width=3 * font_m.width + bar_padx,
                 count=self.veh_range,
             )
@@ -147,6 +146,7 @@ class Realtime(Overlay):
             )
         # Brand logo
         if self.wcfg["show_brand_logo"]:
+            logo_cache.add_size(self.brd_width, self.brd_height)
             bar_style_brd = self.set_qss(
                 bg_color=self.wcfg["bkg_color_brand_logo"]
             )
@@ -172,7 +172,7 @@ class Realtime(Overlay):
                     bg_color=self.wcfg["bkg_color_time_interval_ahead"])
             )
             self.bars_int = self.set_qlabel(
-                style=self.bar_style_int[0],
+                palette_style=self.bar_style_int[0],
                 width=self.int_width * font_m.width + bar_padx,
                 count=self.veh_range,
             )
@@ -263,7 +263,7 @@ class Realtime(Overlay):
                 bg_color=self.wcfg["bkg_color_class"]
             )
             self.bars_cls = self.set_qlabel(
-                style=bar_style_cls,
+                palette_style=bar_style_cls,
                 width=self.cls_width * font_m.width + bar_padx,
                 count=self.veh_range,
             )
@@ -290,7 +290,7 @@ class Realtime(Overlay):
                     bg_color=self.wcfg["bkg_color_garage"])
             )
             self.bars_pit = self.set_qlabel(
-                style=self.bar_style_pit[0],
+                palette_style=self.bar_style_pit[0],
                 width=max(map(len, self.pit_status_text)) * font_m.width + bar_padx,
                 count=self.veh_range,
             )
@@ -331,7 +331,7 @@ class Realtime(Overlay):
                     bg_color=self.wcfg["bkg_color_penalty_count"])
             )
             self.bars_psc = self.set_qlabel(
-                style=self.bar_style_psc[0],
+                palette_style=self.bar_style_psc[0],
                 width=2 * font_m.width + bar_padx,
                 count=self.veh_range,
             )
@@ -342,6 +342,12 @@ class Realtime(Overlay):
                 hide_start=1,
             )
 
+    def unload_resource(self):
+        """Unload resource on close"""
+        super().unload_resource()
+        if self.wcfg["show_brand_logo"]:
+            logo_cache.remove_size(self.brd_width, self.brd_height)
+
     def timerEvent(self, event):
         """Update when vehicle on track"""
         classes_list = minfo.relative.classes
@@ -453,7 +459,7 @@ class Realtime(Overlay):
                 text = "- 0"
                 color_index = 0
             target.setText(text)
-            target.setStyleSheet(self.bar_style_pgl[color_index])
+            self.set_style_palette(target, self.bar_style_pgl[color_index])
             self.toggle_visibility(target, data[-1])
 
     def update_drv(self, target, *data):
@@ -493,9 +499,13 @@ class Realtime(Overlay):
     def update_brd(self, target, *data):
         """Brand logo"""
         if target.last != data:
-            target.last = data
-            target.setPixmap(self.set_brand_logo(self.cfg.user.brands.get(data[0], data[0])))
             self.toggle_visibility(target, data[-1])
+            brand_logo = self.set_brand_logo(self.cfg.user.brands.get(data[0], data[0]))
+            if brand_logo is None:  # clear last logo, retry on next update
+                target.clear()
+                return
+            target.last = data
+            target.setPixmap(brand_logo)
 
     def update_int(self, target, *data):
         """Time interval"""
@@ -506,7 +516,7 @@ class Realtime(Overlay):
             else:
                 text = self.int_to_next(data[0], data[1])[:self.int_width].strip(".").rjust(self.int_width)
             target.setText(text)
-            target.setStyleSheet(self.bar_style_int[data[1]])
+            self.set_style_palette(target, self.bar_style_int[data[1]])
             self.toggle_visibility(target, data[-1])
 
     def update_lpt(self, target, *data):
@@ -541,7 +551,7 @@ class Realtime(Overlay):
                     text = "-.-"
                     color_index = 0
                 bar_delta.setText(text)
-                bar_delta.setStyleSheet(self.bar_style_dlt_delta[color_index])
+                self.set_style_palette(bar_delta, self.bar_style_dlt_delta[color_index])
             self.toggle_visibility(target, data[-1])
 
     def update_pic(self, target, *data):
@@ -557,7 +567,7 @@ class Realtime(Overlay):
             target.last = data
             text, bg_color = self.set_class_style(data[0])
             target.setText(text[:self.cls_width])
-            target.setStyleSheet(f"color:{self.wcfg['font_color_class']};background:{bg_color};")
+            self.set_style_palette(target, f"color:{self.wcfg['font_color_class']};background:{bg_color};")
             self.toggle_visibility(target, data[-1])
 
     def update_pit(self, target, *data):
@@ -565,7 +575,7 @@ class Realtime(Overlay):
         if target.last != data:
             target.last = data
             target.setText(self.pit_status_text[data[0]])
-            target.setStyleSheet(self.bar_style_pit[data[0]])
+            self.set_style_palette(target, self.bar_style_pit[data[0]])
             self.toggle_visibility(target, data[-1])
 
     def update_tcp(self, target, *data):
@@ -590,7 +600,7 @@ class Realtime(Overlay):
             else:
                 text = f"{data[0]}"
             target.setText(text)
-            target.setStyleSheet(self.bar_style_psc[color_index])
+            self.set_style_palette(target, self.bar_style_psc[color_index])
             self.toggle_visibility(target, data[-1])
 
     # Additional methods
@@ -600,15 +610,13 @@ class Realtime(Overlay):
         target.setHidden(not state)
 
     def set_brand_logo(self, brand_name: str):
-        """Set brand logo"""
-        if brand_name not in self.pixmap_brandlogo:  # load & cache logo
-            self.pixmap_brandlogo[brand_name] = load_brand_logo_file(
-                filepath=self.cfg.path.brand_logo,
-                filename=brand_name,
-                max_width=self.brd_width,
-                max_height=self.brd_height,
-            )
-        return self.pixmap_brandlogo[brand_name]
+        """Set brand logo from shared cache, returns None if loading in background"""
+        return logo_cache.get(
+            filepath=self.cfg.path.brand_logo,
+            brand_name=brand_name,
+            width=self.brd_width,
+            height=self.brd_height,
+        )
 
     def set_class_style(self, class_name: str):
         """Compare vehicle class name with user defined dictionary"""
@@ -654,6 +662,7 @@ class Realtime(Overlay):
         bar_temp.setLayout(layout)
         bar_temp.setStyleSheet(self.set_qss(bg_color=self.wcfg["bkg_color_delta_laptime"]))
         bar_temp.bar_set = self.set_qlabel(
+            palette_style=self.bar_style_dlt_delta[0],
             fixed_width=width,
             count=columns,
         )
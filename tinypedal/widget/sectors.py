@@ -71,7 +71,7 @@ class Realtime(Overlay):
         )
         self.bar_time_target = self.set_qlabel(
             text="  --:--.---",
-            style=self.bar_style_time_target[2],
+            palette_style=self.bar_style_time_target[2],
             width=font_m.width * 11 + bar_padx,
         )
         layout_laptime.addWidget(self.bar_time_target, 0, 0)
@@ -102,7 +102,7 @@ class Realtime(Overlay):
                 bg_color=self.wcfg["bkg_color_sector"]),
         )
         self.bars_time_gap = self.set_qlabel(
-            style=self.bar_style_gap[2],
+            palette_style=self.bar_style_gap[2],
             width=font_m.width * 7 + bar_padx,
             count=3,
         )
@@ -196,7 +196,7 @@ class Realtime(Overlay):
         if target.last != data:
             target.last = data
             target.setText(f"{data:+.3f}"[:7])
-            target.setStyleSheet(self.bar_style_gap[data < 0])
+            self.set_style_palette(target, self.bar_style_gap[data < 0])
 
     def update_time_curr(self, sector_idx, prev_s, laptime_curr, freeze=False):
         """Current sector time text"""
@@ -216,7 +216,7 @@ class Realtime(Overlay):
     def update_time_target(self, text_laptime):
         """Target sector time text"""
         self.bar_time_target.setText(text_laptime)
-        self.bar_time_target.setStyleSheet(self.bar_style_time_target[2])
+        self.set_style_palette(self.bar_time_target, self.bar_style_time_target[2])
 
     def update_time_target_gap(self, delta_pb, delta_tb, sec_index):
         """Target sector time gap"""
@@ -225,7 +225,7 @@ class Realtime(Overlay):
         else:
             sector_gap = calc.accumulated_sum(delta_pb, sec_index)
         self.bar_time_target.setText(f"{self.prefix_best}{sector_gap: >+9.3f}"[:11])
-        self.bar_time_target.setStyleSheet(self.bar_style_time_target[sector_gap < 0])
+        self.set_style_palette(self.bar_time_target, self.bar_style_time_target[sector_gap < 0])
 
     def restore_best_sector(self):
         """Restore best sector time"""
@@ -238,7 +238,7 @@ class Realtime(Overlay):
             if valid_sectors(sector_time[idx]):
                 text_s = f"{sector_time[idx]:.3f}"[:7]
             bar_time_gap.setText(text_s)
-            bar_time_gap.setStyleSheet(self.bar_style_gap[2])
+            self.set_style_palette(bar_time_gap, self.bar_style_gap[2])
 
     # Sector data update methods
     def set_target_time(self, sec_tb, sec_pb, sec_index):
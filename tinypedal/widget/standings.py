@@ -20,16 +20,15 @@
 Standings Widget
 """
 
-from PySide2.QtWidgets import QWidget
-
 from .. import calculation as calc
 from ..api_control import api
 from ..const_common import TEXT_PLACEHOLDER
 from ..formatter import random_color_class, shorten_driver_name
 from ..module_info import minfo
-from ..userfile.brand_logo import load_brand_logo_file
+from ..userfile.brand_logo import logo_cache
 from ..userfile.heatmap import select_compound_symbol
 from ._base import Overlay
+from ._painter import TableBar
 
 
 class Realtime(Overlay):
@@ -38,12 +37,16 @@ class Realtime(Overlay):
     def __init__(self, config, widget_name):
         # Assign base setting
         super().__init__(config, widget_name)
-        layout = self.set_grid_layout(gap_vert=self.wcfg["bar_gap"])
+        layout = self.set_grid_layout()
         self.set_primary_layout(layout=layout)
 
         # Config font
-        font_m = self.get_font_metrics(
-            self.config_font(self.wcfg["font_name"], self.wcfg["font_size"]))
+        font = self.config_font(
+            self.wcfg["font_name"],
+            self.wcfg["font_size"],
+            self.wcfg["font_weight"]
+        )
+        font_m = self.get_font_metrics(font)
 
         # Config variable
         bar_padx = self.set_padding(self.wcfg["font_size"], self.wcfg["bar_padding"])
@@ -63,289 +66,194 @@ class Realtime(Overlay):
             and self.wcfg["show_time_interval_from_same_class"])
         self.max_delta = calc.asym_max(int(self.wcfg["number_of_delta_laptime"]), 2, 5)
 
-        # Base style
-        self.setStyleSheet(self.set_qss(
-            font_family=self.wcfg["font_name"],
-            font_size=self.wcfg["font_size"],
-            font_weight=self.wcfg["font_weight"])
-        )
-        self.bar_split_style = f"margin-top:{self.wcfg['split_gap']}px;max-height:0;"
-
         # Max display players
         if self.wcfg["enable_multi_class_split_mode"]:
             self.veh_range = min(max(int(self.wcfg["max_vehicles_split_mode"]), 5), 126)
         else:
             self.veh_range = min(max(int(self.wcfg["max_vehicles_combined_mode"]), 5), 126)
-        self.pixmap_brandlogo = {}
         self.row_visible = [False] * self.veh_range
 
+        # Standings table
+        self.table = TableBar(
+            self,
+            font=font,
+            row_count=self.veh_range,
+            row_height=font_m.height,
+            row_gap=self.wcfg["bar_gap"],
+            separator_height=max(self.wcfg["split_gap"], 0),
+            hide_start=1,
+        )
+        layout.addWidget(self.table, 0, 0)
+
         # Driver position
         if self.wcfg["show_position"]:
             self.bar_style_pos = (
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_position"],
-                    bg_color=self.wcfg["bkg_color_position"]),
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_player_position"],
-                    bg_color=self.wcfg["bkg_color_player_position"])
-            )
-            self.bars_pos = self.set_qlabel(
-                style=self.bar_style_pos[0],
-                width=2 * font_m.width + bar_padx,
-                count=self.veh_range,
+                (self.wcfg["font_color_position"],
+                 self.wcfg["bkg_color_position"]),
+                (self.wcfg["font_color_player_position"],
+                 self.wcfg["bkg_color_player_position"])
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_pos,
+            self.bars_pos = self.table.add_column(
                 column_index=self.wcfg["column_index_position"],
-                hide_start=1,
+                width=2 * font_m.width + bar_padx,
+                styles=self.bar_style_pos,
             )
         # Driver position change
         if self.wcfg["show_position_change"]:
             self.bar_style_pgl = (
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_position_same"],
-                    bg_color=self.wcfg["bkg_color_position_same"]),
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_position_gain"],
-                    bg_color=self.wcfg["bkg_color_position_gain"]),
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_position_loss"],
-                    bg_color=self.wcfg["bkg_color_position_loss"]),
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_player_position_change"],
-                    bg_color=self.wcfg["bkg_color_player_position_change"])
-            )
-            self.bars_pgl = self.set_qlabel(
-                style=self.bar_style_pgl[0],
-                width=3 * font_m.width + bar_padx,
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_pgl,
+                (self.wcfg["font_color_position_same"],
+                 self.wcfg["bkg_color_position_same"]),
+                (self.wcfg["font_color_position_gain"],
+                 self.wcfg["bkg_color_position_gain"]),
+                (self.wcfg["font_color_position_loss"],
+                 self.wcfg["bkg_color_position_loss"]),
+                (self.wcfg["font_color_player_position_change"],
+                 self.wcfg["bkg_color_player_position_change"])
+            )
+            self.bars_pgl = self.table.add_column(
                 column_index=self.wcfg["column_index_position_change"],
-                hide_start=1,
+                width=3 * font_m.width + bar_padx,
+                styles=self.bar_style_pgl,
             )
         # Driver name
         if self.wcfg["show_driver_name"]:
             self.bar_style_drv = (
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_driver_name"],
-                    bg_color=self.wcfg["bkg_color_driver_name"]),
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_player_driver_name"],
-                    bg_color=self.wcfg["bkg_color_player_driver_name"])
-            )
-            self.bars_drv = self.set_qlabel(
-                style=self.bar_style_drv[0],
-                width=self.drv_width * font_m.width + bar_padx,
-                count=self.veh_range,
+                (self.wcfg["font_color_driver_name"],
+                 self.wcfg["bkg_color_driver_name"]),
+                (self.wcfg["font_color_player_driver_name"],
+                 self.wcfg["bkg_color_player_driver_name"])
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_drv,
+            self.bars_drv = self.table.add_column(
                 column_index=self.wcfg["column_index_driver"],
-                hide_start=1,
+                width=self.drv_width * font_m.width + bar_padx,
+                styles=self.bar_style_drv,
             )
         # Vehicle name
         if self.wcfg["show_vehicle_name"]:
             self.bar_style_veh = (
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_vehicle_name"],
-                    bg_color=self.wcfg["bkg_color_vehicle_name"]),
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_player_vehicle_name"],
-                    bg_color=self.wcfg["bkg_color_player_vehicle_name"])
-            )
-            self.bars_veh = self.set_qlabel(
-                style=self.bar_style_veh[0],
-                width=self.veh_width * font_m.width + bar_padx,
-                count=self.veh_range,
+                (self.wcfg["font_color_vehicle_name"],
+                 self.wcfg["bkg_color_vehicle_name"]),
+                (self.wcfg["font_color_player_vehicle_name"],
+                 self.wcfg["bkg_color_player_vehicle_name"])
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_veh,
+            self.bars_veh = self.table.add_column(
                 column_index=self.wcfg["column_index_vehicle"],
-                hide_start=1,
+                width=self.veh_width * font_m.width + bar_padx,
+                styles=self.bar_style_veh,
             )
         # Brand logo
         if self.wcfg["show_brand_logo"]:
+            logo_cache.add_size(self.brd_width, self.brd_height)
             self.bar_style_brd = (
-                self.set_qss(
-                    bg_color=self.wcfg["bkg_color_brand_logo"]),
-                self.set_qss(
-                    bg_color=self.wcfg["bkg_color_player_brand_logo"])
-            )
-            self.bars_brd = self.set_qlabel(
-                style=self.bar_style_brd[0],
-                width=self.brd_width,
-                count=self.veh_range,
+                ("", self.wcfg["bkg_color_brand_logo"]),
+                ("", self.wcfg["bkg_color_player_brand_logo"])
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_brd,
+            self.bars_brd = self.table.add_column(
                 column_index=self.wcfg["column_index_brand_logo"],
-                hide_start=1,
+                width=self.brd_width,
+                styles=self.bar_style_brd,
             )
         # Time gap
         if self.wcfg["show_time_gap"]:
             self.bar_style_gap = (
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_time_gap"],
-                    bg_color=self.wcfg["bkg_color_time_gap"]),
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_player_time_gap"],
-                    bg_color=self.wcfg["bkg_color_player_time_gap"])
-            )
-            self.bars_gap = self.set_qlabel(
-                style=self.bar_style_gap[0],
-                width=self.gap_width * font_m.width + bar_padx,
-                count=self.veh_range,
+                (self.wcfg["font_color_time_gap"],
+                 self.wcfg["bkg_color_time_gap"]),
+                (self.wcfg["font_color_player_time_gap"],
+                 self.wcfg["bkg_color_player_time_gap"])
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_gap,
+            self.bars_gap = self.table.add_column(
                 column_index=self.wcfg["column_index_timegap"],
-                hide_start=1,
+                width=self.gap_width * font_m.width + bar_padx,
+                styles=self.bar_style_gap,
             )
         # Time interval
         if self.wcfg["show_time_interval"]:
             self.bar_style_int = (
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_time_interval"],
-                    bg_color=self.wcfg["bkg_color_time_interval"]),
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_player_time_interval"],
-                    bg_color=self.wcfg["bkg_color_player_time_interval"])
-            )
-            self.bars_int = self.set_qlabel(
-                style=self.bar_style_int[0],
-                width=self.int_width * font_m.width + bar_padx,
-                count=self.veh_range,
+                (self.wcfg["font_color_time_interval"],
+                 self.wcfg["bkg_color_time_interval"]),
+                (self.wcfg["font_color_player_time_interval"],
+                 self.wcfg["bkg_color_player_time_interval"])
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_int,
+            self.bars_int = self.table.add_column(
                 column_index=self.wcfg["column_index_timeinterval"],
-                hide_start=1,
+                width=self.int_width * font_m.width + bar_padx,
+                styles=self.bar_style_int,
             )
         # Vehicle laptime
         if self.wcfg["show_laptime"]:
             self.bar_style_lpt = (
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_laptime"],
-                    bg_color=self.wcfg["bkg_color_laptime"]),
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_player_laptime"],
-                    bg_color=self.wcfg["bkg_color_player_laptime"]),
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_fastest_last_laptime"],
-                    bg_color=self.wcfg["bkg_color_fastest_last_laptime"]),
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_player_fastest_last_laptime"],
-                    bg_color=self.wcfg["bkg_color_player_fastest_last_laptime"])
-            )
-            self.bars_lpt = self.set_qlabel(
-                style=self.bar_style_lpt[0],
-                width=8 * font_m.width + bar_padx,
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_lpt,
+                (self.wcfg["font_color_laptime"],
+                 self.wcfg["bkg_color_laptime"]),
+                (self.wcfg["font_color_player_laptime"],
+                 self.wcfg["bkg_color_player_laptime"]),
+                (self.wcfg["font_color_fastest_last_laptime"],
+                 self.wcfg["bkg_color_fastest_last_laptime"]),
+                (self.wcfg["font_color_player_fastest_last_laptime"],
+                 self.wcfg["bkg_color_player_fastest_last_laptime"])
+            )
+            self.bars_lpt = self.table.add_column(
                 column_index=self.wcfg["column_index_laptime"],
-                hide_start=1,
+                width=8 * font_m.width + bar_padx,
+                styles=self.bar_style_lpt,
             )
         # Vehicle best laptime
         if self.wcfg["show_best_laptime"]:
             self.bar_style_blp = (
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_best_laptime"],
-                    bg_color=self.wcfg["bkg_color_best_laptime"]),
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_player_best_laptime"],
-                    bg_color=self.wcfg["bkg_color_player_best_laptime"])
-            )
-            self.bars_blp = self.set_qlabel(
-                style=self.bar_style_blp[0],
-                width=8 * font_m.width + bar_padx,
-                count=self.veh_range,
+                (self.wcfg["font_color_best_laptime"],
+                 self.wcfg["bkg_color_best_laptime"]),
+                (self.wcfg["font_color_player_best_laptime"],
+                 self.wcfg["bkg_color_player_best_laptime"])
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_blp,
+            self.bars_blp = self.table.add_column(
                 column_index=self.wcfg["column_index_best_laptime"],
-                hide_start=1,
+                width=8 * font_m.width + bar_padx,
+                styles=self.bar_style_blp,
             )
         # Delta laptime
         if self.wcfg["show_delta_laptime"]:
             self.bar_style_dlt_delta = (
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_delta_laptime"]),
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_delta_laptime_gain"]),
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_delta_laptime_loss"]),
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_player_delta_laptime"]),
+                (self.wcfg["font_color_delta_laptime"], ""),
+                (self.wcfg["font_color_delta_laptime_gain"], ""),
+                (self.wcfg["font_color_delta_laptime_loss"], ""),
+                (self.wcfg["font_color_player_delta_laptime"], ""),
             )
             self.bar_style_dlt = (
-                self.set_qss(
-                    bg_color=self.wcfg["bkg_color_delta_laptime"]),
-                self.set_qss(
-                    bg_color=self.wcfg["bkg_color_player_delta_laptime"])
-            )
-            self.bars_dlt = tuple(
-                self.set_delta_table(
-                    width=4 * font_m.width,
-                    columns=self.max_delta,
-                    bar_padx=bar_padx // 2,
-                ) for _ in range(self.veh_range)
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_dlt,
+                ("", self.wcfg["bkg_color_delta_laptime"]),
+                ("", self.wcfg["bkg_color_player_delta_laptime"])
+            )
+            self.bars_dlt = self.table.add_column(
                 column_index=self.wcfg["column_index_delta_laptime"],
-                hide_start=1,
+                width=0,
+                styles=self.bar_style_dlt,
+                sub_count=self.max_delta,
+                sub_width=4 * font_m.width,
+                sub_styles=self.bar_style_dlt_delta,
+                sub_padding=bar_padx // 2,
+                sub_reversed=self.wcfg["show_inverted_delta_laptime_layout"],
             )
         # Position in class
         if self.wcfg["show_position_in_class"]:
             self.bar_style_pic = (
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_position_in_class"],
-                    bg_color=self.wcfg["bkg_color_position_in_class"]),
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_player_position_in_class"],
-                    bg_color=self.wcfg["bkg_color_player_position_in_class"])
-            )
-            self.bars_pic = self.set_qlabel(
-                style=self.bar_style_pic[0],
-                width=2 * font_m.width + bar_padx,
-                count=self.veh_range,
+                (self.wcfg["font_color_position_in_class"],
+                 self.wcfg["bkg_color_position_in_class"]),
+                (self.wcfg["font_color_player_position_in_class"],
+                 self.wcfg["bkg_color_player_position_in_class"])
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_pic,
+            self.bars_pic = self.table.add_column(
                 column_index=self.wcfg["column_index_position_in_class"],
-                hide_start=1,
+                width=2 * font_m.width + bar_padx,
+                styles=self.bar_style_pic,
             )
         # Vehicle class
         if self.wcfg["show_class"]:
-            bar_style_cls = self.set_qss(
-                fg_color=self.wcfg["font_color_class"],
-                bg_color=self.wcfg["bkg_color_class"]
+            bar_style_cls = (
+                self.wcfg["font_color_class"],
+                self.wcfg["bkg_color_class"]
             )
-            self.bars_cls = self.set_qlabel(
-                style=bar_style_cls,
-                width=self.cls_width * font_m.width + bar_padx,
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_cls,
+            self.bars_cls = self.table.add_column(
                 column_index=self.wcfg["column_index_class"],
-                hide_start=1,
+                width=self.cls_width * font_m.width + bar_padx,
+                styles=(bar_style_cls,),
             )
         # Vehicle in pit
         if self.wcfg["show_pit_status"]:
@@ -355,74 +263,54 @@ class Realtime(Overlay):
                 self.wcfg["garage_status_text"]
             )
             self.bar_style_pit = (
-                "",
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_pit"],
-                    bg_color=self.wcfg["bkg_color_pit"]),
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_garage"],
-                    bg_color=self.wcfg["bkg_color_garage"])
-            )
-            self.bars_pit = self.set_qlabel(
-                style=self.bar_style_pit[0],
-                width=max(map(len, self.pit_status_text)) * font_m.width + bar_padx,
-                count=self.veh_range,
+                ("", ""),
+                (self.wcfg["font_color_pit"],
+                 self.wcfg["bkg_color_pit"]),
+                (self.wcfg["font_color_garage"],
+                 self.wcfg["bkg_color_garage"])
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_pit,
+            self.bars_pit = self.table.add_column(
                 column_index=self.wcfg["column_index_pitstatus"],
-                hide_start=1,
+                width=max(map(len, self.pit_status_text)) * font_m.width + bar_padx,
+                styles=self.bar_style_pit,
             )
         # Tyre compound index
         if self.wcfg["show_tyre_compound"]:
             self.bar_style_tcp = (
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_tyre_compound"],
-                    bg_color=self.wcfg["bkg_color_tyre_compound"]),
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_player_tyre_compound"],
-                    bg_color=self.wcfg["bkg_color_player_tyre_compound"])
-            )
-            self.bars_tcp = self.set_qlabel(
-                style=self.bar_style_tcp[0],
-                width=2 * font_m.width + bar_padx,
-                count=self.veh_range,
+                (self.wcfg["font_color_tyre_compound"],
+                 self.wcfg["bkg_color_tyre_compound"]),
+                (self.wcfg["font_color_player_tyre_compound"],
+                 self.wcfg["bkg_color_player_tyre_compound"])
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_tcp,
+            self.bars_tcp = self.table.add_column(
                 column_index=self.wcfg["column_index_tyre_compound"],
-                hide_start=1,
+                width=2 * font_m.width + bar_padx,
+                styles=self.bar_style_tcp,
             )
         # Pitstop count
         if self.wcfg["show_pitstop_count"]:
             self.bar_style_psc = (
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_pitstop_count"],
-                    bg_color=self.wcfg["bkg_color_pitstop_count"]),
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_player_pitstop_count"],
-                    bg_color=self.wcfg["bkg_color_player_pitstop_count"]),
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_pit_request"],
-                    bg_color=self.wcfg["bkg_color_pit_request"]),
-                self.set_qss(
-                    fg_color=self.wcfg["font_color_penalty_count"],
-                    bg_color=self.wcfg["bkg_color_penalty_count"])
-            )
-            self.bars_psc = self.set_qlabel(
-                style=self.bar_style_psc[0],
-                width=2 * font_m.width + bar_padx,
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_psc,
+                (self.wcfg["font_color_pitstop_count"],
+                 self.wcfg["bkg_color_pitstop_count"]),
+                (self.wcfg["font_color_player_pitstop_count"],
+                 self.wcfg["bkg_color_player_pitstop_count"]),
+                (self.wcfg["font_color_pit_request"],
+                 self.wcfg["bkg_color_pit_request"]),
+                (self.wcfg["font_color_penalty_count"],
+                 self.wcfg["bkg_color_penalty_count"])
+            )
+            self.bars_psc = self.table.add_column(
                 column_index=self.wcfg["column_index_pitstop_count"],
-                hide_start=1,
+                width=2 * font_m.width + bar_padx,
+                styles=self.bar_style_psc,
             )
 
+    def unload_resource(self):
+        """Unload resource on close"""
+        super().unload_resource()
+        if self.wcfg["show_brand_logo"]:
+            logo_cache.remove_size(self.brd_width, self.brd_height)
+
     def timerEvent(self, event):
         """Update when vehicle on track"""
         standings_list = minfo.relative.standings
@@ -448,6 +336,7 @@ class Realtime(Overlay):
             else:
                 self.row_visible[idx] = False
                 state = 2
+            self.table.set_row_state(idx, state)
 
             # Get vehicle dataset
             veh_info = minfo.vehicles.dataSet[std_idx]
@@ -532,9 +421,7 @@ class Realtime(Overlay):
         """Driver position"""
         if target.last != data:
             target.last = data
-            target.setText(f"{data[0]:02d}")
-            target.setStyleSheet(self.bar_style_pos[data[1]])
-            self.toggle_visibility(target, data[-1])
+            target.set_text(f"{data[0]:02d}", data[1])
 
     def update_pgl(self, target, *data):
         """Driver position change (gain/loss)"""
@@ -552,9 +439,7 @@ class Realtime(Overlay):
                 color_index = 0
             if data[1]:
                 color_index = 3
-            target.setText(text)
-            target.setStyleSheet(self.bar_style_pgl[color_index])
-            self.toggle_visibility(target, data[-1])
+            target.set_text(text, color_index)
 
     def update_drv(self, target, *data):
         """Driver name"""
@@ -570,9 +455,7 @@ class Realtime(Overlay):
                 text = text[:self.drv_width]
             else:
                 text = text[:self.drv_width].ljust(self.drv_width)
-            target.setText(text)
-            target.setStyleSheet(self.bar_style_drv[data[1]])
-            self.toggle_visibility(target, data[-1])
+            target.set_text(text, data[1])
 
     def update_veh(self, target, *data):
         """Vehicle name"""
@@ -588,33 +471,30 @@ class Realtime(Overlay):
                 text = text[:self.veh_width]
             else:
                 text = text[:self.veh_width].ljust(self.veh_width)
-            target.setText(text)
-            target.setStyleSheet(self.bar_style_veh[data[1]])
-            self.toggle_visibility(target, data[-1])
+            target.set_text(text, data[1])
 
     def update_brd(self, target, *data):
         """Brand logo"""
         if target.last != data:
+            brand_logo = self.set_brand_logo(self.cfg.user.brands.get(data[0], data[0]))
+            if brand_logo is None:  # clear last logo, retry on next update
+                target.set_pixmap(None, data[1])
+                return
             target.last = data
-            target.setPixmap(self.set_brand_logo(self.cfg.user.brands.get(data[0], data[0])))
-            target.setStyleSheet(self.bar_style_brd[data[1]])
-            self.toggle_visibility(target, data[-1])
+            target.set_pixmap(brand_logo, data[1])
 
     def update_gap(self, target, *data):
         """Time gap"""
         if target.last != data:
             target.last = data
-            target.setText(data[0][:self.gap_width].strip("."))
-            target.setStyleSheet(self.bar_style_gap[data[1]])
-            self.toggle_visibility(target, data[-1])
+            target.set_text(data[0][:self.gap_width].strip("."), data[1])
 
     def update_int(self, target, *data):
         """Time interval"""
         if target.last != data:
             target.last = data
-            target.setText(self.int_to_next(*data[0])[:self.int_width].strip("."))
-            target.setStyleSheet(self.bar_style_int[data[1]])
-            self.toggle_visibility(target, data[-1])
+            text = self.int_to_next(*data[0])[:self.int_width].strip(".")
+            target.set_text(text, data[1])
 
     def update_lpt(self, target, *data):
         """Vehicle laptime"""
@@ -624,17 +504,13 @@ class Realtime(Overlay):
                 color_index = 2 + data[2]
             else:
                 color_index = data[2]
-            target.setText(data[0])
-            target.setStyleSheet(self.bar_style_lpt[color_index])
-            self.toggle_visibility(target, data[-1])
+            target.set_text(data[0], color_index)
 
     def update_blp(self, target, *data):
         """Vehicle best laptime"""
         if target.last != data:
             target.last = data
-            target.setText(self.set_best_laptime(data[0]))
-            target.setStyleSheet(self.bar_style_blp[data[1]])
-            self.toggle_visibility(target, data[-1])
+            target.set_text(self.set_best_laptime(data[0]), data[1])
 
     def update_dlt(self, target, *data):
         """Vehicle delta laptime"""
@@ -656,43 +532,34 @@ class Realtime(Overlay):
                     color_index = 0
                 if is_player:
                     color_index = -1
-                bar_delta.setText(text)
-                bar_delta.setStyleSheet(self.bar_style_dlt_delta[color_index])
-            target.setStyleSheet(self.bar_style_dlt[is_player])
-            self.toggle_visibility_delta(target, data[-1])
+                bar_delta.set_text(text, color_index)
+            target.set_style(is_player)
 
     def update_pic(self, target, *data):
         """Position in class"""
         if target.last != data:
             target.last = data
-            target.setText(f"{data[0]:02d}")
-            target.setStyleSheet(self.bar_style_pic[data[1]])
-            self.toggle_visibility(target, data[-1])
+            target.set_text(f"{data[0]:02d}", data[1])
 
     def update_cls(self, target, *data):
         """Vehicle class"""
         if target.last != data:
             target.last = data
             text, bg_color = self.set_class_style(data[0])
-            target.setText(text[:self.cls_width])
-            target.setStyleSheet(f"color:{self.wcfg['font_color_class']};background:{bg_color};")
-            self.toggle_visibility(target, data[-1])
+            target.set_color(text[:self.cls_width], self.wcfg["font_color_class"], bg_color)
 
     def update_pit(self, target, *data):
         """Vehicle in pit"""
         if target.last != data:
             target.last = data
-            target.setText(self.pit_status_text[data[0]])
-            target.setStyleSheet(self.bar_style_pit[data[0]])
-            self.toggle_visibility(target, data[-1])
+            target.set_text(self.pit_status_text[data[0]], data[0])
 
     def update_tcp(self, target, *data):
         """Tyre compound index"""
         if target.last != data:
             target.last = data
-            target.setText(f"{select_compound_symbol(data[0])}{select_compound_symbol(data[1])}")
-            target.setStyleSheet(self.bar_style_tcp[data[2]])
-            self.toggle_visibility(target, data[-1])
+            text = f"{select_compound_symbol(data[0])}{select_compound_symbol(data[1])}"
+            target.set_text(text, data[2])
 
     def update_psc(self, target, *data):
         """Pitstop count"""
@@ -710,44 +577,17 @@ class Realtime(Overlay):
                 text = TEXT_PLACEHOLDER
             else:
                 text = f"{data[0]}"
-            target.setText(text)
-            target.setStyleSheet(self.bar_style_psc[color_index])
-            self.toggle_visibility(target, data[-1])
+            target.set_text(text, color_index)
 
     # Additional methods
-    def toggle_visibility(self, target, state):
-        """Hide bar if unavailable"""
-        if state == 0:
-            target.show()
-        elif state == 1 and self.show_class_separator:  # draw gap
-            target.clear()
-            target.setStyleSheet(self.bar_split_style)
-            target.show()
-        else:
-            target.hide()
-
-    def toggle_visibility_delta(self, target, state):
-        """Hide bar if unavailable"""
-        if state == 0:
-            target.show()
-        elif state == 1 and self.show_class_separator:  # draw gap
-            for _bar in target.bar_set:
-                _bar.clear()
-            target.setStyleSheet(self.bar_split_style)
-            target.show()
-        else:
-            target.hide()
-
     def set_brand_logo(self, brand_name: str):
-        """Set brand logo"""
-        if brand_name not in self.pixmap_brandlogo:  # load & cache logo
-            self.pixmap_brandlogo[brand_name] = load_brand_logo_file(
-                filepath=self.cfg.path.brand_logo,
-                filename=brand_name,
-                max_width=self.brd_width,
-                max_height=self.brd_height,
-            )
-        return self.pixmap_brandlogo[brand_name]
+        """Set brand logo from shared cache, returns None if loading in background"""
+        return logo_cache.get(
+            filepath=self.cfg.path.brand_logo,
+            brand_name=brand_name,
+            width=self.brd_width,
+            height=self.brd_height,
+        )
 
     def set_class_style(self, class_name: str):
         """Compare vehicle class name with user defined dictionary"""
@@ -803,22 +643,3 @@ class Realtime(Overlay):
         if isinstance(gap_behind, int):
             return f"{gap_behind:.0f}L"
         return f"{gap_behind:.{self.int_decimals}f}"
-
-    def set_delta_table(self, width: int, columns: int, bar_padx: int) -> QWidget:
-        """Set delta laptime table"""
-        bar_temp = QWidget(self)
-        layout = self.set_grid_layout()
-        layout.setContentsMargins(bar_padx, 0, bar_padx, 0)
-        bar_temp.setLayout(layout)
-        bar_temp.setStyleSheet(self.bar_style_dlt[0])
-        bar_temp.bar_set = self.set_qlabel(
-            fixed_width=width,
-            count=columns,
-        )
-        self.set_grid_layout_table_row(
-            layout=layout,
-            targets=bar_temp.bar_set,
-            right_to_left=self.wcfg["show_inverted_delta_laptime_layout"],
-        )
-        bar_temp.last = None
-        return bar_temp
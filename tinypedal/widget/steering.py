@@ -27,6 +27,7 @@ from .. import calculation as calc
 from ..api_control import api
 from ..module_info import minfo
 from ._base import Overlay
+from ._painter import FrameInterpolator
 
 
 class Realtime(Overlay):
@@ -76,6 +77,13 @@ class Realtime(Overlay):
 
         self.draw_scale_mark()
 
+        # Frame interpolation
+        if self.wcfg["enable_frame_interpolation"]:
+            self.frame_interp = FrameInterpolator(self, self.wcfg["frame_interpolation_interval"])
+            self.input_steering = self.frame_interp.add_input(self.update_steering, -1, 1)
+        else:
+            self.frame_interp = None
+
         # Last data
         self.raw_steering = 0
         self.rot_range = 0
@@ -102,11 +110,18 @@ class Realtime(Overlay):
 
         # Steering
         temp_raw_steering = api.read.inputs.steering_raw()
-        if self.raw_steering != temp_raw_steering:
-            self.raw_steering = temp_raw_steering
-            self.update()
+        if self.frame_interp:
+            self.frame_interp.add_sample(self.input_steering, temp_raw_steering)
+        else:
+            self.update_steering(temp_raw_steering)
 
     # GUI update methods
+    def update_steering(self, raw_steering):
+        """Steering update"""
+        if self.raw_steering != raw_steering:
+            self.raw_steering = raw_steering
+            self.update()
+
     def paintEvent(self, event):
         """Draw"""
         painter = QPainter(self)
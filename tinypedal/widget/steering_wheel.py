@@ -82,7 +82,7 @@ class Realtime(Overlay):
         )
 
         # Config canvas
-        self.resize(area_size, area_size)
+        self.canvas = self.set_canvas(area_size, area_size)
 
         self.pen_rotation = QPen()
         self.pen_rotation.setCapStyle(Qt.FlatCap)
@@ -110,12 +110,11 @@ class Realtime(Overlay):
         temp_steering_angle = api.read.inputs.steering_raw() * temp_rot_range * 0.5
         if self.steering_angle != temp_steering_angle:
             self.steering_angle = temp_steering_angle
-            self.update()
+            self.canvas.update()
 
     # GUI update methods
-    def paintEvent(self, event):
+    def draw_canvas(self, painter):
         """Draw"""
-        painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing, True)
         painter.setRenderHint(QPainter.SmoothPixmapTransform, True)
         # Draw background
@@ -121,7 +121,7 @@ class Realtime(Overlay):
             )
             self.bar_last = self.set_qlabel(
                 text=text_last,
-                style=self.bar_style_last[1],
+                palette_style=self.bar_style_last[1],
                 width=font_m.width * len(text_last) + bar_padx,
             )
             self.set_primary_orient(
@@ -282,7 +282,7 @@ class Realtime(Overlay):
         if target.last != data:
             target.last = data
             if verify:
-                target.setStyleSheet(self.bar_style_last[data > 0])
+                self.set_style_palette(target, self.bar_style_last[data > 0])
                 data = abs(data)
             if 0 < data < MAX_SECONDS:
                 text = f"{prefix}{calc.sec2laptime(data)[:8]: >8}"
@@ -20,6 +20,8 @@
 Track map Widget
 """
 
+from math import ceil, cos, sin
+
 from PySide2.QtCore import QRectF, Qt
 from PySide2.QtGui import QBrush, QPainter, QPainterPath, QPen, QPixmap
 
@@ -54,12 +56,18 @@ class Realtime(Overlay):
         self.veh_shape = QRectF(-veh_size * 0.5, -veh_size * 0.5, veh_size, veh_size)
         self.veh_text_shape = self.veh_shape.adjusted(0, font_offset, 0, 0)
 
+        # Vehicle sprite size, include outline & text overflow
+        outline_width = max(self.wcfg["vehicle_outline_width"], self.wcfg["vehicle_outline_player_width"], 0)
+        self.sprite_size = ceil(max(veh_size + outline_width, font_m.width * 3)) + 2
+        self.sprite_offset = self.sprite_size // 2
+        self.pixmap_sprites = {}
+
         # Config canvas
         self.area_size = max(self.wcfg["area_size"], 100)
         self.area_margin = min(max(self.wcfg["area_margin"], 0), int(self.area_size/4))
         self.temp_map_size = self.area_size - self.area_margin * 2
 
-        self.resize(self.area_size, self.area_size)
+        self.canvas = self.set_canvas(self.area_size, self.area_size)
         self.pixmap_map = QPixmap(self.area_size, self.area_size)
 
         self.pen_veh = self.set_veh_pen_style("vehicle_outline"), self.set_veh_pen_style("vehicle_outline_player")
@@ -88,6 +96,7 @@ class Realtime(Overlay):
         self.map_scale = 1
         self.map_offset = (0, 0)
         self.map_orient = 0  # radians
+        self.veh_transform = (1, 0, 0, 0)  # cos scale, sin scale, x offset, y offset
 
         self.update_map(-1)
 
@@ -101,7 +110,7 @@ class Realtime(Overlay):
         veh_data_version = minfo.vehicles.dataSetVersion
         if self.last_veh_data_version != veh_data_version:
             self.last_veh_data_version = veh_data_version
-            self.update()
+            self.canvas.update()
 
     # GUI update methods
     def update_map(self, data):
@@ -112,9 +121,8 @@ class Realtime(Overlay):
             map_path = self.create_map_path(raw_data)
             self.draw_map_image(map_path, self.circular_map)
 
-    def paintEvent(self, event):
+    def draw_canvas(self, painter):
         """Draw"""
-        painter = QPainter(self)
         painter.drawPixmap(0, 0, self.pixmap_map)
         painter.setRenderHint(QPainter.Antialiasing, True)
 
@@ -141,20 +149,26 @@ class Realtime(Overlay):
             angle = angle - angle // 360 * 360
             self.map_orient = calc.deg2rad(angle)
             (self.map_scaled, self.map_range, self.map_scale, self.map_offset
-             ) = calc.scale_map(raw_coords, self.area_size, self.area_margin, angle)
-
-            total_nodes = len(self.map_scaled) - 1
-            skip_node = calc.skip_map_nodes(total_nodes, self.temp_map_size * 3, self.display_detail_level)
-            last_skip = 0
-            for index, coords in enumerate(self.map_scaled):
-                if index == 0:
-                    map_path.moveTo(*coords)
-                elif index >= total_nodes:  # don't skip last node
-                    map_path.lineTo(*coords)
-                elif last_skip >= skip_node:
-                    map_path.lineTo(*coords)
-                    last_skip = 0
-                last_skip += 1
+             ) = calc.scale_map(
+                raw_coords, self.area_size, self.area_margin, angle,
+                minfo.mapping.coordinatesRange)
+            # Position = rotated coords * scale - (min_range * scale - offset) - sprite offset
+            self.veh_transform = (
+                cos(self.map_orient) * self.map_scale,
+                sin(self.map_orient) * self.map_scale,
+                self.map_range[0] * self.map_scale - self.map_offset[0] + self.sprite_offset,
+                self.map_range[2] * self.map_scale - self.map_offset[1] + self.sprite_offset,
+            )
+
+            # Select cached LOD nodes, tolerance in pixels converted to map unit
+            lod_nodes = calc.select_display_lod_nodes(
+                minfo.mapping.coordinatesLod, self.display_detail_level, self.map_scale)
+            if lod_nodes is None or lod_nodes[-1] >= len(self.map_scaled):
+                lod_nodes = range(len(self.map_scaled))
+            map_scaled = self.map_scaled
+            map_path.moveTo(*map_scaled[lod_nodes[0]])
+            for index in lod_nodes[1:]:
+                map_path.lineTo(*map_scaled[index])
 
             # Close map loop if start & end distance less than 500 meters
             if dist < 500:
@@ -257,46 +271,61 @@ class Realtime(Overlay):
     def draw_vehicle(self, painter, map_data, veh_info, veh_draw_order):
         """Draw vehicles"""
         if map_data:
-            # Position = coords * scale - (min_range * scale - offset)
-            x_offset = self.map_range[0] * self.map_scale - self.map_offset[0]  # min range x, offset x
-            y_offset = self.map_range[2] * self.map_scale - self.map_offset[1]  # min range y, offset y
-        else:
-            offset = self.area_size * 0.5
-
+            positions = transform_vehicle_position(self.veh_transform, veh_info, veh_draw_order)
+        else:  # vehicles on temp map
+            positions = self.temp_vehicle_position(veh_info, veh_draw_order)
+        vehicle_sprite = self.vehicle_sprite
+        for index, pos_x, pos_y in positions:
+            painter.drawPixmap(pos_x, pos_y, vehicle_sprite(veh_info[index]))
+
+    def temp_vehicle_position(self, veh_info, veh_draw_order):
+        """Vehicle sprite position on temp map"""
+        offset = self.area_size * 0.5 - self.sprite_offset
         for index in veh_draw_order:
             data = veh_info[index]
-            is_player = data.isPlayer
-            if map_data:
-                if self.map_orient:
-                    rot_x, rot_y = calc.rotate_coordinate(self.map_orient, data.worldPositionX, data.worldPositionY)
-                    pos_x = rot_x * self.map_scale - x_offset
-                    pos_y = rot_y * self.map_scale - y_offset
-                else:
-                    pos_x = data.worldPositionX * self.map_scale - x_offset
-                    pos_y = data.worldPositionY * self.map_scale - y_offset
-                painter.translate(pos_x, pos_y)
-            else:  # vehicles on temp map
-                inpit_offset = self.wcfg["font_size"] * data.inPit
-                pos_x, pos_y = calc.rotate_coordinate(
-                    6.2831853 * data.lapProgress,
-                    self.temp_map_size / -2 + inpit_offset,  # x pos
-                    0,  # y pos
-                )
-                painter.translate(offset + pos_x, offset + pos_y)
-
-            painter.setPen(self.pen_veh[is_player])
-            painter.setBrush(self.color_vehicle(data))
-            painter.drawEllipse(self.veh_shape)
-
-            # Draw text standings
-            if self.wcfg["show_vehicle_standings"]:
-                if self.show_position_in_class:
-                    place_veh = data.positionInClass
-                else:
-                    place_veh = data.positionOverall
-                painter.setPen(self.pen_text[is_player])
-                painter.drawText(self.veh_text_shape, Qt.AlignCenter, f"{place_veh}")
-            painter.resetTransform()
+            inpit_offset = self.wcfg["font_size"] * data.inPit
+            pos_x, pos_y = calc.rotate_coordinate(
+                6.2831853 * data.lapProgress,
+                self.temp_map_size / -2 + inpit_offset,  # x pos
+                0,  # y pos
+            )
+            yield index, round(offset + pos_x), round(offset + pos_y)
+
+    def vehicle_sprite(self, data) -> QPixmap:
+        """Get vehicle sprite from cache, draw new sprite if not exist"""
+        brush = self.color_vehicle(data)
+        is_player = data.isPlayer
+        if not self.wcfg["show_vehicle_standings"]:
+            text = ""
+        elif self.show_position_in_class:
+            text = f"{data.positionInClass}"
+        else:
+            text = f"{data.positionOverall}"
+        # Brushes are cached, brush id is unique
+        sprite_key = (id(brush), is_player, text)
+        sprite = self.pixmap_sprites.get(sprite_key)
+        if sprite is None:
+            if len(self.pixmap_sprites) > 1000:
+                self.pixmap_sprites.clear()
+            sprite = self.pixmap_sprites[sprite_key] = self.draw_vehicle_sprite(brush, is_player, text)
+        return sprite
+
+    def draw_vehicle_sprite(self, brush, is_player, text) -> QPixmap:
+        """Draw vehicle sprite"""
+        sprite = QPixmap(self.sprite_size, self.sprite_size)
+        sprite.fill(Qt.transparent)
+        painter = QPainter(sprite)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.setFont(self.font())
+        painter.translate(self.sprite_offset, self.sprite_offset)
+        painter.setPen(self.pen_veh[is_player])
+        painter.setBrush(brush)
+        painter.drawEllipse(self.veh_shape)
+        # Draw text standings
+        if text:
+            painter.setPen(self.pen_text[is_player])
+            painter.drawText(self.veh_text_shape, Qt.AlignCenter, text)
+        return sprite
 
     def draw_pitout_prediction(self, painter, map_data, plr_veh_info):
         """Draw pitout prediction circles"""
@@ -426,6 +455,17 @@ class Realtime(Overlay):
         }
 
 
+def transform_vehicle_position(transform: tuple, veh_info, veh_draw_order) -> list:
+    """Transform all vehicle world position to sprite position in a single pass"""
+    cos_scale, sin_scale, x_offset, y_offset = transform
+    return [
+        (index,
+         round(data.worldPositionX * cos_scale - data.worldPositionY * sin_scale - x_offset),
+         round(data.worldPositionY * cos_scale + data.worldPositionX * sin_scale - y_offset))
+        for index, data in zip(veh_draw_order, map(veh_info.__getitem__, veh_draw_order))
+    ]
+
+
 def target_pitstop_duration(pit_timer: float, min_pit_time: float, pit_time_increment: float) -> float:
     """Target pitstop duration = min pit duration + pit duration increment * number of increments"""
     overflow_increments = max(pit_timer - min_pit_time + pit_time_increment, 0) // pit_time_increment
@@ -89,7 +89,7 @@ class Realtime(Overlay):
         layout_ctemp = self.set_grid_layout(gap=inner_gap)
         self.bars_ctemp = self.set_qlabel(
             text=TEXT_NA,
-            style=bar_style_ctemp,
+            palette_style=bar_style_ctemp,
             width=font_m.width * text_width + bar_padx,
             count=4,
             last=0,
@@ -141,7 +141,7 @@ class Realtime(Overlay):
             )
             self.bars_rdiff = self.set_qlabel(
                 text=TEXT_NA,
-                style=self.bar_style_rtemp[2],
+                palette_style=self.bar_style_rtemp[2],
                 width=font_m.width * text_width + bar_padx,
                 count=4,
                 last=0,
@@ -216,14 +216,14 @@ class Realtime(Overlay):
                 target.setText(TEXT_PLACEHOLDER)
             else:
                 target.setText(f"{self.unit_temp(data):0{self.leading_zero}f}{self.sign_text}")
-            target.setStyleSheet(calc.select_grade(self.heatmap_styles[index], data))
+            self.set_style_palette(target, calc.select_grade(self.heatmap_styles[index], data))
 
     def update_rdiff(self, target, data):
         """Rate of change"""
         if target.last != data:
             target.last = data
             target.setText(f"{self.unit_temp(data):.1f}"[:3].strip("."))
-            target.setStyleSheet(self.bar_style_rtemp[data > 0])
+            self.set_style_palette(target, self.bar_style_rtemp[data > 0])
 
     def update_tcmpd(self, target, data, index):
         """Tyre compound"""
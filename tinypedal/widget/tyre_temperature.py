@@ -135,7 +135,7 @@ class Realtime(Overlay):
                 target.setText(TEXT_PLACEHOLDER)
             else:
                 target.setText(f"{self.unit_temp(data):0{self.leading_zero}f}{self.sign_text}")
-            target.setStyleSheet(calc.select_grade(self.heatmap_styles[index], data))
+            self.set_style_palette(target, calc.select_grade(self.heatmap_styles[index], data))
 
     def update_tcmpd(self, target, data, index):
         """Tyre compound"""
@@ -161,7 +161,7 @@ class Realtime(Overlay):
             layout_inner = tuple(self.set_grid_layout(gap=inner_gap) for _ in range(4))
             bar_set = self.set_qlabel(
                 text=text,
-                style=style,
+                palette_style=style,
                 width=width,
                 count=12,  # 3 x 4 tyres
                 last=0,
@@ -172,7 +172,7 @@ class Realtime(Overlay):
         else:
             bar_set = self.set_qlabel(
                 text=text,
-                style=style,
+                palette_style=style,
                 width=width,
                 count=4,
                 last=0,
@@ -68,7 +68,7 @@ class Realtime(Overlay):
             )
             self.bars_remain = self.set_qlabel(
                 text=TEXT_NA,
-                style=self.bar_style_remain[0],
+                palette_style=self.bar_style_remain[0],
                 width=bar_width,
                 count=4,
                 last=0,
@@ -102,7 +102,7 @@ class Realtime(Overlay):
             )
             self.bars_diff = self.set_qlabel(
                 text=TEXT_NA,
-                style=self.bar_style_diff[0],
+                palette_style=self.bar_style_diff[0],
                 width=bar_width,
                 count=4,
             )
@@ -135,7 +135,7 @@ class Realtime(Overlay):
             )
             self.bars_laps = self.set_qlabel(
                 text=TEXT_NA,
-                style=self.bar_style_laps[0],
+                palette_style=self.bar_style_laps[0],
                 width=bar_width,
                 count=4,
             )
@@ -168,7 +168,7 @@ class Realtime(Overlay):
             )
             self.bars_mins = self.set_qlabel(
                 text=TEXT_NA,
-                style=self.bar_style_mins[0],
+                palette_style=self.bar_style_mins[0],
                 width=bar_width,
                 count=4,
             )
@@ -201,7 +201,7 @@ class Realtime(Overlay):
             )
             self.bars_end = self.set_qlabel(
                 text=TEXT_NA,
-                style=self.bar_style_end[0],
+                palette_style=self.bar_style_end[0],
                 width=bar_width,
                 count=4,
             )
@@ -263,8 +263,8 @@ class Realtime(Overlay):
         if target.last != data:
             target.last = data
             target.setText(self.format_num(data))
-            target.setStyleSheet(
-                self.bar_style_remain[data <= self.wcfg["warning_threshold_remaining"]]
+            self.set_style_palette(
+                target, self.bar_style_remain[data <= self.wcfg["warning_threshold_remaining"]]
             )
 
     def update_diff(self, target, data):
@@ -272,8 +272,8 @@ class Realtime(Overlay):
         if target.last != data:
             target.last = data
             target.setText(self.format_num(data))
-            target.setStyleSheet(
-                self.bar_style_diff[data > self.wcfg["warning_threshold_wear"]]
+            self.set_style_palette(
+                target, self.bar_style_diff[data > self.wcfg["warning_threshold_wear"]]
             )
 
     def update_laps(self, target, data):
@@ -281,8 +281,8 @@ class Realtime(Overlay):
         if target.last != data:
             target.last = data
             target.setText(self.format_num(data))
-            target.setStyleSheet(
-                self.bar_style_laps[data <= self.wcfg["warning_threshold_laps"]]
+            self.set_style_palette(
+                target, self.bar_style_laps[data <= self.wcfg["warning_threshold_laps"]]
             )
 
     def update_mins(self, target, data):
@@ -290,8 +290,8 @@ class Realtime(Overlay):
         if target.last != data:
             target.last = data
             target.setText(self.format_num(data))
-            target.setStyleSheet(
-                self.bar_style_mins[data <= self.wcfg["warning_threshold_minutes"]]
+            self.set_style_palette(
+                target, self.bar_style_mins[data <= self.wcfg["warning_threshold_minutes"]]
             )
 
     def update_end(self, target, data):
@@ -299,8 +299,8 @@ class Realtime(Overlay):
         if target.last != data:
             target.last = data
             target.setText(self.format_num(data))
-            target.setStyleSheet(
-                self.bar_style_end[data <= self.wcfg["warning_threshold_remaining"]]
+            self.set_style_palette(
+                target, self.bar_style_end[data <= self.wcfg["warning_threshold_remaining"]]
             )
 
     # Additional methods
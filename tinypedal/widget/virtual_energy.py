@@ -129,7 +129,7 @@ class Realtime(Overlay):
         )
         self.bar_curr = self.set_qlabel(
             text=text_def,
-            style=self.bar_style_curr[0],
+            palette_style=self.bar_style_curr[0],
             fixed_width=style_width,
         )
         self.bar_curr.decimals = max(self.wcfg["decimal_places_remain"], 0)
@@ -145,7 +145,7 @@ class Realtime(Overlay):
         )
         self.bar_need = self.set_qlabel(
             text=text_def,
-            style=self.bar_style_need[0],
+            palette_style=self.bar_style_need[0],
             fixed_width=style_width,
         )
         self.bar_need.decimals = max(self.wcfg["decimal_places_refill"], 0)
@@ -383,4 +383,4 @@ class Realtime(Overlay):
             text = f"{data:{sign}.{target.decimals}f}"[:self.bar_width].strip(".")
             target.setText(text)
             if color:  # low energy warning
-                target.setStyleSheet(color)
+                self.set_style_palette(target, color)
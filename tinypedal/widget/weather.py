@@ -97,7 +97,7 @@ class Realtime(Overlay):
             )
             self.bar_temp_trend = self.set_qlabel(
                 text=TEXT_TREND_SIGN[0],
-                style=self.bar_style_temp_trend[0],
+                palette_style=self.bar_style_temp_trend[0],
                 width=font_m.width + bar_padx,
                 last=0,
             )
@@ -138,7 +138,7 @@ class Realtime(Overlay):
             )
             self.bar_raininess_trend = self.set_qlabel(
                 text=TEXT_TREND_SIGN[0],
-                style=self.bar_style_raininess_trend[0],
+                palette_style=self.bar_style_raininess_trend[0],
                 width=font_m.width + bar_padx,
                 last=0,
             )
@@ -179,7 +179,7 @@ class Realtime(Overlay):
             )
             self.bar_wetness_trend = self.set_qlabel(
                 text=TEXT_TREND_SIGN[0],
-                style=self.bar_style_wetness_trend[0],
+                palette_style=self.bar_style_wetness_trend[0],
                 width=font_m.width + bar_padx,
                 last=0,
             )
@@ -244,7 +244,7 @@ class Realtime(Overlay):
         if target.last != data:
             target.last = data
             target.setText(TEXT_TREND_SIGN[data])
-            target.setStyleSheet(self.bar_style_temp_trend[data])
+            self.set_style_palette(target, self.bar_style_temp_trend[data])
 
     def update_raininess(self, target, data):
         """Rain percentage"""
@@ -258,7 +258,7 @@ class Realtime(Overlay):
         if target.last != data:
             target.last = data
             target.setText(TEXT_TREND_SIGN[data])
-            target.setStyleSheet(self.bar_style_raininess_trend[data])
+            self.set_style_palette(target, self.bar_style_raininess_trend[data])
 
     def update_wetness(self, target, data, wet_average):
         """Surface wetness percentage"""
@@ -272,7 +272,7 @@ class Realtime(Overlay):
         if target.last != data:
             target.last = data
             target.setText(TEXT_TREND_SIGN[data])
-            target.setStyleSheet(self.bar_style_wetness_trend[data])
+            self.set_style_palette(target, self.bar_style_wetness_trend[data])
 
 
 class TrendTimer: